@@ -10,6 +10,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from opensection import RectangularSection, ConcreteEC2, SteelEC2, RebarGroup, SectionSolver
 from opensection.eurocodes import EC2Verification
+from opensection.interaction import InteractionDiagram
+from opensection.interaction.capacity import axial_resistance
 
 
 def column_design_example():
@@ -39,8 +41,7 @@ def column_design_example():
     concrete = ConcreteEC2(fck=30)  # C30/37
     steel = SteelEC2(fyk=500)       # B500B
 
-    print("
-Matériaux :")
+    print("\nMatériaux :")
     print(f"  Béton {concrete.fck} MPa (fcd = {concrete.fcd:.2f} MPa)")
     print(f"  Acier {steel.fyk} MPa (fyd = {steel.fyd:.2f} MPa)")
 
@@ -68,24 +69,21 @@ Matériaux :")
         z = r * np.sin(angle)
         rebars.add_rebar(y=y, z=z, diameter=dia_long, n=1)
 
-    print("
-Armatures :")
+    print("\nArmatures :")
     print(f"  Armatures longitudinales : {n_long}Ø{dia_long*1000:.0f} = {rebars.total_area*1e4:.1f} cm²")
     print(f"  Enrobage : {cover*1000:.0f} mm")
 
     # Création du solveur
     solver = SectionSolver(section, concrete, steel, rebars)
 
-    print("
-Analyse :")
+    print("\nAnalyse :")
     print(f"  Fibres béton : {len(solver.fibers)}")
     print(f"  Points d'armature : {len(solver.rebar_array)}")
 
     # Résolution pour les sollicitations
     result = solver.solve(N=N_Ed, My=0, Mz=M_Ed)
 
-    print("
-Résultats :")
+    print("\nRésultats :")
     print(f"  Convergence : {'OUI' if result.converged else 'NON'}")
     print(f"  Itérations : {result.n_iter}")
     print(f"  ε₀ = {result.epsilon_0*1000:.2f} ‰")
@@ -97,8 +95,7 @@ Résultats :")
     # Vérifications EC2
     checks = EC2Verification.check_ULS(result, concrete.fcd, steel.fyd)
 
-    print("
-Vérifications ELU :")
+    print("\nVérifications ELU :")
     concrete_check = checks['concrete_stress']
     steel_check = checks['steel_stress']
 
@@ -111,8 +108,7 @@ Vérifications ELU :")
     i_min = np.sqrt(I_min / (b * h))  # Rayon de giration
     lambda_col = L_col / i_min
 
-    print("
-Stabilité :")
+    print("\nStabilité :")
     print(f"  Inertie I_min = {I_min*1e6:.0f} cm⁴")
     print(f"  Rayon de giration i_min = {i_min*1000:.1f} mm")
     print(f"  Élancement λ = {lambda_col:.1f}")
@@ -125,7 +121,7 @@ Stabilité :")
     return result, checks
 
 
-def column_interaction_diagram():
+def column_interaction_diagram(N_Ed=1500, M_Ed=75.0):
     """Tracé du diagramme d'interaction N-M pour le poteau"""
 
     print("\n" + "=" * 60)
@@ -142,42 +138,31 @@ def column_interaction_diagram():
     r = (min(b, h) - 2*cover - dia_long) / 2
 
     rebars = RebarGroup()
-    for i in range(8):
-        angle = 2 * np.pi * i / 8
-        y = r * np.cos(angle)
-        z = r * np.sin(angle)
-        rebars.add_rebar(y=y, z=z, diameter=dia_long, n=1)
+    rebars.add_circular_array(0.0, 0.0, radius=r, n=8, diameter=dia_long)
 
     solver = SectionSolver(section, concrete, steel, rebars)
+    diagram = InteractionDiagram(solver)
 
-    # Points du diagramme d'interaction
-    # Pour différents niveaux de moment, trouver N maximal
-    M_values = np.linspace(0, 200, 20)  # kN·m
-    N_max_values = []
-
-    for M in M_values:
-        # Recherche dichotomique du N maximal pour ce M
-        N_min, N_max = 0, 2000  # kN
-
-        for _ in range(15):  # 15 itérations pour précision ~1kN
-            N_test = (N_min + N_max) / 2
-            result = solver.solve(N=N_test, My=0, Mz=M)
-
-            if result.converged and result.sigma_c_max <= concrete.fcd * 1.01:  # Marge 1%
-                N_min = N_test
-            else:
-                N_max = N_test
+    # Moment résistant M_Rd pour chaque niveau d'effort normal : une
+    # recherche de racine sur les plans ultimes (pivots A, B, C), sans
+    # résolution de Newton
+    _, F_compression = axial_resistance(diagram.domains)
+    N_pure_comp = F_compression[0]  # Résistance en compression pure (M=0)
 
-        N_max_values.append(N_min)
+    N_values = np.linspace(0, N_pure_comp, 21)  # kN
+    capacities = [diagram.capacity(N) for N in N_values]
+    M_Rd_values = [c.Mz for c in capacities]
+    n_evaluations = sum(c.n_evaluations for c in capacities)
 
-    # Résistance pure en compression (M=0)
-    result_comp = solver.solve(N=2000, My=0, Mz=0)
-    N_pure_comp = result_comp.N if result_comp.converged else 0
+    # Vérification de la charge de calcul
+    M_Rd = diagram.capacity(N_Ed).Mz
+    print(f"M_Rd(N_Ed = {N_Ed} kN) = {M_Rd:.1f} kN·m  (M_Ed = {M_Ed:.1f} kN·m)")
+    print(f"Évaluations des efforts : {n_evaluations} pour {len(N_values)} niveaux de N")
 
     # Tracé du diagramme
     plt.figure(figsize=(10, 6))
 
-    plt.plot(M_values, N_max_values, 'b-', linewidth=3, label='Capacité portante')
+    plt.plot(M_Rd_values, N_values, 'b-', linewidth=3, label='Capacité portante')
     plt.axhline(y=N_pure_comp, color='r', linestyle='--',
                label=f'Compression pure: {N_pure_comp:.0f} kN')
     plt.axvline(x=M_Ed, color='g', linestyle='--',
@@ -190,19 +175,19 @@ def column_interaction_diagram():
     plt.title('Diagramme d\'interaction N-M - Poteau 400×400mm')
     plt.legend()
     plt.grid(True, alpha=0.3)
-    plt.axis([0, max(M_values), 0, max(N_max_values)*1.1])
+    plt.axis([0, max(M_Rd_values)*1.1, 0, N_pure_comp*1.1])
 
     plt.tight_layout()
     plt.savefig('column_interaction_diagram.png', dpi=150, bbox_inches='tight')
     plt.show()
 
     print(f"\nRésistance en compression pure : {N_pure_comp:.0f} kN")
-    print(f"Réduction due au moment : {(N_pure_comp - max(N_max_values))/N_pure_comp*100:.1f}%")
+    print(f"Moment résistant maximal : {max(M_Rd_values):.1f} kN·m")
 
 
 if __name__ == "__main__":
     result, checks = column_design_example()
-    column_interaction_diagram()
+    column_interaction_diagram(N_Ed=1500, M_Ed=1500 * 0.05)
 
     print("\n" + "=" * 60)
     print("RÉSUMÉ")
@@ -210,5 +195,5 @@ if __name__ == "__main__":
     print("✓ Poteau dimensionné selon EC2")
     print("✓ Vérifications ELU et stabilité")
     print("✓ Diagramme d'interaction N-M tracé")
-    print("✓ Méthode de recherche dichotomique pour capacité maximale")
+    print("✓ Moment résistant M_Rd(N) par recherche de racine sur les plans ultimes")
     print("\nRéférence : Guide pratique EC2 - Dimensionnement des poteaux")
@@ -56,23 +56,12 @@ def example_rectangular_section_interaction():
 
     print("\nCalcul des points de la courbe d'interaction...")
 
-    # Calculer plusieurs points de la courbe N-M
-    N_values = np.linspace(0, 3000, 20)  # kN
-    M_capacity = []
-    N_capacity = []
+    # Courbe N-M par domaines de déformation ultimes (pivots A, B, C),
+    # évaluée en un seul appel vectorisé
+    M_capacity, N_capacity = diagram.compute_NM_curve(n_points=60)
 
-    for N in N_values:
-        # Recherche du moment résistant pour cet effort normal
-        for M_trial in np.linspace(250, 50, 15):
-            try:
-                result = solver.solve(N=N, My=0, Mz=M_trial, tol=1e-2)
-                if result.converged:
-                    M_capacity.append(result.Mz)
-                    N_capacity.append(result.N)
-                    print(f"  N = {result.N:6.1f} kN, M = {result.Mz:6.1f} kN·m [iter={result.n_iter}]")
-                    break
-            except Exception:
-                continue
+    for M, N in zip(M_capacity[::6], N_capacity[::6]):
+        print(f"  N = {N:7.1f} kN, M = {M:6.1f} kN·m")
 
     print(f"\n{len(M_capacity)} points calculés sur la courbe d'interaction")
 
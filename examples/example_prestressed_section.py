@@ -8,7 +8,9 @@ Référence : CEB-FIP Model Code 1990, exemples de précontrainte
 """
 import numpy as np
 import matplotlib.pyplot as plt
-from opensection import RectangularSection, ConcreteEC2, PrestressingSteelEC2, RebarGroup, SectionSolver
+from opensection import (
+    RectangularSection, ConcreteEC2, SteelEC2, PrestressingSteelEC2, RebarGroup, SectionSolver
+)
 
 
 def prestressed_beam_example():
@@ -32,8 +34,7 @@ def prestressed_beam_example():
     # Torons Y1860S7 (1860 MPa, 7 fils)
     prestress_steel = PrestressingSteelEC2(fp01k=1500)  # fp0.1k = 1500 MPa
 
-    print("
-Matériaux :")
+    print("\nMatériaux :")
     print(f"  Béton {concrete.fck} MPa (fcd = {concrete.fcd:.2f} MPa)")
     print(f"  Acier passif {steel_reinf.fyk} MPa (fyd = {steel_reinf.fyd:.2f} MPa)")
     print(f"  Précontrainte fp0.1k = {prestress_steel.fp01k} MPa")
@@ -47,15 +48,15 @@ Matériaux :")
     dia_strand = 0.015  # m
     Ap_strand = np.pi * (dia_strand/2)**2  # aire d'un toron
 
-    # Position des torons (au 1/3 de la hauteur)
-    y_strands = h/3  # position des torons
+    # Position des torons (au 1/3 de la hauteur, sous le centre de gravité ;
+    # la hauteur h est selon z)
+    z_strands = -h/2 + h/3
 
     # Précontrainte initiale
-    P0 = 0.8 * prestress_steel.fp01k * Ap_strand * n_strands  # kN (80% fp0.1k)
-    sigma_p0 = P0 / (Ap_strand * n_strands)  # MPa
+    P0 = 0.8 * prestress_steel.fp01k * Ap_strand * n_strands * 1000  # kN (80% fp0.1k)
+    sigma_p0 = P0 / 1000 / (Ap_strand * n_strands)  # MPa
 
-    print("
-Précontrainte :")
+    print("\nPrécontrainte :")
     print(f"  Torons : {n_strands}Ø{dia_strand*1000:.0f}mm")
     print(f"  Aire par toron : {Ap_strand*1e4:.1f} cm²")
     print(f"  Force initiale P₀ = {P0:.0f} kN")
@@ -70,8 +71,7 @@ Précontrainte :")
 
     P_final = P0 * (1 - perte_totale)
 
-    print("
-Pertes de précontrainte :")
+    print("\nPertes de précontrainte :")
     print(f"  Perte instantanée : {perte_instantanee*100:.0f}%")
     print(f"  Perte différée : {perte_differee*100:.0f}%")
     print(f"  Perte totale : {perte_totale*100:.1f}%")
@@ -83,51 +83,52 @@ Pertes de précontrainte :")
     As_min = rho_min * b * h
 
     rebars = RebarGroup()
-    # 2 armatures Ø12mm en partie tendue
-    rebars.add_rebar(y=-0.15, z=0.0, diameter=0.012, n=2)
+    # 2 armatures Ø12mm en partie tendue (fibre inférieure, -z)
+    rebars.add_rebar(y=0.0, z=-0.15, diameter=0.012, n=2)
 
-    print("
-Armatures passives :")
+    print("\nArmatures passives :")
     print(f"  Taux minimum ρ_min = {rho_min*100:.3f}%")
     print(f"  As_min = {As_min*1e4:.1f} cm²")
     print(f"  Armatures : 2Ø12mm = {rebars.total_area*1e4:.1f} cm²")
 
     # Analyse de la section sous précontrainte seule
-    print("
-Analyse précontrainte seule :")
+    print("\nAnalyse précontrainte seule :")
 
-    # Créer solveur sans armatures passives pour voir l'effet précontrainte
-    solver_prestress = SectionSolver(section, concrete, prestress_steel, RebarGroup())
+    # Torons : armatures de précontrainte avec prédéformation σp∞/Ep (après pertes).
+    # La précontrainte est un état interne : sous précontrainte seule, N = M = 0
+    # et le raccourcissement élastique du béton est pris en compte.
+    # Les torons ont leur propre acier ; les armatures passives gardent celui du solveur.
+    rebars.add_rebar(y=0.0, z=z_strands, diameter=dia_strand, n=n_strands,
+                     prestrain=P_final / 1000 / (Ap_strand * n_strands) / prestress_steel.Ep,
+                     material=prestress_steel)
 
-    # Simulation de la précontrainte
-    # Les torons sont modélisés comme des armatures avec contrainte initiale
-    # Dans la pratique, il faudrait un modèle plus sophistiqué avec pertes
+    solver_prestress = SectionSolver(section, concrete, steel_reinf, rebars)
 
-    # Pour simplifier, on applique directement la force de précontrainte
-    # comme un effort normal négatif (compression)
-    result_prestress = solver_prestress.solve(N=-P_final, My=0, Mz=0)
+    result_prestress = solver_prestress.solve(N=0, My=0, Mz=0)
 
     print("  Convergence : " + ("OUI" if result_prestress.converged else "NON"))
     print(f"  ε₀ = {result_prestress.epsilon_0*1000:.2f} ‰")
+    print(f"  χ_z = {result_prestress.chi_z*1000:.2f} ‰/m (contre-flèche)")
     print(f"  σ_c,max = {result_prestress.sigma_c_max:.2f} MPa")
+    print(f"  σ_p = {result_prestress.sigma_s_max:.0f} MPa")
 
     # Analyse avec charges de service
-    print("
-Analyse charges de service :")
+    print("\nAnalyse charges de service :")
 
-    # Charges de service : q_serv = 15 kN/m sur portée 8m
-    # Moment de service : M_serv = q_serv * L²/8 = 15*8²/8 = 120 kN·m
-    M_serv = 120  # kN·m
+    # Charges de service : q_serv = 10 kN/m sur portée 8m (120 kN·m, soit 15 kN/m,
+    # atteint le moment résistant de la section avec la précontrainte finale)
+    # Moment de service : M_serv = q_serv * L²/8 = 10*8²/8 = 80 kN·m
+    M_serv = 80  # kN·m
 
     # Effort normal dû aux charges permanentes (estimation)
     N_perm = 50   # kN (poids propre + finitions)
 
-    # Combinaison quasi-permanente : précontrainte + charges perm
-    result_service = solver_prestress.solve(N=-P_final + N_perm, My=0, Mz=M_serv)
+    # Combinaison quasi-permanente : charges extérieures seules (la précontrainte
+    # est dans les torons) ; moment positif : fibre supérieure (+z) comprimée
+    result_service = solver_prestress.solve(N=N_perm, My=M_serv, Mz=0)
 
     print(f"  Moment de service M = {M_serv} kN·m")
     print(f"  Effort permanent N_perm = {N_perm} kN")
-    print(f"  Effort total = -P∞ + N_perm = {-P_final + N_perm:.0f} kN")
     print("  Convergence : " + ("OUI" if result_service.converged else "NON"))
     print(f"  ε₀ = {result_service.epsilon_0*1000:.2f} ‰")
     print(f"  σ_c,max = {result_service.sigma_c_max:.2f} MPa")
@@ -154,7 +155,7 @@ def prestress_loss_study():
     prestress_steel = PrestressingSteelEC2(fp01k=1500)
     dia_strand, n_strands = 0.015, 4
     Ap_strand = np.pi * (dia_strand/2)**2
-    P0 = 0.8 * prestress_steel.fp01k * Ap_strand * n_strands
+    P0 = 0.8 * prestress_steel.fp01k * Ap_strand * n_strands * 1000  # kN
 
     # Différents scénarios de pertes
     scenarios = {
@@ -168,10 +169,13 @@ def prestress_loss_study():
 
     for scenario, perte_totale in scenarios.items():
         P_final = P0 * (1 - perte_totale)
-        solver = SectionSolver(section, concrete, prestress_steel, RebarGroup())
+        tendons = RebarGroup()
+        tendons.add_rebar(y=0.0, z=-h/6, diameter=dia_strand, n=n_strands,
+                          prestrain=P_final / 1000 / (Ap_strand * n_strands) / prestress_steel.Ep)
+        solver = SectionSolver(section, concrete, prestress_steel, tendons)
 
         # Moment de service
-        result = solver.solve(N=-P_final, My=0, Mz=120)
+        result = solver.solve(N=0, My=80, Mz=0)
 
         if result.converged:
             results[scenario] = {
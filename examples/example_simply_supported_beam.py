@@ -8,7 +8,10 @@ Référence : Exemple classique des cours de béton armé
 """
 import numpy as np
 import matplotlib.pyplot as plt
-from opensection import RectangularSection, ConcreteEC2, SteelEC2, RebarGroup, SectionSolver
+from opensection import (
+    RectangularSection, ConcreteEC2, SteelEC2, RebarGroup, SectionSolver, MemberAnalysis,
+    MomentCurvatureAnalysis
+)
 from opensection.eurocodes import EC2Verification
 
 
@@ -46,7 +49,7 @@ def simply_supported_beam_design():
     print(f"  Béton {concrete.fck} MPa (fcd = {concrete.fcd:.2f} MPa)")
     print(f"  Acier {steel.fyk} MPa (fyd = {steel.fyd:.2f} MPa)")
 
-    # Section géométrique
+    # Section géométrique (hauteur h selon z)
     section = RectangularSection(width=b, height=h)
 
     # Armatures (dimensionnées pour résister à M_max)
@@ -57,20 +60,21 @@ def simply_supported_beam_design():
 
     # Calcul du bras de levier approximatif
     d = h - cover - dia/2  # hauteur utile ≈ 600 - 30 - 8 = 562mm
+    z_s = h/2 - cover - dia/2  # position des armatures depuis le centre
 
     # Aire d'acier nécessaire (formule simplifiée)
     # M = As * fyd * z ≈ As * fyd * 0.9*d
-    # As = M / (fyd * 0.9*d)
-    As_needed = M_max / (steel.fyd * 0.9 * d)
+    # As = M / (fyd * 0.9*d), M en MN·m et fyd en MPa
+    As_needed = M_max * 1e-3 / (steel.fyd * 0.9 * d)
 
     print(f"\nDimensionnement des armatures :")
     print(f"  Hauteur utile d = {d*1000:.0f} mm")
-    print(f"  Aire d'acier nécessaire = {As_needed*1e4:.0f} cm²")
+    print(f"  Aire d'acier nécessaire = {As_needed*1e4:.2f} cm²")
 
-    # Armatures choisies : 4Ø16 + 2Ø16 = 8.04 cm²
+    # Armatures choisies : 4Ø16 + 2Ø16 = 12.06 cm²
     rebars = RebarGroup()
-    rebars.add_rebar(y=d - cover, z=0.0, diameter=dia, n=4)  # Armatures tendues
-    rebars.add_rebar(y=-(d - cover), z=0.0, diameter=dia, n=2)  # Armatures comprimées
+    rebars.add_rebar(y=0.0, z=-z_s, diameter=dia, n=4)  # Armatures tendues (fibre inférieure)
+    rebars.add_rebar(y=0.0, z=z_s, diameter=dia, n=2)  # Armatures comprimées
 
     print(f"  Armatures choisies : 4Ø16 + 2Ø16 = {rebars.total_area*1e4:.1f} cm²")
 
@@ -81,23 +85,21 @@ def simply_supported_beam_design():
     print(f"  Fibres béton : {len(solver.fibers)}")
     print(f"  Points d'armature : {len(solver.rebar_array)}")
 
-    # Résolution pour le moment maximal
-    result = solver.solve(N=0, My=0, Mz=M_max)
+    # Résolution pour le moment maximal (côté +z comprimé : moment M_y)
+    result = solver.solve(N=0, My=M_max, Mz=0)
 
-    print("
-Résultats :")
+    print("\nRésultats :")
     print(f"  Convergence : {'OUI' if result.converged else 'NON'}")
     print(f"  Itérations : {result.n_iter}")
     print(f"  ε₀ = {result.epsilon_0*1000:.2f} ‰")
-    print(f"  χ_z = {result.chi_z:.2e} rad/m")
+    print(f"  χ_y = {result.chi_y:.2e} rad/m")
     print(f"  σ_c,max = {result.sigma_c_max:.2f} MPa")
     print(f"  σ_s,max = {result.sigma_s_max:.2f} MPa")
 
     # Vérifications EC2
     checks = EC2Verification.check_ULS(result, concrete.fcd, steel.fyd)
 
-    print("
-Vérifications ELU :")
+    print("\nVérifications ELU :")
     concrete_check = checks['concrete_stress']
     steel_check = checks['steel_stress']
 
@@ -108,8 +110,7 @@ Vérifications ELU :")
     rho = rebars.total_area / (b * h)
     rho_min = 0.26 * concrete.fck**0.5 / steel.fyk * 100  # % selon EC2
 
-    print("
-Taux d'armature :")
+    print("\nTaux d'armature :")
     print(f"  ρ = {rho*100:.2f}% (calculé)")
     print(f"  ρ_min = {rho_min:.2f}% (EC2)")
 
@@ -128,61 +129,89 @@ def beam_capacity_analysis():
     concrete = ConcreteEC2(fck=25)
     steel = SteelEC2(fyk=500)
 
+    # Hauteur h selon z : armatures tendues en fibre inférieure (-z)
     section = RectangularSection(width=b, height=h)
     cover, dia = 0.03, 0.016
-    d = h - cover - dia/2
+    z_s = h/2 - cover - dia/2
 
     rebars = RebarGroup()
-    rebars.add_rebar(y=d - cover, z=0.0, diameter=dia, n=4)
-    rebars.add_rebar(y=-(d - cover), z=0.0, diameter=dia, n=2)
+    rebars.add_rebar(y=0.0, z=-z_s, diameter=dia, n=4)
+    rebars.add_rebar(y=0.0, z=z_s, diameter=dia, n=2)
 
     solver = SectionSolver(section, concrete, steel, rebars)
 
-    # Recherche du moment de rupture par incrémentation
-    M_test = np.linspace(50, 200, 50)  # kN·m
-    moments = []
-    strains = []
-    stresses = []
-
-    for M in M_test:
-        result = solver.solve(N=0, My=0, Mz=M)
-        if result.converged:
-            moments.append(result.Mz)
-            strains.append(abs(result.epsilon_0))
-            stresses.append(result.sigma_c_max)
-
-            # Arrêt si béton écrasé (ε > ε_cu)
-            if abs(result.epsilon_0) > concrete.epsilon_cu2:
-                print(f"Rupture par écrasement du béton à M = {M:.1f} kN·m")
-                break
-
-    # Tracé de la courbe moment-déformation
+    # Courbe moment-courbure jusqu'à la courbure ultime (côté +z comprimé)
+    curve = MomentCurvatureAnalysis(solver).compute_to_failure(N=0, angle=np.pi / 2, n_points=50)
+    kappa = curve.curvature[curve.converged]
+    moments = curve.moment[curve.converged]
+    # Déformation de la fibre supérieure (la plus comprimée)
+    strains = (curve.epsilon_0[curve.converged] + kappa * h / 2) * 1000
+
+    # Tracé des courbes de comportement
     plt.figure(figsize=(12, 4))
 
     plt.subplot(1, 2, 1)
-    plt.plot(strains, moments, 'b-o', linewidth=2, markersize=4)
-    plt.xlabel('Déformation maximale |ε| (‰)')
+    plt.plot(kappa * 1000, moments, 'b-o', linewidth=2, markersize=4)
+    plt.xlabel('Courbure κ (mrad/m)')
     plt.ylabel('Moment M (kN·m)')
-    plt.title('Courbe Moment-Déformation')
+    plt.title('Courbe Moment-Courbure')
     plt.grid(True, alpha=0.3)
 
     plt.subplot(1, 2, 2)
-    plt.plot(moments, stresses, 'r-s', linewidth=2, markersize=4)
+    plt.plot(moments, strains, 'r-s', linewidth=2, markersize=4)
     plt.xlabel('Moment M (kN·m)')
-    plt.ylabel('Contrainte béton max σ_c (MPa)')
-    plt.title('Contrainte Béton vs Moment')
+    plt.ylabel('Déformation béton max ε_c (‰)')
+    plt.title('Déformation Béton vs Moment')
     plt.grid(True, alpha=0.3)
 
     plt.tight_layout()
     plt.savefig('beam_capacity_curve.png', dpi=150, bbox_inches='tight')
     plt.show()
 
-    print(f"\nMoment de rupture estimé : {max(moments):.1f} kN·m")
-    print(f"Capacité de la poutre : {max(moments):.1f} kN·m")
+    M_u = moments.max()
+    print(f"\nMoment de rupture : {M_u:.1f} kN·m (courbure ultime {kappa[-1]*1000:.1f} mrad/m)")
+    print(f"Capacité de la poutre : q_u = {8 * M_u / L**2:.1f} kN/m (q = {q} kN/m)")
+
+    return curve
+
+
+def beam_deflection_analysis():
+    """Flèches de la poutre le long de la portée (tables moment-courbure)"""
+
+    print("\n" + "=" * 60)
+    print("FLÈCHES DE LA POUTRE")
+    print("=" * 60)
+
+    b, h, L, q = 0.3, 0.6, 6.0, 25.0
+    concrete = ConcreteEC2(fck=25)
+    steel = SteelEC2(fyk=500)
+
+    # Hauteur h selon z : armatures tendues en fibre inférieure (-z)
+    section = RectangularSection(width=b, height=h)
+    cover, dia = 0.03, 0.016
+    z_s = h/2 - cover - dia/2
+
+    rebars = RebarGroup()
+    rebars.add_rebar(y=0.0, z=-z_s, diameter=dia, n=4)
+    rebars.add_rebar(y=0.0, z=z_s, diameter=dia, n=2)
+
+    solver = SectionSolver(section, concrete, steel, rebars)
+
+    # Moments positifs : côté +z comprimé (angle = π/2, moment M_y)
+    beam = MemberAnalysis(L, solver, n_stations=41, angle=np.pi / 2)
+    result = beam.deflections(lambda x: q * x * (L - x) / 2)
+
+    print(f"  Stations : {len(result.x)} ({beam.n_tables} table M-κ)")
+    print(f"  Moment max : {result.max_moment:.1f} kN·m")
+    print(f"  Flèche max : {result.max_deflection*1000:.1f} mm (L/{L/abs(result.max_deflection):.0f})")
+    print(f"  Rotation sur appui : {result.rotation[0]*1000:.2f} mrad")
+
+    return result
 
 
 if __name__ == "__main__":
     result, checks = simply_supported_beam_design()
+    beam_deflection_analysis()
     beam_capacity_analysis()
 
     print("\n" + "=" * 60)
@@ -17,6 +17,8 @@ Author: opensection Contributors
 License: MIT
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "opensection Contributors"
 __license__ = "MIT"
@@ -25,27 +27,34 @@ __license__ = "MIT"
 from opensection.eurocodes.verification import EC2Verification
 
 # Geometry
-from opensection.geometry.contour import Contour, Point
+from opensection.geometry.contour import Contour, FrozenContour, Point
 from opensection.geometry.properties import GeometricProperties
-from opensection.geometry.section import CircularSection, RectangularSection, Section, TSection
+from opensection.geometry.section import (
+    CircularSection,
+    FrozenSection,
+    RectangularSection,
+    Section,
+    TSection,
+)
 
 # Interaction diagrams
 from opensection.interaction.diagram import InteractionDiagram
+from opensection.interaction.surface import InteractionSurface
 
 # Materials
 from opensection.materials.concrete import ConcreteEC2
 from opensection.materials.steel import PrestressingSteelEC2, SteelEC2, StructuralSteelEC3
-from opensection.postprocess.report import ReportGenerator
-
-# Postprocessing
-from opensection.postprocess.visualization import SectionPlotter
 
 # Reinforcement
+from opensection.reinforcement.optimizer import RebarLayoutOptimizer
 from opensection.reinforcement.rebar import Rebar, RebarGroup
 from opensection.solver.api import validate_and_solve
+from opensection.solver.cache import SolverStateCache
+from opensection.solver.member import MemberAnalysis
+from opensection.solver.moment_curvature import MomentCurvatureAnalysis
 
 # Solver
-from opensection.solver.section_solver import SectionSolver, SolverResult
+from opensection.solver.section_solver import BatchSolverResult, SectionSolver, SolverResult
 
 __all__ = [
     # Version
@@ -55,7 +64,9 @@ __all__ = [
     # Geometry
     "Point",
     "Contour",
+    "FrozenContour",
     "Section",
+    "FrozenSection",
     "RectangularSection",
     "CircularSection",
     "TSection",
@@ -68,15 +79,40 @@ __all__ = [
     # Reinforcement
     "Rebar",
     "RebarGroup",
+    "RebarLayoutOptimizer",
     # Solver
     "SectionSolver",
     "SolverResult",
+    "BatchSolverResult",
+    "SolverStateCache",
+    "MomentCurvatureAnalysis",
+    "MemberAnalysis",
     "validate_and_solve",
     # Eurocodes
     "EC2Verification",
     # Interaction
     "InteractionDiagram",
+    "InteractionSurface",
     # Postprocessing
     "SectionPlotter",
     "ReportGenerator",
 ]
+
+# Loaded on first access (PEP 562): the plotting module imports matplotlib
+_LAZY_ATTRIBUTES = {
+    "SectionPlotter": "opensection.postprocess.visualization",
+    "ReportGenerator": "opensection.postprocess.report",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -5,15 +5,23 @@ This module provides classes for representing cross-section geometry,
 computing geometric properties, and creating fiber meshes for analysis.
 """
 
-from opensection.geometry.contour import Contour, Point
+from opensection.geometry.contour import Contour, FrozenContour, Point
 from opensection.geometry.properties import GeometricProperties
-from opensection.geometry.section import CircularSection, RectangularSection, Section, TSection
+from opensection.geometry.section import (
+    CircularSection,
+    FrozenSection,
+    RectangularSection,
+    Section,
+    TSection,
+)
 
 __all__ = [
     "Point",
     "Contour",
+    "FrozenContour",
     "GeometricProperties",
     "Section",
+    "FrozenSection",
     "RectangularSection",
     "CircularSection",
     "TSection",
@@ -3,10 +3,64 @@ Classes pour la représentation de contours géométriques
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 
+from opensection.geometry.properties import GeometricProperties
+from opensection.utils.hashing import content_fingerprint
+
+# Nombre maximal d'éléments (points x arêtes) traités par bloc dans le ray casting
+_RAY_CAST_BLOCK = 1 << 20
+
+# Sommets (n_points, 2) -> [y, z], tableau ou séquence de couples
+Coordinates = Union[np.ndarray, Sequence[Tuple[float, float]]]
+
+
+def points_in_polygon(coords: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Ray casting vectorisé sur tous les points et toutes les arêtes d'un polygone
+
+    Reproduit exactement le test de Contour.contains_point (mêmes opérations
+    flottantes, mêmes conventions aux frontières) pour un ensemble de points.
+    Les points sont traités par blocs pour borner la mémoire des tableaux
+    (n_points, n_arêtes).
+
+    Args:
+        coords: Sommets du polygone (n_points, 2)
+        y, z: Coordonnées des points à tester (tableaux 1D de même taille)
+
+    Returns:
+        Tableau booléen, True pour les points à l'intérieur
+    """
+    y = np.asarray(y, dtype=float)
+    z = np.asarray(z, dtype=float)
+    inside = np.zeros(y.shape, dtype=bool)
+    n = len(coords)
+    if n == 0 or y.size == 0:
+        return inside
+
+    # Arêtes (i, i+1) du polygone fermé
+    y1, z1 = coords[:, 0], coords[:, 1]
+    y2, z2 = np.roll(y1, -1), np.roll(z1, -1)
+    z_min = np.minimum(z1, z2)
+    z_max = np.maximum(z1, z2)
+    y_max = np.maximum(y1, y2)
+    vertical = y1 == y2
+    # Les arêtes horizontales ne sont jamais traversées (z > z_min et z <= z_max impossible)
+    dz = np.where(z1 != z2, z2 - z1, 1.0)
+    slope = y2 - y1
+
+    block = max(1, _RAY_CAST_BLOCK // n)
+    for start in range(0, y.size, block):
+        yb = y[start : start + block, None]
+        zb = z[start : start + block, None]
+        xinters = (zb - z1) * slope / dz + y1
+        crossing = (zb > z_min) & (zb <= z_max) & (yb <= y_max) & (vertical | (yb <= xinters))
+        inside[start : start + block] = np.count_nonzero(crossing, axis=1) % 2 == 1
+
+    return inside
+
 
 @dataclass
 class Point:
@@ -20,12 +74,44 @@ class Point:
         return np.array([self.y, self.z])
 
 
+class _Vertex(Point):
+    """
+    Sommet d'un contour en lecture seule (voir Contour.points)
+
+    Modifier un sommet lève une erreur au lieu de modifier une copie sans
+    effet sur le contour ; il est égal à tout Point de mêmes coordonnées.
+    """
+
+    def __init__(self, y: float, z: float):
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "z", z)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"Sommet de contour en lecture seule ({name!r}) : affecter Contour.points"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Point):
+            return NotImplemented
+        return (self.y, self.z) == (other.y, other.z)
+
+    def __repr__(self) -> str:
+        return f"Point(y={self.y!r}, z={self.z!r})"
+
+
 class Contour:
     """
     Représente un contour fermé défini par une liste de points
 
+    Les sommets sont stockés dans un tableau (n_points, 2) en lecture seule ;
+    l'aire, le centroïde et les moments quadratiques en sont calculés en une
+    passe vectorisée (geometric_moments) et mis en cache. Remplacer points
+    invalide ce cache.
+
     Attributes:
-        points: Liste de points définissant le contour
+        points: Sommets du contour, tuple de Point en lecture seule (affecter
+            une nouvelle liste pour modifier le contour)
         is_hole: True si le contour représente un trou
     """
 
@@ -38,61 +124,117 @@ class Contour:
         self.points = points
         self.is_hole = is_hole
 
-    def to_array(self) -> np.ndarray:
-        """Convertit en array numpy (n_points, 2)"""
-        return np.array([[p.y, p.z] for p in self.points])
-
-    def area(self) -> float:
+    @classmethod
+    def from_array(cls, coords: Coordinates, is_hole: bool = False) -> "Contour":
         """
-        Calcule l'aire du contour par la formule de Shoelace
+        Crée un contour à partir d'un tableau de sommets
+
+        Args:
+            coords: Sommets (n_points, 2) -> [y, z]
+            is_hole: True si c'est un trou
 
         Returns:
-            Aire du contour (positive)
+            Contour
         """
-        coords = self.to_array()
-        n = len(coords)
-        if n < 3:
-            return 0.0
+        contour = cls.__new__(cls)
+        contour._set_coords(coords)
+        contour.is_hole = is_hole
+        return contour
+
+    def _set_coords(self, coords: Coordinates) -> None:
+        coords = np.array(coords, dtype=float).reshape(-1, 2)
+        coords.flags.writeable = False
+        self._coords = coords
+        self._moments: Optional[GeometricProperties] = None
+
+    @property
+    def points(self) -> Tuple[Point, ...]:
+        """
+        Sommets sous forme de tuple de Point en lecture seule
+
+        Ajouter ou modifier un sommet lève une erreur : affecter une nouvelle
+        séquence de points, qui invalide le cache des moments.
+        """
+        return tuple(_Vertex(float(y), float(z)) for y, z in self._coords)
 
-        # Formule de Shoelace
-        area = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            area += coords[i, 0] * coords[j, 1]
-            area -= coords[j, 0] * coords[i, 1]
+    @points.setter
+    def points(self, points: Sequence[Point]) -> None:
+        self._set_coords([(p.y, p.z) for p in points])
 
-        return abs(area) / 2.0
+    def to_array(self) -> np.ndarray:
+        """Sommets (n_points, 2), tableau en lecture seule (sans copie)"""
+        return self._coords
 
-    def centroid(self) -> Tuple[float, float]:
+    def geometric_moments(self) -> GeometricProperties:
         """
-        Calcule le centroïde du contour
+        Aire, centroïde et moments quadratiques centrés, en un seul calcul
+
+        Formules de Green sur les arêtes (i, i+1), vectorisées avec np.roll.
+        L'aire signée donne l'orientation : le résultat est le même dans les
+        deux sens de parcours. Les moments sont calculés par rapport au
+        centroïde pour limiter les erreurs d'arrondi. Le résultat est mis en
+        cache.
 
         Returns:
-            Tuple (y_c, z_c) du centroïde
+            GeometricProperties du contour (aire positive, I_yz signé)
         """
-        coords = self.to_array()
-        n = len(coords)
-        if n < 3:
-            return (0.0, 0.0)
+        if self._moments is not None:
+            return self._moments
+
+        coords = self._coords
+        if len(coords) < 3:
+            self._moments = GeometricProperties(0.0, (0.0, 0.0), 0.0, 0.0, 0.0)
+            return self._moments
+
+        # Aire et moments statiques, origine au premier sommet
+        y1, z1 = (coords - coords[0]).T
+        y2, z2 = np.roll(y1, -1), np.roll(z1, -1)
+        cross = y1 * z2 - y2 * z1
+        signed_area = 0.5 * np.sum(cross)
+        orientation = -1.0 if signed_area < 0 else 1.0
+        area = abs(signed_area)
 
-        area = self.area()
         if area < 1e-12:
-            return (0.0, 0.0)
+            cy, cz = 0.0, 0.0
+        else:
+            factor = 1.0 / (6.0 * signed_area)
+            cy = float(coords[0, 0] + factor * np.dot(y1 + y2, cross))
+            cz = float(coords[0, 1] + factor * np.dot(z1 + z2, cross))
+
+        I_yy, I_zz, I_yz = self._second_moments(cy, cz, orientation)
+        self._moments = GeometricProperties(float(area), (cy, cz), I_yy, I_zz, I_yz)
+        return self._moments
+
+    def _second_moments(
+        self, cy: float, cz: float, orientation: float
+    ) -> Tuple[float, float, float]:
+        """Moments quadratiques par rapport à (cy, cz), orientés par le signe de l'aire"""
+        y1, z1 = (self._coords - (cy, cz)).T
+        y2, z2 = np.roll(y1, -1), np.roll(z1, -1)
+        cross = orientation * (y1 * z2 - y2 * z1)
+
+        I_yy = np.dot(z1**2 + z1 * z2 + z2**2, cross) / 12.0
+        I_zz = np.dot(y1**2 + y1 * y2 + y2**2, cross) / 12.0
+        I_yz = np.dot(y1 * z2 + 2 * y1 * z1 + 2 * y2 * z2 + y2 * z1, cross) / 24.0
+        return (float(I_yy), float(I_zz), float(I_yz))
 
-        cy = 0.0
-        cz = 0.0
+    def area(self) -> float:
+        """
+        Calcule l'aire du contour par la formule de Shoelace
 
-        for i in range(n):
-            j = (i + 1) % n
-            cross = coords[i, 0] * coords[j, 1] - coords[j, 0] * coords[i, 1]
-            cy += (coords[i, 0] + coords[j, 0]) * cross
-            cz += (coords[i, 1] + coords[j, 1]) * cross
+        Returns:
+            Aire du contour (positive)
+        """
+        return self.geometric_moments().area
 
-        factor = 1.0 / (6.0 * area)
-        cy *= factor
-        cz *= factor
+    def centroid(self) -> Tuple[float, float]:
+        """
+        Calcule le centroïde du contour
 
-        return (cy, cz)
+        Returns:
+            Tuple (y_c, z_c) du centroïde
+        """
+        return self.geometric_moments().centroid
 
     def second_moment(self, cy: float, cz: float) -> Tuple[float, float, float]:
         """
@@ -102,33 +244,13 @@ class Contour:
             cy, cz: Coordonnées du point de référence
 
         Returns:
-            Tuple (I_yy, I_zz, I_yz)
+            Tuple (I_yy, I_zz, I_yz), I_yz signé
         """
-        coords = self.to_array()
-        n = len(coords)
-
-        I_yy = 0.0
-        I_zz = 0.0
-        I_yz = 0.0
-
-        for i in range(n):
-            j = (i + 1) % n
-
-            y1, z1 = coords[i] - np.array([cy, cz])
-            y2, z2 = coords[j] - np.array([cy, cz])
-
-            cross = y1 * z2 - y2 * z1
-
-            # Moments quadratiques
-            I_yy += (z1**2 + z1 * z2 + z2**2) * cross
-            I_zz += (y1**2 + y1 * y2 + y2**2) * cross
-            I_yz += (y1 * z2 + 2 * y1 * z1 + 2 * y2 * z2 + y2 * z1) * cross
-
-        I_yy /= 12.0
-        I_zz /= 12.0
-        I_yz /= 24.0
-
-        return (abs(I_yy), abs(I_zz), abs(I_yz))
+        if len(self._coords) < 3:
+            return (0.0, 0.0, 0.0)
+        y1, z1 = self._coords.T
+        signed_area = np.dot(y1, np.roll(z1, -1)) - np.dot(np.roll(y1, -1), z1)
+        return self._second_moments(cy, cz, -1.0 if signed_area < 0 else 1.0)
 
     def contains_point(self, y: float, z: float) -> bool:
         """
@@ -140,7 +262,7 @@ class Contour:
         Returns:
             True si le point est à l'intérieur
         """
-        coords = self.to_array()
+        coords = self._coords
         n = len(coords)
         inside = False
 
@@ -160,6 +282,24 @@ class Contour:
 
         return inside
 
+    def contains_points(self, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """
+        Version vectorisée de contains_point
+
+        Args:
+            y, z: Coordonnées des points à tester (tableaux de même forme)
+
+        Returns:
+            Tableau booléen de même forme, True pour les points à l'intérieur
+        """
+        y, z = np.broadcast_arrays(np.asarray(y, dtype=float), np.asarray(z, dtype=float))
+        inside = points_in_polygon(self.to_array(), y.ravel(), z.ravel())
+        return inside.reshape(y.shape)
+
+    def freeze(self) -> "FrozenContour":
+        """Copie immuable et hachable du contour (voir FrozenContour)"""
+        return FrozenContour.from_array(self._coords, self.is_hole)
+
     @classmethod
     def rectangle(
         cls, width: float, height: float, center_y: float = 0.0, center_z: float = 0.0
@@ -179,14 +319,14 @@ class Contour:
         half_w = width / 2.0
         half_h = height / 2.0
 
-        points = [
-            Point(center_y - half_w, center_z - half_h),
-            Point(center_y + half_w, center_z - half_h),
-            Point(center_y + half_w, center_z + half_h),
-            Point(center_y - half_w, center_z + half_h),
+        coords = [
+            (center_y - half_w, center_z - half_h),
+            (center_y + half_w, center_z - half_h),
+            (center_y + half_w, center_z + half_h),
+            (center_y - half_w, center_z + half_h),
         ]
 
-        return cls(points)
+        return cls.from_array(coords)
 
     @classmethod
     def circle(
@@ -204,14 +344,11 @@ class Contour:
         Returns:
             Contour circulaire
         """
-        points = []
-        for i in range(n_points):
-            theta = 2 * np.pi * i / n_points
-            y = center_y + radius * np.cos(theta)
-            z = center_z + radius * np.sin(theta)
-            points.append(Point(y, z))
-
-        return cls(points)
+        theta = 2 * np.pi * np.arange(n_points) / n_points
+        coords = np.column_stack(
+            [center_y + radius * np.cos(theta), center_z + radius * np.sin(theta)]
+        )
+        return cls.from_array(coords)
 
     @classmethod
     def polygon(cls, vertices: List[Tuple[float, float]]) -> "Contour":
@@ -224,5 +361,55 @@ class Contour:
         Returns:
             Contour polygonal
         """
-        points = [Point(y, z) for y, z in vertices]
-        return cls(points)
+        return cls.from_array(vertices)
+
+
+class FrozenContour(Contour):
+    """
+    Contour immuable, hachable par son contenu
+
+    Les sommets et is_hole ne peuvent plus être modifiés ; l'aire, le
+    centroïde et les moments sont calculés à la construction. Deux contours
+    figés de mêmes sommets (et même is_hole) sont égaux et ont le même hash,
+    ce qui permet de les utiliser comme clés de mémoïsation.
+    """
+
+    def __init__(self, points: List[Point], is_hole: bool = False):
+        super().__init__(points, is_hole)
+        self._freeze()
+
+    @classmethod
+    def from_array(cls, coords: Coordinates, is_hole: bool = False) -> "FrozenContour":
+        contour = cast("FrozenContour", super().from_array(coords, is_hole))
+        contour._freeze()
+        return contour
+
+    def _freeze(self) -> None:
+        self.is_hole = bool(self.is_hole)
+        self.geometric_moments()
+        self._fingerprint = content_fingerprint("Contour", self._coords, self.is_hole)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get("_frozen", False):
+            raise AttributeError(f"{type(self).__name__} est immuable ({name!r})")
+        super().__setattr__(name, value)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._coords.flags.writeable = False
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrozenContour):
+            return NotImplemented
+        return self._fingerprint == other._fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self._fingerprint)
+
+    def fingerprint(self) -> str:
+        """Empreinte du contenu (sommets et is_hole)"""
+        return self._fingerprint
+
+    def freeze(self) -> "FrozenContour":
+        return self
@@ -0,0 +1,449 @@
+"""
+Maillages de fibres avancés
+
+Ce module regroupe les noyaux géométriques utilisés par les maillages de
+fibres autres que la grille nodale de Section.create_fiber_mesh :
+
+- découpe de polygones par demi-plan et par rectangle (Sutherland-Hodgman)
+- moments d'aire exacts de polygones (formules de Green)
+- maillage "clipped" : chaque cellule de la grille est découpée par les
+  contours, l'aire et le centroïde de chaque fibre sont exacts
+- maillage "triangle" : triangulation des contours (trous compris) puis
+  fibres de quadrature par triangle, avec raffinement optionnel près de la
+  fibre la plus comprimée
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from opensection.geometry.contour import Contour
+
+
+def clip_polygon_half_plane(coords: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Découpe un polygone par le demi-plan {f >= 0} (une passe de Sutherland-Hodgman)
+
+    La fonction f est supposée affine : values contient f évaluée aux sommets,
+    les intersections sont obtenues par interpolation linéaire le long des arêtes.
+
+    Args:
+        coords: Sommets du polygone (n, 2)
+        values: f évaluée aux sommets (n,)
+
+    Returns:
+        Sommets du polygone découpé (m, 2), m = 0 si le polygone est hors du demi-plan
+    """
+    if len(coords) == 0:
+        return coords
+
+    keep = values >= 0
+    if np.all(keep):
+        return coords
+    if not np.any(keep):
+        return coords[:0]
+
+    values_next = np.roll(values, -1)
+    coords_next = np.roll(coords, -1, axis=0)
+    cross = keep != (values_next >= 0)
+
+    # Point d'intersection de chaque arête traversée
+    denom = np.where(cross, values - values_next, 1.0)
+    t = np.where(cross, values / denom, 0.0)
+    inter = coords + t[:, None] * (coords_next - coords)
+
+    # Ordre de sortie : sommet conservé puis intersection de l'arête sortante
+    candidates = np.stack([coords, inter], axis=1)
+    mask = np.stack([keep, cross], axis=1)
+    return candidates[mask]
+
+
+def clip_polygon_to_box(
+    coords: np.ndarray, y_min: float, y_max: float, z_min: float, z_max: float
+) -> np.ndarray:
+    """
+    Découpe un polygone (convexe ou non) par un rectangle aligné sur les axes
+
+    Args:
+        coords: Sommets du polygone (n, 2)
+        y_min, y_max, z_min, z_max: Limites du rectangle
+
+    Returns:
+        Sommets du polygone découpé (m, 2)
+    """
+    coords = clip_polygon_half_plane(coords, coords[:, 0] - y_min)
+    if len(coords):
+        coords = clip_polygon_half_plane(coords, y_max - coords[:, 0])
+    if len(coords):
+        coords = clip_polygon_half_plane(coords, coords[:, 1] - z_min)
+    if len(coords):
+        coords = clip_polygon_half_plane(coords, z_max - coords[:, 1])
+    return coords
+
+
+def polygon_area_moments(coords: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Aire signée et moments statiques d'un polygone (formules de Green)
+
+    Args:
+        coords: Sommets du polygone (n, 2)
+
+    Returns:
+        Tuple (A, S_y, S_z) avec A signée (positive en sens trigonométrique),
+        S_y = ∫ y dA et S_z = ∫ z dA
+    """
+    if len(coords) < 3:
+        return 0.0, 0.0, 0.0
+
+    y, z = coords[:, 0], coords[:, 1]
+    y_next, z_next = np.roll(y, -1), np.roll(z, -1)
+    cross = y * z_next - y_next * z
+
+    area = np.sum(cross) / 2.0
+    S_y = np.sum((y + y_next) * cross) / 6.0
+    S_z = np.sum((z + z_next) * cross) / 6.0
+    return float(area), float(S_y), float(S_z)
+
+
+def _integrals_below(coords: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """
+    Intégrales (A, S_y, S_z) de la partie d'un polygone située sous chaque niveau z = t
+
+    Par le théorème de Green sous la forme ∮ (y, y²/2, y·z) dz, les segments de
+    fermeture portés par la droite z = t ne contribuent pas : il suffit d'intégrer
+    la portion de chaque arête située sous le niveau. Le calcul est vectorisé sur
+    tous les niveaux et toutes les arêtes.
+
+    Args:
+        coords: Sommets du polygone (n, 2)
+        levels: Niveaux t (m,)
+
+    Returns:
+        Tableau (m, 3) des intégrales signées (positives en sens trigonométrique)
+    """
+    y1, z1 = coords[:, 0], coords[:, 1]
+    y2, z2 = np.roll(y1, -1), np.roll(z1, -1)
+    dz = z2 - z1
+    slope = (y2 - y1) / np.where(dz != 0, dz, 1.0)
+
+    t = levels[:, None]
+    # Extrémités de chaque arête ramenées sous le niveau t (le long de l'arête)
+    za = np.minimum(z1, t)
+    zb = np.minimum(z2, t)
+    ya = np.where(z1 <= t, y1, y1 + (t - z1) * slope)
+    yb = np.where(z2 <= t, y2, y1 + (t - z1) * slope)
+    dzc = zb - za
+
+    area = np.sum(dzc * (ya + yb), axis=1) / 2.0
+    S_y = np.sum(dzc * (ya * ya + ya * yb + yb * yb), axis=1) / 6.0
+    S_z = np.sum(dzc * (2 * ya * za + ya * zb + yb * za + 2 * yb * zb), axis=1) / 6.0
+    return np.column_stack([area, S_y, S_z])
+
+
+def clipped_fiber_mesh(contours: Sequence[Contour], target_fiber_area: float) -> np.ndarray:
+    """
+    Maillage de fibres par découpe exacte des cellules d'une grille
+
+    Chaque cellule de la grille couvrant la boîte englobante est découpée par
+    chaque contour (les trous sont soustraits). Chaque fibre porte l'aire exacte
+    de sa cellule découpée et est placée en son centroïde : l'aire et les
+    moments statiques du maillage sont ceux des contours, quel que soit le pas.
+    Les moments quadratiques ne négligent que l'inertie propre des cellules
+    (erreur en O(h²), comme pour la grille nodale).
+
+    Args:
+        contours: Contours de la section
+        target_fiber_area: Aire cible des cellules (m²)
+
+    Returns:
+        Tableau (n_fibres, 3) -> [y, z, aire]
+    """
+    coords_list = [contour.to_array() for contour in contours]
+    points = np.vstack(coords_list)
+    y_min, z_min = points.min(axis=0)
+    y_max, z_max = points.max(axis=0)
+
+    h = np.sqrt(target_fiber_area)
+    n_y = max(1, int(np.ceil((y_max - y_min) / h)))
+    n_z = max(1, int(np.ceil((z_max - z_min) / h)))
+    y_edges = np.linspace(y_min, y_max, n_y + 1)
+    z_edges = np.linspace(z_min, z_max, n_z + 1)
+
+    # Intégrales (A, S_y, S_z) par cellule
+    integrals = np.zeros((n_y, n_z, 3))
+
+    for contour, coords in zip(contours, coords_list):
+        orientation = np.sign(polygon_area_moments(coords)[0])
+        if orientation == 0:
+            continue
+        sign = -orientation if contour.is_hole else orientation
+
+        # Bande verticale de chaque colonne, puis découpe en lignes par différence
+        # des intégrales cumulées sous chaque bord de ligne
+        i_start = max(0, int(np.searchsorted(y_edges, coords[:, 0].min(), side="right")) - 1)
+        i_stop = min(n_y, int(np.searchsorted(y_edges, coords[:, 0].max(), side="left")))
+        for i in range(i_start, max(i_start + 1, i_stop)):
+            strip = clip_polygon_half_plane(coords, coords[:, 0] - y_edges[i])
+            if len(strip):
+                strip = clip_polygon_half_plane(strip, y_edges[i + 1] - strip[:, 0])
+            if len(strip) < 3:
+                continue
+            cumulative = _integrals_below(strip, z_edges)
+            integrals[i] += sign * np.diff(cumulative, axis=0)
+
+    area = integrals[:, :, 0]
+    # Cellules vides (ou annulées par un trou) au bruit d'arrondi près
+    mask = area > 1e-9 * (y_edges[1] - y_edges[0]) * (z_edges[1] - z_edges[0])
+    if not np.any(mask):
+        return np.zeros((0, 3))
+
+    cells = integrals[mask]
+    return np.column_stack([cells[:, 1] / cells[:, 0], cells[:, 2] / cells[:, 0], cells[:, 0]])
+
+
+# Règle de Gauss à 3 points sur le triangle (exacte pour les polynômes de degré 2) :
+# coordonnées barycentriques des points, poids 1/3 chacun
+_TRIANGLE_QUADRATURE = np.array(
+    [
+        [2.0 / 3.0, 1.0 / 6.0, 1.0 / 6.0],
+        [1.0 / 6.0, 2.0 / 3.0, 1.0 / 6.0],
+        [1.0 / 6.0, 1.0 / 6.0, 2.0 / 3.0],
+    ]
+)
+
+
+def _cross(o: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Produit vectoriel (a - o) x (b - o), vectorisé sur la première dimension"""
+    return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - (a[..., 1] - o[..., 1]) * (
+        b[..., 0] - o[..., 0]
+    )
+
+
+def _segments_intersect(p1: np.ndarray, p2: np.ndarray, a: np.ndarray, b: np.ndarray) -> bool:
+    """True si le segment [p1, p2] coupe strictement l'un des segments [a_k, b_k]"""
+    d1 = _cross(a, b, p1[None, :])
+    d2 = _cross(a, b, p2[None, :])
+    d3 = _cross(p1[None, :], p2[None, :], a)
+    d4 = _cross(p1[None, :], p2[None, :], b)
+    return bool(np.any((d1 * d2 < 0) & (d3 * d4 < 0)))
+
+
+def _bridge_hole(outer: np.ndarray, hole: np.ndarray, obstacles: List[np.ndarray]) -> np.ndarray:
+    """
+    Raccorde un trou au contour extérieur par un pont aller-retour
+
+    Le sommet du trou le plus à droite (y max) est relié au sommet visible le plus
+    proche du contour ; le polygone obtenu est simple (au pont dédoublé près).
+
+    Args:
+        outer: Contour extérieur, sens trigonométrique (n, 2)
+        hole: Trou, sens horaire (m, 2)
+        obstacles: Trous restant à raccorder (leurs arêtes ne doivent pas être coupées)
+
+    Returns:
+        Sommets du polygone raccordé
+    """
+    j = int(np.argmax(hole[:, 0]))
+    start = hole[j]
+
+    edges = [(outer, np.roll(outer, -1, axis=0)), (hole, np.roll(hole, -1, axis=0))]
+    edges += [(o, np.roll(o, -1, axis=0)) for o in obstacles]
+    a = np.vstack([e[0] for e in edges])
+    b = np.vstack([e[1] for e in edges])
+
+    for i in np.argsort(np.hypot(*(outer - start).T)):
+        # Ignorer les arêtes incidentes aux extrémités du pont
+        touching = np.all(a == outer[i], axis=1) | np.all(b == outer[i], axis=1)
+        touching |= np.all(a == start, axis=1) | np.all(b == start, axis=1)
+        if not _segments_intersect(start, outer[i], a[~touching], b[~touching]):
+            break
+    else:
+        i = int(np.argmin(np.hypot(*(outer - start).T)))
+
+    hole_loop = np.vstack([hole[j:], hole[: j + 1]])
+    return np.vstack([outer[: i + 1], hole_loop, outer[i:]])
+
+
+def _is_ear(polygon: np.ndarray, indices: List[int], i: int) -> bool:
+    """True si le sommet indices[i] est une oreille du polygone (sens trigonométrique)"""
+    n = len(indices)
+    prev, curr, nxt = indices[i - 1], indices[i], indices[(i + 1) % n]
+    p0, p1, p2 = polygon[prev], polygon[curr], polygon[nxt]
+    if _cross(p0, p1, p2) <= 0:
+        return False
+
+    # Aucun autre sommet à l'intérieur, hors sommets confondus avec ceux du triangle
+    others = polygon[[k for k in indices if k not in (prev, curr, nxt)]]
+    distinct = ~(
+        np.all(others == p0, axis=1) | np.all(others == p1, axis=1) | np.all(others == p2, axis=1)
+    )
+    others = others[distinct]
+    if len(others) == 0:
+        return True
+    inside = (
+        (_cross(p0, p1, others) >= 0)
+        & (_cross(p1, p2, others) >= 0)
+        & (_cross(p2, p0, others) >= 0)
+    )
+    return not np.any(inside)
+
+
+def triangulate_polygon(outer: np.ndarray, holes: Optional[List[np.ndarray]] = None) -> np.ndarray:
+    """
+    Triangule un polygone simple avec trous (découpage d'oreilles)
+
+    Les trous sont d'abord raccordés au contour extérieur par des ponts, puis
+    les oreilles sont retirées une à une.
+
+    Args:
+        outer: Sommets du contour extérieur (n, 2), sens quelconque
+        holes: Sommets des trous (sens quelconque)
+
+    Returns:
+        Triangles (n_triangles, 3, 2) en sens trigonométrique
+    """
+    outer = np.asarray(outer, dtype=float)
+    if polygon_area_moments(outer)[0] < 0:
+        outer = outer[::-1]
+
+    oriented_holes = []
+    for hole in holes or []:
+        hole = np.asarray(hole, dtype=float)
+        if polygon_area_moments(hole)[0] > 0:
+            hole = hole[::-1]
+        oriented_holes.append(hole)
+
+    # Raccorder les trous dans l'ordre des y max décroissants
+    oriented_holes.sort(key=lambda h: -h[:, 0].max())
+    polygon = outer
+    for k, hole in enumerate(oriented_holes):
+        polygon = _bridge_hole(polygon, hole, oriented_holes[k + 1 :])
+
+    triangles = []
+    indices = list(range(len(polygon)))
+    start = 0
+    while len(indices) > 3:
+        n = len(indices)
+        for attempt in range(n):
+            i = (start + attempt) % n
+            if _is_ear(polygon, indices, i):
+                triangles.append(polygon[[indices[i - 1], indices[i], indices[(i + 1) % n]]])
+                del indices[i]
+                start = i
+                break
+        else:
+            # Aucune oreille stricte (sommets alignés, pont dégénéré) : retirer le
+            # sommet du plus petit triangle, ce qui ne modifie l'aire qu'à l'arrondi près
+            areas = [
+                abs(_cross(*polygon[[indices[k - 1], indices[k], indices[(k + 1) % n]]]))
+                for k in range(n)
+            ]
+            del indices[int(np.argmin(areas))]
+
+    if len(indices) == 3:
+        triangle = polygon[indices]
+        if _cross(*triangle) > 0:
+            triangles.append(triangle)
+
+    if not triangles:
+        return np.zeros((0, 3, 2))
+    return np.array(triangles, dtype=float)
+
+
+def triangle_fiber_mesh(
+    contours: Sequence[Contour],
+    target_fiber_area: float,
+    refine_direction: Optional[Tuple[float, float]] = None,
+    refine_depth: float = 0.2,
+    refine_ratio: float = 0.25,
+) -> np.ndarray:
+    """
+    Maillage de fibres par triangulation des contours
+
+    Chaque contour extérieur est triangulé avec les trous qu'il contient, puis
+    les triangles sont bissectés par leur plus grand côté jusqu'à ce que chacun
+    porte au plus trois fibres d'aire target_fiber_area. Chaque triangle donne
+    trois fibres de quadrature (règle de Gauss à 3 points) : l'aire et les
+    moments statiques et quadratiques du maillage sont exacts.
+
+    Le raffinement optionnel divise l'aire cible par 1/refine_ratio dans la
+    bande de profondeur refine_depth (fraction de la hauteur de la section
+    mesurée selon refine_direction) au voisinage de la fibre la plus comprimée.
+
+    Args:
+        contours: Contours de la section
+        target_fiber_area: Aire cible des fibres (m²)
+        refine_direction: Direction (y, z) pointant vers la fibre la plus comprimée,
+            None pour un maillage uniforme
+        refine_depth: Profondeur relative de la zone raffinée
+        refine_ratio: Rapport des aires cibles dans la zone raffinée
+
+    Returns:
+        Tableau (n_fibres, 3) -> [y, z, aire]
+    """
+    outers = [c for c in contours if not c.is_hole]
+    holes = [c for c in contours if c.is_hole]
+    outer_coords = [c.to_array() for c in outers]
+
+    # Chaque trou est rattaché au premier contour extérieur qui le contient
+    holes_of: List[List[np.ndarray]] = [[] for _ in outers]
+    for hole in holes:
+        coords = hole.to_array()
+        for k, outer in enumerate(outers):
+            if outer.contains_point(*coords.mean(axis=0)) or outer.contains_point(*coords[0]):
+                holes_of[k].append(coords)
+                break
+
+    parts = [triangulate_polygon(o, h) for o, h in zip(outer_coords, holes_of)]
+    triangles = np.concatenate(parts) if parts else np.zeros((0, 3, 2))
+    if len(triangles) == 0:
+        return np.zeros((0, 3))
+
+    if refine_direction is not None:
+        direction = np.asarray(refine_direction, dtype=float)
+        direction = direction / np.linalg.norm(direction)
+        all_points = np.vstack(outer_coords)
+        s_all = all_points @ direction
+        s_top = s_all.max()
+        s_limit = s_top - refine_depth * (s_top - s_all.min())
+
+    while True:
+        areas = 0.5 * _cross(triangles[:, 0], triangles[:, 1], triangles[:, 2])
+        limit = np.full(len(triangles), 3.0 * target_fiber_area)
+        if refine_direction is not None:
+            near = (triangles @ direction).max(axis=1) >= s_limit
+            limit[near] *= refine_ratio
+        split = areas > limit
+        if not np.any(split):
+            break
+
+        # Bissection par le plus grand côté : (v0, v1) devient le plus grand côté
+        to_split = triangles[split]
+        lengths = np.stack(
+            [
+                np.hypot(*(to_split[:, 1] - to_split[:, 0]).T),
+                np.hypot(*(to_split[:, 2] - to_split[:, 1]).T),
+                np.hypot(*(to_split[:, 0] - to_split[:, 2]).T),
+            ],
+            axis=1,
+        )
+        longest = np.argmax(lengths, axis=1)
+        order = (longest[:, None] + np.arange(3)[None, :]) % 3
+        to_split = np.take_along_axis(to_split, order[:, :, None], axis=1)
+
+        v0, v1, v2 = to_split[:, 0], to_split[:, 1], to_split[:, 2]
+        mid = 0.5 * (v0 + v1)
+        children = np.concatenate(
+            [np.stack([v0, mid, v2], axis=1), np.stack([mid, v1, v2], axis=1)]
+        )
+        triangles = np.concatenate([triangles[~split], children])
+
+    areas = 0.5 * _cross(triangles[:, 0], triangles[:, 1], triangles[:, 2])
+    keep = areas > 0
+    triangles = triangles[keep]
+    areas = areas[keep]
+
+    # Trois points de Gauss par triangle, poids A/3
+    points = np.einsum("qk,tkd->tqd", _TRIANGLE_QUADRATURE, triangles).reshape(-1, 2)
+    weights = np.repeat(areas / 3.0, 3)
+    return np.column_stack([points, weights])
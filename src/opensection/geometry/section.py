@@ -2,35 +2,39 @@
 Classes de sections géométriques
 """
 
-from typing import List
+import threading
+from typing import Dict, Optional, Sequence
 
 import numpy as np
 
-from opensection.geometry.contour import Contour, Point
+from opensection.geometry.contour import Contour, Point, points_in_polygon
+from opensection.geometry.mesh import clipped_fiber_mesh, triangle_fiber_mesh
 from opensection.geometry.properties import GeometricProperties
+from opensection.utils.hashing import content_fingerprint
 
 
 class Section:
     """Classe de base pour les sections"""
 
-    def __init__(self, contours: List[Contour]):
+    def __init__(self, contours: Sequence[Contour]):
         self.contours = contours
-        self._properties = None
+        self._properties: Optional[GeometricProperties] = None
 
     def compute_properties(self) -> GeometricProperties:
         """Calcule les propriétés géométriques"""
+        # Aire, centroïde et moments centrés de chaque contour (un calcul chacun)
+        moments = [contour.geometric_moments() for contour in self.contours]
+        signs = [-1.0 if contour.is_hole else 1.0 for contour in self.contours]
+
         total_area = 0.0
         moment_y = 0.0
         moment_z = 0.0
 
-        for contour in self.contours:
-            sign = -1.0 if contour.is_hole else 1.0
-            area = contour.area()
-            cy, cz = contour.centroid()
-
-            total_area += sign * area
-            moment_y += sign * area * cy
-            moment_z += sign * area * cz
+        for sign, m in zip(signs, moments):
+            cy, cz = m.centroid
+            total_area += sign * m.area
+            moment_y += sign * m.area * cy
+            moment_z += sign * m.area * cz
 
         if total_area < 1e-12:
             raise ValueError("Aire totale nulle ou négative")
@@ -42,19 +46,13 @@ class Section:
         I_zz_total = 0.0
         I_yz_total = 0.0
 
-        for contour in self.contours:
-            sign = -1.0 if contour.is_hole else 1.0
-            area = contour.area()
-            cy, cz = contour.centroid()
-
-            I_yy, I_zz, I_yz = contour.second_moment(cy, cz)
-
-            dy = cy - centroid_y
-            dz = cz - centroid_z
+        for sign, m in zip(signs, moments):
+            dy = m.centroid[0] - centroid_y
+            dz = m.centroid[1] - centroid_z
 
-            I_yy_total += sign * (I_yy + area * dz**2)
-            I_zz_total += sign * (I_zz + area * dy**2)
-            I_yz_total += sign * (I_yz + area * dy * dz)
+            I_yy_total += sign * (m.I_yy + m.area * dz**2)
+            I_zz_total += sign * (m.I_zz + m.area * dy**2)
+            I_yz_total += sign * (m.I_yz + m.area * dy * dz)
 
         self._properties = GeometricProperties(
             total_area, (centroid_y, centroid_z), I_yy_total, I_zz_total, I_yz_total
@@ -68,12 +66,68 @@ class Section:
             self._properties = self.compute_properties()
         return self._properties
 
-    def create_fiber_mesh(self, target_fiber_area: float = 0.0001) -> np.ndarray:
-        """Crée un maillage de fibres"""
-        all_points = []
-        for contour in self.contours:
-            all_points.extend(contour.to_array())
-        points = np.array(all_points)
+    def freeze(self) -> "FrozenSection":
+        """
+        Copie immuable de la section (voir FrozenSection)
+
+        Les attributs propres aux sous-classes (width, diameter...) ne sont
+        pas conservés : seule la géométrie des contours compte.
+        """
+        return FrozenSection(self.contours)
+
+    def fingerprint(self) -> str:
+        """
+        Empreinte du contenu géométrique (sommets et trous de chaque contour)
+
+        Deux sections de mêmes contours ont la même empreinte, quel que soit
+        leur type ; elle sert de clé de cache pour le maillage.
+
+        Returns:
+            Chaîne hexadécimale
+        """
+        return content_fingerprint(
+            "Section", [(contour.to_array(), contour.is_hole) for contour in self.contours]
+        )
+
+    def create_fiber_mesh(
+        self, target_fiber_area: float = 0.0001, method: str = "grid", **options
+    ) -> np.ndarray:
+        """
+        Crée un maillage de fibres
+
+        Méthodes disponibles :
+        - "grid" : les noeuds d'une grille régulière couvrant la boîte englobante
+          sont testés en une seule passe vectorisée contre chaque contour ; les
+          trous retirent les noeuds qu'ils contiennent. Toutes les fibres ont la
+          même aire.
+        - "clipped" : chaque cellule de la grille est découpée par les contours ;
+          chaque fibre porte l'aire exacte de sa cellule et est placée en son
+          centroïde (aire et moments statiques exacts même pour un maillage grossier).
+        - "triangle" : les contours (trous compris) sont triangulés et chaque
+          triangle porte trois fibres de quadrature ; seule la section est
+          maillée, et l'aire cible peut être réduite près de la fibre la plus
+          comprimée (voir triangle_fiber_mesh).
+
+        Args:
+            target_fiber_area: Aire cible des fibres (m²)
+            method: "grid", "clipped" ou "triangle"
+            **options: Options de la méthode "triangle" (refine_direction,
+                refine_depth, refine_ratio)
+
+        Returns:
+            Tableau (n_fibres, 3) -> [y, z, aire]
+        """
+        if method == "triangle":
+            return triangle_fiber_mesh(self.contours, target_fiber_area, **options)
+        if options:
+            raise TypeError(f"Options non supportées par la méthode {method!r} : {sorted(options)}")
+        if method == "clipped":
+            return clipped_fiber_mesh(self.contours, target_fiber_area)
+        if method != "grid":
+            raise ValueError(f"Méthode de maillage inconnue : {method!r}")
+
+        coords = [contour.to_array() for contour in self.contours]
+        points = np.vstack(coords)
 
         y_min, z_min = points.min(axis=0)
         y_max, z_max = points.max(axis=0)
@@ -84,25 +138,108 @@ class Section:
         y_grid = np.linspace(y_min, y_max, n_y)
         z_grid = np.linspace(z_min, z_max, n_z)
 
-        fibers = []
         dy = (y_max - y_min) / n_y if n_y > 1 else 0.01
         dz = (z_max - z_min) / n_z if n_z > 1 else 0.01
         fiber_area = dy * dz
 
-        for yi in y_grid:
-            for zi in z_grid:
-                is_inside = False
-                for contour in self.contours:
-                    in_contour = contour.contains_point(yi, zi)
-                    if not contour.is_hole and in_contour:
-                        is_inside = True
-                    elif contour.is_hole and in_contour:
-                        is_inside = False
+        # Noeuds dans l'ordre (y, puis z)
+        y_mesh, z_mesh = np.meshgrid(y_grid, z_grid, indexing="ij")
+        y_nodes = y_mesh.ravel()
+        z_nodes = z_mesh.ravel()
+
+        is_inside = np.zeros(y_nodes.shape, dtype=bool)
+        for contour, contour_coords in zip(self.contours, coords):
+            in_contour = points_in_polygon(contour_coords, y_nodes, z_nodes)
+            if contour.is_hole:
+                is_inside &= ~in_contour
+            else:
+                is_inside |= in_contour
+
+        n_fibers = int(np.count_nonzero(is_inside))
+        if n_fibers == 0:
+            return np.zeros((0, 3))
+
+        return np.column_stack(
+            [y_nodes[is_inside], z_nodes[is_inside], np.full(n_fibers, fiber_area)]
+        )
+
 
-                if is_inside:
-                    fibers.append([yi, zi, fiber_area])
+class FrozenSection(Section):
+    """
+    Section immuable, hachable par son contenu
+
+    Les contours sont figés (FrozenContour, tuple) et les attributs ne
+    peuvent plus être modifiés : les propriétés et l'empreinte sont calculées
+    une fois à la construction, et les maillages sont mémorisés par jeu de
+    paramètres et rendus en lecture seule. Ces résultats ne pouvant devenir
+    obsolètes, ils sont partagés sans copie, y compris entre threads.
+
+    Deux sections figées de mêmes contours sont égales et ont le même hash ;
+    leur empreinte est celle de la section d'origine, de sorte que les
+    entrées de SolverStateCache sont communes.
+    """
+
+    def __init__(self, contours: Sequence[Contour]):
+        super().__init__(tuple(contour.freeze() for contour in contours))
+        self._properties = super().compute_properties()
+        self._fingerprint = super().fingerprint()
+        self._meshes: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get("_frozen", False):
+            raise AttributeError(f"{type(self).__name__} est immuable ({name!r})")
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__["_lock"] = threading.Lock()
+        for mesh in self._meshes.values():
+            mesh.flags.writeable = False
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrozenSection):
+            return NotImplemented
+        return self._fingerprint == other._fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self._fingerprint)
 
-        return np.array(fibers) if fibers else np.zeros((0, 3))
+    def compute_properties(self) -> GeometricProperties:
+        """Propriétés géométriques (calculées à la construction)"""
+        return self.properties
+
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    def freeze(self) -> "FrozenSection":
+        return self
+
+    def create_fiber_mesh(
+        self, target_fiber_area: float = 0.0001, method: str = "grid", **options
+    ) -> np.ndarray:
+        """
+        Maillage de fibres mémorisé (voir Section.create_fiber_mesh)
+
+        Returns:
+            Tableau (n_fibres, 3) -> [y, z, aire], en lecture seule et partagé
+            entre les appels de mêmes paramètres
+        """
+        key = content_fingerprint(target_fiber_area, method, options)
+        with self._lock:
+            mesh = self._meshes.get(key)
+        if mesh is None:
+            mesh = super().create_fiber_mesh(target_fiber_area, method, **options)
+            mesh.flags.writeable = False
+            with self._lock:
+                mesh = self._meshes.setdefault(key, mesh)
+        return mesh
 
 
 class RectangularSection(Section):
@@ -5,8 +5,26 @@ This module provides tools for generating interaction diagrams
 for combined axial force and bending moment.
 """
 
-from opensection.interaction.diagram import InteractionDiagram
+from opensection.interaction.capacity import CapacityResult, compute_capacity
+from opensection.interaction.diagram import InteractionCurve, InteractionDiagram
+from opensection.interaction.parallel import compute_NM_curves, evaluate_ultimate_planes
+from opensection.interaction.strain_domains import (
+    StrainDomainGenerator,
+    ultimate_planes_from_limits,
+    ultimate_strain_planes,
+)
+from opensection.interaction.surface import CapacityIndex, InteractionSurface
 
 __all__ = [
+    "CapacityIndex",
+    "CapacityResult",
+    "InteractionCurve",
     "InteractionDiagram",
+    "InteractionSurface",
+    "StrainDomainGenerator",
+    "compute_capacity",
+    "compute_NM_curves",
+    "evaluate_ultimate_planes",
+    "ultimate_planes_from_limits",
+    "ultimate_strain_planes",
 ]
@@ -0,0 +1,140 @@
+"""
+Moment résistant ultime M_Rd pour un effort normal et une direction donnés
+
+Pour une direction de flexion, l'effort normal des plans de déformation
+ultimes (voir strain_domains) croît avec le paramètre de domaine t, de la
+traction pure (t = 0) à la compression pure (t = 3). Le plan ultime associé
+à N_Ed est la racine de N(t) = N_Ed, cherchée par la méthode de Brent
+(find_root_bracketed) : chaque évaluation est une seule intégration des
+efforts sur le plan de déformation, sans résolution de Newton.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from opensection.interaction.strain_domains import StrainDomainGenerator
+from opensection.solver.section_solver import SectionSolver
+from opensection.utils.math_helpers import find_root_bracketed
+
+
+@dataclass
+class CapacityResult:
+    """
+    Résistance ultime d'une section
+
+    Attributes:
+        N: Effort normal du plan ultime (kN)
+        My: Moment résistant autour de y (kN·m)
+        Mz: Moment résistant autour de z (kN·m)
+        angle: Direction du côté comprimé (radians)
+        t: Paramètre de domaine du plan ultime
+        deformation: Plan de déformation [e0, χ_y, χ_z]
+        n_evaluations: Nombre d'intégrations des efforts
+        converged: True si la tolérance sur N est atteinte
+    """
+
+    N: float
+    My: float
+    Mz: float
+    angle: float
+    t: float
+    deformation: np.ndarray
+    n_evaluations: int
+    converged: bool
+
+    @property
+    def M(self) -> float:
+        """Norme du moment résistant (kN·m)"""
+        return float(np.hypot(self.My, self.Mz))
+
+    @property
+    def pivot(self) -> str:
+        """Pivot du plan ultime : "A" (acier), "B" (béton ε_cu2) ou "C" (compression)"""
+        if self.t <= 1.0:
+            return "A"
+        return "B" if self.t <= 2.0 else "C"
+
+
+def axial_resistance(
+    generator: StrainDomainGenerator, angle: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Efforts des plans ultimes extrêmes (traction pure et compression pure)
+
+    Args:
+        generator: Générateur de plans ultimes de la section
+        angle: Direction du côté comprimé (radians)
+
+    Returns:
+        (F_traction, F_compression) : [N, M_y, M_z] pour t = 0 et t = 3
+    """
+    F = generator.evaluate(np.array([0.0, 3.0]), angle)
+    return F[0], F[1]
+
+
+def compute_capacity(
+    solver: SectionSolver,
+    N: float,
+    angle: float = 0.0,
+    tolerance: float = 1e-6,
+    max_iter: int = 100,
+    generator: Optional[StrainDomainGenerator] = None,
+) -> CapacityResult:
+    """
+    Moment résistant ultime pour un effort normal N et une direction de flexion
+
+    Args:
+        solver: Solveur de la section
+        N: Effort normal (kN, compression positive)
+        angle: Direction du côté comprimé dans le plan (y, z), en radians
+            (0 : côté +y comprimé, moment M_z positif ; π/2 : côté +z
+            comprimé, moment M_y positif)
+        tolerance: Tolérance sur N, relative à l'étendue N_compression - N_traction
+        max_iter: Nombre maximal d'itérations de Brent
+        generator: Générateur de plans ultimes (réutilisé entre appels)
+
+    Returns:
+        CapacityResult
+
+    Raises:
+        ValueError: Si N sort de l'intervalle des résistances axiales
+    """
+    generator = generator or StrainDomainGenerator(solver)
+    F_tension, F_compression = axial_resistance(generator, angle)
+    N_min, N_max = float(F_tension[0]), float(F_compression[0])
+    if not N_min <= N <= N_max:
+        raise ValueError(
+            f"N = {N:.1f} kN hors des résistances axiales [{N_min:.1f}, {N_max:.1f}] kN"
+        )
+
+    # Efforts de chaque plan évalué, pour rendre ceux de la racine sans recalcul
+    forces: Dict[float, np.ndarray] = {0.0: F_tension, 3.0: F_compression}
+
+    def residual(t: float) -> float:
+        F, _ = solver.compute_internal_forces(generator.deformations(t, angle)[0], False)
+        forces[t] = F
+        return float(F[0]) - N
+
+    t, _, n_evaluations, converged = find_root_bracketed(
+        residual,
+        0.0,
+        3.0,
+        fa=N_min - N,
+        fb=N_max - N,
+        ftol=tolerance * (N_max - N_min),
+        max_iter=max_iter,
+    )
+    F = forces[t]
+
+    return CapacityResult(
+        N=float(F[0]),
+        My=float(F[1]),
+        Mz=float(F[2]),
+        angle=angle,
+        t=float(t),
+        deformation=generator.deformations(t, angle)[0],
+        n_evaluations=n_evaluations + 2,
+        converged=converged,
+    )
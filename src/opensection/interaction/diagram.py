@@ -2,47 +2,158 @@
 Diagrammes d'interaction N-M
 """
 
+from dataclasses import dataclass
 from typing import Tuple
 
 import numpy as np
 
+from opensection.interaction.capacity import CapacityResult, compute_capacity
+from opensection.interaction.strain_domains import StrainDomainGenerator
 from opensection.solver.section_solver import SectionSolver
 
 
+@dataclass
+class InteractionCurve:
+    """
+    Courbe N-M échantillonnée
+
+    Attributes:
+        M: Moments M_z (kN·m), de la compression pure à la traction pure
+        N: Efforts normaux (kN)
+        t: Paramètres de domaine des points (voir strain_domains)
+        n_evaluations: Nombre de plans de déformation évalués
+    """
+
+    M: np.ndarray
+    N: np.ndarray
+    t: np.ndarray
+    n_evaluations: int
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+
+def _chord_deviation(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Distance des points p (n, 2) aux cordes [a, b] (n, 2)"""
+    ab = b - a
+    length2 = np.einsum("ij,ij->i", ab, ab)
+    s = np.einsum("ij,ij->i", p - a, ab) / np.where(length2 > 0.0, length2, 1.0)
+    foot = a + np.clip(s, 0.0, 1.0)[:, None] * ab
+    return np.linalg.norm(p - foot, axis=1)
+
+
 class InteractionDiagram:
     """Génère des diagrammes d'interaction"""
 
     def __init__(self, solver: SectionSolver):
         self.solver = solver
+        self.domains = StrainDomainGenerator(solver)
 
     def compute_NM_curve(self, n_points: int = 50) -> Tuple[np.ndarray, np.ndarray]:
-        """Calcule la courbe N-M"""
-        M_vals = []
-        N_vals = []
-
-        # Compression pure à traction pure
-        props = self.solver.section.properties
-        area_total = props.area
-
-        # Estimer Nmax et Nmin
-        N_max = (
-            self.solver.concrete.fcd * area_total
-            + self.solver.rebars.total_area * self.solver.steel.fyd
+        """
+        Calcule la courbe N-M résistante (flexion autour de z, côté +y comprimé)
+
+        Les points sont les plans de déformation ultimes des pivots A, B et C
+        (voir strain_domains), évalués en un seul appel vectorisé, de la
+        compression pure (ε_c2 uniforme) à la traction pure (-ε_ud).
+
+        Args:
+            n_points: Nombre de points de la courbe
+
+        Returns:
+            (M_z, N) en kN·m et kN
+        """
+        t = np.linspace(3.0, 0.0, n_points)
+        F = self.domains.evaluate(t, angle=0.0)
+        return F[:, 2], F[:, 0]
+
+    def capacity(self, N: float, angle: float = 0.0, tolerance: float = 1e-6) -> CapacityResult:
+        """
+        Moment résistant ultime M_Rd sous l'effort normal N (voir compute_capacity)
+
+        Args:
+            N: Effort normal (kN, compression positive)
+            angle: Direction du côté comprimé (radians, 0 : M_z positif)
+            tolerance: Tolérance relative sur N
+
+        Returns:
+            CapacityResult
+        """
+        return compute_capacity(self.solver, N, angle, tolerance, generator=self.domains)
+
+    def compute_NM_curve_adaptive(
+        self,
+        tolerance: float = 1e-3,
+        n_initial: int = 13,
+        max_evaluations: int = 2000,
+    ) -> InteractionCurve:
+        """
+        Courbe N-M échantillonnée selon sa courbure
+
+        Partant d'une grille uniforme en t, chaque intervalle est coupé en son
+        milieu ; si le milieu s'écarte de la corde de plus de la moitié de la
+        tolérance, ou la partage très inégalement, les deux moitiés sont à
+        leur tour testées. Les points se concentrent ainsi au coude du point
+        d'équilibre et non sur les parties rectilignes. Les milieux d'un même
+        niveau sont évalués en un seul appel vectorisé.
+
+        Les écarts sont mesurés dans le plan normé (M / étendue de M,
+        N / étendue de N) de la grille initiale.
+
+        Args:
+            tolerance: Écart maximal relatif entre la courbe et ses cordes
+            n_initial: Nombre de points initiaux sur [0, 3] (13 : les limites
+                de pivots t = 1 et t = 2 en font partie)
+            max_evaluations: Nombre maximal d'évaluations
+
+        Returns:
+            InteractionCurve (compression pure en premier, comme compute_NM_curve)
+        """
+        if tolerance <= 0:
+            raise ValueError("tolerance doit être > 0")
+        if n_initial < 2:
+            raise ValueError("n_initial doit être >= 2")
+
+        t = np.linspace(0.0, 3.0, n_initial)
+        points = self.domains.evaluate(t)[:, [2, 0]]
+        n_evaluations = len(t)
+
+        scale = np.ptp(points, axis=0)
+        scale[scale == 0.0] = 1.0
+
+        active = np.ones(len(t) - 1, dtype=bool)
+        while active.any() and n_evaluations < max_evaluations:
+            tested = np.flatnonzero(active)[: max_evaluations - n_evaluations]
+            t_mid = 0.5 * (t[tested] + t[tested + 1])
+            p_mid = self.domains.evaluate(t_mid)[:, [2, 0]]
+            n_evaluations += len(tested)
+
+            a, b, m = points[tested] / scale, points[tested + 1] / scale, p_mid / scale
+            deviation = _chord_deviation(m, a, b)
+
+            # Un milieu très excentré sur la corde signale un paramétrage non
+            # uniforme (fin du pivot A) qui peut masquer un coude : on continue
+            halves = np.column_stack([np.linalg.norm(m - a, axis=1), np.linalg.norm(b - m, axis=1)])
+            balanced = (halves.min(axis=1) >= 0.25 * halves.max(axis=1)) | (
+                halves.sum(axis=1) <= tolerance
+            )
+            # Seuil à la moitié de la tolérance : pour un coude (plastification
+            # d'un acier), l'écart au milieu vaut au moins la moitié de l'écart maximal
+            refine = (deviation > 0.5 * tolerance) | ~balanced
+
+            split = np.zeros(len(t) - 1, dtype=bool)
+            split[tested] = True
+            first_child = (np.arange(len(split)) + np.cumsum(split) - split)[tested[refine]]
+
+            t = np.insert(t, tested + 1, t_mid)
+            points = np.insert(points, tested + 1, p_mid, axis=0)
+            active = np.zeros(len(t) - 1, dtype=bool)
+            active[first_child] = True
+            active[first_child + 1] = True
+
+        return InteractionCurve(
+            M=points[::-1, 0].copy(),
+            N=points[::-1, 1].copy(),
+            t=t[::-1].copy(),
+            n_evaluations=n_evaluations,
         )
-        N_min = -self.solver.rebars.total_area * self.solver.steel.fyd
-
-        N_range = np.linspace(N_max / 1000, N_min / 1000, n_points)  # kN
-
-        for N in N_range:
-            # Résoudre pour différentes courbures
-            for chi in np.linspace(0, 0.01, 20):
-                try:
-                    result = self.solver.solve(N=N, My=0, Mz=chi * 1000)
-                    if result.converged:
-                        M_vals.append(result.Mz)
-                        N_vals.append(result.N)
-                        break
-                except Exception:
-                    continue
-
-        return np.array(M_vals), np.array(N_vals)
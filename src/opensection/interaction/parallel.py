@@ -0,0 +1,137 @@
+"""
+Génération parallèle des diagrammes d'interaction (pools de processus)
+
+Chaque tâche évalue les plans ultimes d'une section (ou d'un groupe de
+directions d'une section) en un appel vectorisé ; les tâches sont réparties
+sur un exécuteur concurrent.futures. Les solveurs sont transmis sous leur
+forme sérialisée allégée (maillage et armatures, voir
+SectionSolver.__getstate__) et les résultats sont rendus dans l'ordre des
+entrées, quel que soit l'ordre de fin des tâches.
+"""
+
+import math
+import os
+from concurrent.futures import Executor
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from opensection.interaction.strain_domains import StrainDomainGenerator
+from opensection.solver.section_solver import SectionSolver
+
+# Nombre de lots par processus (équilibrage de charge entre sections inégales)
+_CHUNKS_PER_WORKER = 4
+
+
+def _curve_task(task: Tuple[SectionSolver, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Courbe N-M d'une section (exécutée dans un processus du pool)"""
+    solver, n_points = task
+    F = StrainDomainGenerator(solver).evaluate(np.linspace(3.0, 0.0, n_points), angle=0.0)
+    return F[:, 2], F[:, 0]
+
+
+def _planes_task(task: Tuple[SectionSolver, np.ndarray, np.ndarray]) -> np.ndarray:
+    """Efforts ultimes [N, M_y, M_z] d'un groupe de directions, à la suite"""
+    solver, t, angles = task
+    generator = StrainDomainGenerator(solver)
+    D = np.vstack([generator.deformations(t, angle) for angle in angles])
+    F, _ = solver.compute_internal_forces_batch(D, with_tangent=False)
+    return F
+
+
+def map_ordered(
+    func: Callable,
+    tasks: Sequence,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List:
+    """
+    Applique func aux tâches sur un exécuteur, résultats dans l'ordre des tâches
+
+    Args:
+        func: Fonction de niveau module (sérialisable)
+        tasks: Arguments de chaque appel
+        executor: Exécuteur à utiliser (non fermé) ; par défaut un
+            ProcessPoolExecutor de max_workers processus, fermé à la fin
+        max_workers: Nombre de processus (défaut : nombre de cœurs) ; 1 exécute
+            en série dans le processus courant. Avec un exécuteur fourni, nombre
+            de ses processus, pour le découpage en lots (sa taille n'est pas lue)
+        chunksize: Tâches par envoi au pool (défaut : environ 4 lots par processus)
+
+    Returns:
+        Liste des résultats
+    """
+    tasks = list(tasks)
+    if executor is None and (max_workers == 1 or len(tasks) <= 1):
+        return [func(task) for task in tasks]
+
+    workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(tasks) / (_CHUNKS_PER_WORKER * workers)))
+
+    if executor is not None:
+        return list(executor.map(func, tasks, chunksize=chunksize))
+
+    # Import différé : multiprocessing n'est chargé que si un pool est créé
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, tasks, chunksize=chunksize))
+
+
+def compute_NM_curves(
+    solvers: Iterable[SectionSolver],
+    n_points: int = 50,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Courbes N-M de plusieurs sections, réparties sur un pool de processus
+
+    Équivalent à [InteractionDiagram(s).compute_NM_curve(n_points) for s in solvers],
+    avec des résultats identiques et dans le même ordre.
+
+    Args:
+        solvers: Solveurs des sections (types de poteaux)
+        n_points: Nombre de points par courbe
+        executor: Exécuteur à utiliser (voir map_ordered)
+        max_workers: Nombre de processus (1 : exécution en série)
+        chunksize: Sections par envoi au pool
+
+    Returns:
+        Liste des (M_z, N) en kN·m et kN
+    """
+    tasks = [(solver, n_points) for solver in solvers]
+    return map_ordered(_curve_task, tasks, executor, max_workers, chunksize)
+
+
+def evaluate_ultimate_planes(
+    solver: SectionSolver,
+    t: np.ndarray,
+    angles: np.ndarray,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    n_chunks: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Efforts ultimes d'une section pour toutes les directions, par lots de directions
+
+    Args:
+        solver: Solveur de la section
+        t: Paramètres de domaine (n_t)
+        angles: Directions du côté comprimé (n_angles)
+        executor: Exécuteur à utiliser (voir map_ordered)
+        max_workers: Nombre de processus (1 : exécution en série)
+        n_chunks: Nombre de lots de directions (défaut : un par processus)
+
+    Returns:
+        Tableau (n_angles * n_t, 3) [N, M_y, M_z], direction par direction
+    """
+    angles = np.asarray(angles, dtype=float)
+    if n_chunks is None:
+        n_chunks = max_workers or os.cpu_count() or 1
+    chunks = np.array_split(angles, min(max(1, n_chunks), len(angles)))
+    tasks = [(solver, np.atleast_1d(t), chunk) for chunk in chunks]
+    return np.vstack(map_ordered(_planes_task, tasks, executor, max_workers, chunksize=1))
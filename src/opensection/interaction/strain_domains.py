@@ -0,0 +1,252 @@
+"""
+Domaines de déformation ultimes de l'EC2 (pivots A, B, C)
+
+Une courbe d'interaction à l'ELU est décrite directement par les plans de
+déformation ultimes, sans résoudre F(d) = S point par point. Pour une
+direction de flexion donnée, u désigne la coordonnée selon le côté comprimé
+(fibre supérieure en u_max) ; le plan est paramétré par t ∈ [0, 3] :
+
+- t ∈ [0, 1] pivot A : acier le plus tendu à -ε_ud, la fibre supérieure
+  passe de -ε_ud (traction pure) à ε_cu2 ;
+- t ∈ [1, 2] pivot B : fibre supérieure à ε_cu2, l'axe neutre descend de
+  x_AB = d·ε_cu2 / (ε_cu2 + ε_ud) jusqu'à la fibre inférieure (x = h) ;
+- t ∈ [2, 3] pivot C : le plan pivote autour du point de profondeur
+  (1 - ε_c2/ε_cu2)·h à ε_c2, jusqu'à la compression uniforme ε_c2.
+
+Convention : déformations positives en compression (comme le solveur). Les
+limites ε_cu2 et ε_ud sont réduites d'une marge relative de 1e-9 pour que les
+arrondis ne placent aucun point au-delà de la rupture des lois.
+
+Pour une section, chaque armature a sa propre limite d'allongement (ε_ud
+de son acier moins sa prédéformation, pour les torons) et chaque point du
+béton l'ε_cu2 de sa zone (SectionSolver.strain_limits) : les pivots A et B
+sont portés par le point qui atteint le premier sa limite, qui peut changer
+avec la courbure, et le pivot C est appliqué à chaque béton depuis sa fibre
+la plus comprimée. StrainDomainGenerator construit les plans à partir de ces limites
+ponctuelles (voir ultimate_planes_from_limits) ; ultimate_strain_planes en
+est le cas particulier d'un seul béton et d'une seule barre déterminante.
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+
+from opensection.solver.section_solver import SectionSolver
+
+# Marge relative sur les déformations limites (évite la branche de rupture)
+_LIMIT_MARGIN = 1e-9
+
+
+def ultimate_strain_planes(
+    t: np.ndarray,
+    h: float,
+    d: float,
+    epsilon_cu2: float,
+    epsilon_c2: float,
+    epsilon_ud: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Plans de déformation ultimes en fonction du paramètre de domaine t
+
+    Les profondeurs s sont mesurées depuis la fibre la plus comprimée : la
+    déformation vaut ε(s) = ε_sup - κ·s.
+
+    Args:
+        t: Paramètres de domaine dans [0, 3]
+        h: Hauteur de béton selon la direction de flexion (m)
+        d: Profondeur de l'acier le plus tendu (m), 0 < d ≤ h
+        epsilon_cu2: Déformation ultime du béton
+        epsilon_c2: Déformation au pic du béton
+        epsilon_ud: Déformation ultime de calcul de l'acier
+
+    Returns:
+        (ε_sup, κ) : déformation de la fibre supérieure et courbure (1/m)
+    """
+    t = np.clip(np.asarray(t, dtype=float), 0.0, 3.0)
+    eps_cu = epsilon_cu2 * (1.0 - _LIMIT_MARGIN)
+    eps_ud = epsilon_ud * (1.0 - _LIMIT_MARGIN)
+
+    eps_top = np.empty_like(t)
+    kappa = np.empty_like(t)
+
+    # Pivot A : acier à -ε_ud, fibre supérieure de -ε_ud à ε_cu2
+    a = t <= 1.0
+    eps_top[a] = -eps_ud + t[a] * (eps_ud + eps_cu)
+    kappa[a] = (eps_top[a] + eps_ud) / d
+
+    # Pivot B : fibre supérieure à ε_cu2, axe neutre de x_AB à h
+    b = (t > 1.0) & (t <= 2.0)
+    x_ab = d * eps_cu / (eps_cu + eps_ud)
+    x = x_ab + (t[b] - 1.0) * (h - x_ab)
+    eps_top[b] = eps_cu
+    kappa[b] = eps_cu / x
+
+    # Pivot C : rotation autour de (s_C, ε_c2), fibre inférieure de 0 à ε_c2
+    c = t > 2.0
+    s_c = (1.0 - epsilon_c2 / epsilon_cu2) * h
+    eps_bottom = (t[c] - 2.0) * epsilon_c2
+    kappa[c] = (epsilon_c2 - eps_bottom) / (h - s_c)
+    eps_top[c] = eps_bottom + kappa[c] * h
+
+    return eps_top, kappa
+
+
+def ultimate_planes_from_limits(
+    t: np.ndarray,
+    u_bottom: float,
+    upper: Tuple[np.ndarray, np.ndarray],
+    lower: Tuple[np.ndarray, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Plans ultimes définis par des limites ponctuelles de déformation
+
+    Le plan ε(u) = e0 + κ·u (κ ≥ 0, u selon le côté comprimé) est admissible
+    si ε(u_k) ≤ a_k aux points limités en compression (sommets du béton à
+    ε_cu2, points de pivot C à ε_c2) et ε(u_i) ≥ -b_i aux armatures. À κ
+    fixé, e0 est donc compris entre lo(κ) = max(-b_i - κ·u_i) et
+    hi(κ) = min(a_k - κ·u_k). Les plans ultimes parcourent ce bord :
+
+    - t ∈ [0, 1] pivot A : e0 = lo(κ), κ = t·κ_AB, où κ_AB est la courbure
+      à laquelle lo et hi se rejoignent ;
+    - t ∈ [1, 2] pivot B : e0 = hi(κ), 1/κ interpolé linéairement de 1/κ_AB
+      à 1/κ_BC (axe neutre linéaire en t pour un seul béton) ;
+    - t ∈ [2, 3] pivot C : e0 = hi(κ), κ = (3 - t)·κ_BC, où κ_BC est la
+      courbure à laquelle la fibre de béton inférieure u_bottom s'annule.
+
+    Avec un sommet supérieur à ε_cu2, le point de pivot C et une armature,
+    on retrouve exactement ultimate_strain_planes.
+
+    Args:
+        t: Paramètres de domaine dans [0, 3]
+        u_bottom: Coordonnée de la fibre de béton la moins comprimée
+        upper: (u_k, a_k) des limites en compression
+        lower: (u_i, b_i) des limites en traction (allongements admissibles)
+
+    Returns:
+        (e0, κ) : déformation en u = 0 et courbure (1/m)
+    """
+    t = np.clip(np.asarray(t, dtype=float), 0.0, 3.0)
+    u_up, a = upper
+    u_lo, b = lower
+
+    # Plus petite courbure où une limite de chaque type est atteinte
+    du = u_up[:, None] - u_lo[None, :]
+    positive = du > 0.0
+    kappa_ab = float(np.min((a[:, None] + b[None, :])[positive] / du[positive]))
+    # Les fonctions a_k - κ·(u_k - u_bottom) décroissent : le minimum s'annule
+    # à la plus petite de leurs racines
+    above = u_up > u_bottom
+    kappa_bc = min(float(np.min(a[above] / (u_up[above] - u_bottom))), kappa_ab)
+
+    kappa = np.empty_like(t)
+    a_dom = t <= 1.0
+    b_dom = (t > 1.0) & (t <= 2.0)
+    c_dom = t > 2.0
+    kappa[a_dom] = t[a_dom] * kappa_ab
+    kappa[b_dom] = 1.0 / (1.0 / kappa_ab + (t[b_dom] - 1.0) * (1.0 / kappa_bc - 1.0 / kappa_ab))
+    kappa[c_dom] = (3.0 - t[c_dom]) * kappa_bc
+
+    lo = np.max(-b[None, :] - kappa[:, None] * u_lo[None, :], axis=1)
+    hi = np.min(a[None, :] - kappa[:, None] * u_up[None, :], axis=1)
+    return np.where(a_dom, lo, hi), kappa
+
+
+class StrainDomainGenerator:
+    """
+    Génère les efforts résistants ultimes d'une section par domaines de déformation
+
+    Toutes les déformations ultimes d'une direction de flexion sont évaluées
+    en un seul appel vectorisé (SectionSolver.compute_internal_forces_batch).
+    """
+
+    def __init__(self, solver: SectionSolver):
+        """
+        Args:
+            solver: Solveur de la section (géométrie, matériaux, armatures)
+        """
+        self.solver = solver
+        limits = solver.strain_limits()
+        self._vertices = limits.concrete_points
+        self._epsilon_cu2 = limits.epsilon_cu2
+        self._rebars = limits.rebar_points
+        self._elongation_limits = limits.elongation
+        # Points de chaque béton (ε_c2, ε_cu2), pour son pivot C
+        concretes, index = np.unique(
+            np.column_stack([limits.epsilon_c2, limits.epsilon_cu2]), axis=0, return_inverse=True
+        )
+        index = np.ravel(index)
+        self._concretes = [(c2, cu2, index == i) for i, (c2, cu2) in enumerate(concretes)]
+
+    def extent(self, angle: float = 0.0) -> Tuple[float, float, float]:
+        """
+        Position des fibres extrêmes selon la direction comprimée
+
+        Args:
+            angle: Direction du côté comprimé dans le plan (y, z), en radians
+                (0 : côté +y comprimé, moment M_z positif)
+
+        Returns:
+            (u_max, h, d) : coordonnée de la fibre la plus comprimée, hauteur de
+            béton et profondeur de l'acier le plus tendu (h si pas d'acier)
+        """
+        direction = np.array([np.cos(angle), np.sin(angle)])
+        u_concrete = self._vertices @ direction
+        u_max = float(u_concrete.max())
+        h = u_max - float(u_concrete.min())
+        d = h
+        if len(self._rebars) > 0:
+            d = u_max - float((self._rebars @ direction).min())
+        return u_max, h, d
+
+    def deformations(self, t: Union[float, np.ndarray], angle: float = 0.0) -> np.ndarray:
+        """
+        Vecteurs de déformation [e0, χ_y, χ_z] des plans ultimes
+
+        Args:
+            t: Paramètre(s) de domaine dans [0, 3]
+            angle: Direction du côté comprimé (radians)
+
+        Returns:
+            Tableau (n, 3), (1, 3) pour un paramètre scalaire
+        """
+        direction = np.array([np.cos(angle), np.sin(angle)])
+        u_max, h, _ = self.extent(angle)
+        margin = 1.0 - _LIMIT_MARGIN
+
+        # Points du béton à leur ε_cu2 et, pour chaque béton, point du pivot C
+        # à ε_c2, à la profondeur (1 - ε_c2/ε_cu2)·h sous la fibre supérieure de
+        # ce béton (h : hauteur de la section, le pivot C s'applique lorsque toute
+        # la section est comprimée)
+        u_concrete = self._vertices @ direction
+        u_pivot, eps_pivot = [], []
+        for epsilon_c2, epsilon_cu2, mask in self._concretes:
+            u_pivot.append(u_concrete[mask].max() - (1.0 - epsilon_c2 / epsilon_cu2) * h)
+            eps_pivot.append(epsilon_c2)
+        upper = (
+            np.concatenate([u_concrete, u_pivot]),
+            np.concatenate([self._epsilon_cu2 * margin, eps_pivot]),
+        )
+        # Chaque barre à sa limite (sans armatures : fibre inférieure à -ε_ud)
+        if len(self._rebars) > 0:
+            lower = (self._rebars @ direction, self._elongation_limits * margin)
+        else:
+            lower = (np.array([u_max - h]), np.array([self.solver.steel.epsilon_ud * margin]))
+
+        e0, kappa = ultimate_planes_from_limits(np.atleast_1d(t), u_max - h, upper, lower)
+        return np.column_stack([e0, kappa * direction[0], kappa * direction[1]])
+
+    def evaluate(self, t: np.ndarray, angle: float = 0.0) -> np.ndarray:
+        """
+        Efforts résistants [N, M_y, M_z] (kN, kN·m) des plans ultimes
+
+        Args:
+            t: Paramètres de domaine dans [0, 3]
+            angle: Direction du côté comprimé (radians)
+
+        Returns:
+            Tableau (n, 3)
+        """
+        F, _ = self.solver.compute_internal_forces_batch(
+            self.deformations(t, angle), with_tangent=False
+        )
+        return F
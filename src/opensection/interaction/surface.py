@@ -0,0 +1,409 @@
+"""
+Surface d'interaction N-M_y-M_z (flexion déviée composée)
+
+La surface de rupture est balayée par les plans de déformation ultimes
+(voir strain_domains) : pour chaque direction du côté comprimé (angle de
+l'axe neutre) et chaque paramètre de domaine t (profondeur de l'axe neutre),
+les efforts résistants [N, M_y, M_z] forment un sommet. Tous les plans sont
+évalués en un seul appel vectorisé du solveur, puis la grille (angle, t) est
+triangulée ; les pôles t = 0 (traction pure) et t = 3 (compression pure) sont
+communs à toutes les directions.
+
+La vérification d'un cas de charge S = (N, M_y, M_z) lance un rayon depuis
+l'origine dans la direction de S : le facteur de charge λ est tel que λ·S
+atteint la surface (λ ≥ 1 : section résistante).
+"""
+
+from concurrent.futures import Executor
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from opensection.interaction.parallel import evaluate_ultimate_planes
+from opensection.interaction.strain_domains import StrainDomainGenerator
+from opensection.solver.section_solver import SectionSolver
+
+# Nombre maximal d'éléments (cas x triangles) traités par bloc dans le lancer de rayons
+_RAY_BLOCK = 1 << 18
+
+# Tolérance barycentrique aux arêtes communes de deux triangles
+_EDGE_TOL = 1e-9
+
+# Demi-largeur minimale de la bande de taux d'utilisation autour de 1 dans
+# laquelle CapacityIndex recalcule λ par lancer de rayon exact
+_EXACT_BAND = 0.03
+
+
+def _as_loads(loads: np.ndarray) -> Tuple[np.ndarray, bool]:
+    """Cas de charge en tableau (n, 3) et indicateur de cas unique"""
+    S = np.asarray(loads, dtype=float)
+    single = S.ndim == 1
+    S = np.atleast_2d(S)
+    if S.ndim != 2 or S.shape[1] != 3:
+        raise ValueError("loads doit être de forme (3,) ou (n, 3) : [N, M_y, M_z]")
+    return S, single
+
+
+class InteractionSurface:
+    """
+    Surface de rupture triangulée dans l'espace (N, M_y, M_z)
+
+    Attributes:
+        angles: Directions du côté comprimé (radians), n_angles
+        t: Paramètres de domaine de la grille, n_depths (pôles inclus)
+        vertices: Sommets [N, M_y, M_z] (kN, kN·m) ; 0 : traction pure,
+            1 : compression pure, puis la grille angle x t intérieure
+        triangles: Indices des sommets de chaque triangle (n_triangles, 3)
+    """
+
+    def __init__(
+        self,
+        solver: SectionSolver,
+        n_angles: int = 36,
+        n_depths: int = 48,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            solver: Solveur de la section
+            n_angles: Nombre de directions de l'axe neutre sur [0, 2π)
+            n_depths: Nombre de valeurs de t sur [0, 3], pôles compris
+            executor: Exécuteur (ex. ProcessPoolExecutor) sur lequel répartir
+                les directions par lots ; None pour un seul appel vectorisé
+            max_workers: Nombre de processus de l'exécuteur, un lot de
+                directions par processus (défaut : nombre de cœurs)
+        """
+        if n_angles < 3 or n_depths < 3:
+            raise ValueError("n_angles et n_depths doivent être >= 3")
+
+        self.solver = solver
+        self.generator = StrainDomainGenerator(solver)
+        self.angles = np.linspace(0.0, 2.0 * np.pi, n_angles, endpoint=False)
+        self.t = np.linspace(0.0, 3.0, n_depths)
+
+        # Tous les plans ultimes : pôles puis grille intérieure, un seul appel
+        if executor is None:
+            planes = [self.generator.deformations(self.t[[0, -1]])]
+            planes += [self.generator.deformations(self.t[1:-1], angle) for angle in self.angles]
+            self.vertices, _ = solver.compute_internal_forces_batch(
+                np.vstack(planes), with_tangent=False
+            )
+        else:
+            grid = evaluate_ultimate_planes(
+                solver, self.t[1:-1], self.angles, executor, max_workers
+            )
+            self.vertices = np.vstack([self.generator.evaluate(self.t[[0, -1]]), grid])
+        self.triangles = self._triangulate(n_angles, n_depths - 2)
+
+        # Données du lancer de rayons (Möller-Trumbore) : sommet 0 et arêtes
+        corners = self.vertices[self.triangles]
+        self._v0 = corners[:, 0]
+        self._e1 = corners[:, 1] - corners[:, 0]
+        self._e2 = corners[:, 2] - corners[:, 0]
+
+    @staticmethod
+    def _triangulate(n_angles: int, n_inner: int) -> np.ndarray:
+        """Triangles de la grille (angle périodique x t) fermée par les deux pôles"""
+        i = np.arange(n_angles)[:, None]
+        i_next = (i + 1) % n_angles
+        index = lambda a, j: 2 + a * n_inner + j  # noqa: E731
+
+        j = np.arange(n_inner - 1)[None, :]
+        quads_lower = np.stack(
+            np.broadcast_arrays(index(i, j), index(i_next, j), index(i_next, j + 1)), axis=-1
+        )
+        quads_upper = np.stack(
+            np.broadcast_arrays(index(i, j), index(i_next, j + 1), index(i, j + 1)), axis=-1
+        )
+        tension_fan = np.column_stack(
+            [np.zeros(n_angles, dtype=int), index(i_next, 0)[:, 0], index(i, 0)[:, 0]]
+        )
+        compression_fan = np.column_stack(
+            [
+                np.ones(n_angles, dtype=int),
+                index(i, n_inner - 1)[:, 0],
+                index(i_next, n_inner - 1)[:, 0],
+            ]
+        )
+        return np.vstack(
+            [
+                tension_fan,
+                quads_lower.reshape(-1, 3),
+                quads_upper.reshape(-1, 3),
+                compression_fan,
+            ]
+        )
+
+    def load_factor(self, loads: np.ndarray) -> Union[float, np.ndarray]:
+        """
+        Facteur de charge λ tel que λ·S atteint la surface de rupture
+
+        Le rayon issu de l'origine dans la direction de S est intersecté avec
+        tous les triangles (vectorisé) ; la plus petite intersection positive
+        est retenue.
+
+        Args:
+            loads: Cas de charge [N, M_y, M_z] (3,) ou (n, 3)
+
+        Returns:
+            λ (float ou tableau (n,)) ; inf si le rayon ne rencontre pas la surface
+        """
+        S, single = _as_loads(loads)
+
+        factors = np.full(len(S), np.inf)
+        rows = max(1, _RAY_BLOCK // len(self._v0))
+        for start in range(0, len(S), rows):
+            block = slice(start, start + rows)
+            factors[block] = self._ray_hits(S[block]).min(axis=1)
+
+        return float(factors[0]) if single else factors
+
+    def _ray_hits(self, S: np.ndarray, triangles: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Möller-Trumbore, rayons (m, 3) depuis l'origine contre les triangles
+
+        Args:
+            S: Directions des rayons (m, 3)
+            triangles: Indices des triangles testés (tous par défaut)
+
+        Returns:
+            Paramètres λ des intersections (m, n_triangles), inf hors triangle
+        """
+        v0, e1, e2 = self._v0, self._e1, self._e2
+        if triangles is not None:
+            v0, e1, e2 = v0[triangles], e1[triangles], e2[triangles]
+
+        p = np.cross(S[:, None, :], e2[None, :, :])
+        det = np.einsum("tk,mtk->mt", e1, p)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_det = 1.0 / det
+            s = -v0
+            u = np.einsum("tk,mtk->mt", s, p) * inv_det
+            q = np.cross(s, e1)
+            v = np.einsum("mk,tk->mt", S, q) * inv_det
+            lam = np.einsum("tk,tk->t", e2, q)[None, :] * inv_det
+            hit = (
+                np.isfinite(lam)
+                & (lam > 0.0)
+                & (u >= -_EDGE_TOL)
+                & (v >= -_EDGE_TOL)
+                & (u + v <= 1.0 + _EDGE_TOL)
+            )
+        return np.where(hit, lam, np.inf)
+
+    def utilization(self, loads: np.ndarray) -> Union[float, np.ndarray]:
+        """
+        Taux d'utilisation 1/λ (≤ 1 : section résistante)
+
+        Args:
+            loads: Cas de charge [N, M_y, M_z] (3,) ou (n, 3)
+
+        Returns:
+            Taux d'utilisation (0 pour une charge nulle)
+        """
+        factor = self.load_factor(loads)
+        with np.errstate(divide="ignore"):
+            return 1.0 / factor
+
+    def is_safe(self, loads: np.ndarray) -> Union[bool, np.ndarray]:
+        """Teste si les cas de charge sont à l'intérieur de la surface (λ ≥ 1)"""
+        factor = self.load_factor(loads)
+        return factor >= 1.0
+
+    def capacity_index(self, n_azimuth: int = 144, n_elevation: int = 73) -> "CapacityIndex":
+        """Index de la surface pour les requêtes en grand nombre (voir CapacityIndex)"""
+        return CapacityIndex(self, n_azimuth, n_elevation)
+
+
+class CapacityIndex:
+    """
+    Index de la surface de rupture pour le taux d'utilisation de millions de cas
+
+    La surface, étoilée par rapport à l'origine, est décrite par son rayon
+    dans chaque direction. Dans l'espace normé (N, M_y, M_z divisés par leurs
+    valeurs extrêmes sur la surface), les directions sont repérées par un
+    azimut ψ dans le plan (M_y, M_z) et une élévation β vers l'axe N. Le rayon
+    est tabulé une fois sur une grille (β, ψ) par lancer de rayons, chaque
+    ligne de la grille ne testant que les triangles de sa bande d'élévation.
+    Une requête se réduit à une interpolation bilinéaire dans la table :
+    λ = R(β, ψ) / |S|, sans boucle Python par cas.
+
+    L'interpolation n'est pas conservative : entre les nœuds, elle surestime
+    λ aussi souvent qu'elle le sous-estime. L'écart relatif est mesuré à la
+    construction au centre de chaque maille (tolerance), et les cas dont le
+    taux d'utilisation interpolé est à moins de band de 1 sont recalculés par
+    lancer de rayon exact (InteractionSurface.load_factor) : près de la
+    surface, λ et is_safe sont ceux de la surface triangulée.
+
+    Attributes:
+        surface: Surface de rupture indexée
+        scale: Facteurs de normalisation [N, M_y, M_z]
+        elevations: Élévations de la grille, de -π/2 à π/2 (n_elevation)
+        radii: Rayons normés (n_elevation, n_azimuth + 1), la dernière
+            colonne répète la première (ψ = 2π)
+        tolerance: Écart relatif maximal de l'interpolation au centre des mailles
+        band: Demi-largeur de la bande de recalcul exact autour de 1,
+            max(0.03, 2·tolerance)
+    """
+
+    def __init__(self, surface: InteractionSurface, n_azimuth: int = 144, n_elevation: int = 73):
+        """
+        Args:
+            surface: Surface de rupture triangulée
+            n_azimuth: Nombre d'azimuts sur [0, 2π)
+            n_elevation: Nombre d'élévations sur [-π/2, π/2], extrémités comprises
+        """
+        if n_azimuth < 3 or n_elevation < 3:
+            raise ValueError("n_azimuth et n_elevation doivent être >= 3")
+
+        self.surface = surface
+        scale = np.abs(surface.vertices).max(axis=0)
+        self.scale = np.where(scale > 0.0, scale, 1.0)
+        self.elevations = np.linspace(-0.5 * np.pi, 0.5 * np.pi, n_elevation)
+        self._azimuth_step = 2.0 * np.pi / n_azimuth
+        self._elevation_step = np.pi / (n_elevation - 1)
+
+        azimuths = np.arange(n_azimuth) * self._azimuth_step
+        bands = self._elevation_bands(surface)
+        self._bands = bands
+        radii = np.empty((n_elevation, n_azimuth + 1))
+        radii[:, :-1] = self._tabulate(self.elevations, azimuths, bands)
+        radii[:, -1] = radii[:, 0]
+        self.radii = radii
+
+        # Écart de l'interpolation bilinéaire (moyenne des quatre nœuds) au
+        # centre de chaque maille
+        centers = self._tabulate(
+            self.elevations[:-1] + 0.5 * self._elevation_step,
+            azimuths + 0.5 * self._azimuth_step,
+            bands,
+        )
+        interpolated = 0.25 * (radii[:-1, :-1] + radii[:-1, 1:] + radii[1:, :-1] + radii[1:, 1:])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            deviation = np.abs(interpolated / centers - 1.0)
+        self.tolerance = float(np.max(deviation[np.isfinite(deviation)], initial=0.0))
+        self.band = max(_EXACT_BAND, 2.0 * self.tolerance)
+
+    def _tabulate(
+        self,
+        elevations: np.ndarray,
+        azimuths: np.ndarray,
+        bands: Tuple[np.ndarray, np.ndarray],
+    ) -> np.ndarray:
+        """Rayons normés de la surface aux directions (β, ψ) d'une grille"""
+        low, high = bands
+        radii = np.empty((len(elevations), len(azimuths)))
+        for row, beta in enumerate(elevations):
+            candidates = np.flatnonzero((low <= beta) & (high >= beta))
+            unit = np.column_stack(
+                [
+                    np.full(len(azimuths), np.sin(beta)),
+                    np.cos(beta) * np.cos(azimuths),
+                    np.cos(beta) * np.sin(azimuths),
+                ]
+            )
+            radii[row] = self.surface._ray_hits(unit * self.scale, candidates).min(axis=1)
+        return radii
+
+    def _elevation_bands(self, surface: InteractionSurface) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Plage d'élévation [β_min, β_max] couverte par chaque triangle (normé)
+
+        Les arcs entre sommets peuvent dépasser l'élévation des sommets : la
+        plage est élargie de la demi-ouverture angulaire du triangle. Les
+        triangles traversés par l'axe ±N sont étendus jusqu'au pôle.
+        """
+        unit = surface.vertices / self.scale
+        unit /= np.linalg.norm(unit, axis=1)[:, None]
+        corners = unit[surface.triangles]
+        beta = np.arcsin(np.clip(corners[:, :, 0], -1.0, 1.0))
+
+        cosines = np.einsum("tik,tjk->tij", corners, corners)
+        pad = 0.5 * np.arccos(np.clip(cosines.min(axis=(1, 2)), -1.0, 1.0))
+        low = beta.min(axis=1) - pad
+        high = beta.max(axis=1) + pad
+
+        axis = np.array([[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0]]) * self.scale
+        axis_hits = np.isfinite(surface._ray_hits(axis))
+        high[axis_hits[0]] = 0.5 * np.pi
+        low[axis_hits[1]] = -0.5 * np.pi
+        return low, high
+
+    def load_factor(self, loads: np.ndarray) -> Union[float, np.ndarray]:
+        """
+        Facteur de charge λ tel que λ·S atteint la surface
+
+        Interpolé dans la table, puis recalculé exactement pour les cas dont le
+        taux d'utilisation 1/λ est à moins de band de 1.
+
+        Args:
+            loads: Cas de charge [N, M_y, M_z] (3,) ou (n, 3)
+
+        Returns:
+            λ (float ou tableau (n,)) ; inf pour une charge nulle
+        """
+        loads, single = _as_loads(loads)
+        S = loads / self.scale
+        r = np.sqrt(np.einsum("mk,mk->m", S, S))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            beta = np.arcsin(np.clip(S[:, 0] / r, -1.0, 1.0))
+        beta = np.nan_to_num(beta)
+        psi = np.mod(np.arctan2(S[:, 2], S[:, 1]), 2.0 * np.pi)
+
+        n_elevation, n_columns = self.radii.shape
+        fi = (beta + 0.5 * np.pi) / self._elevation_step
+        fj = psi / self._azimuth_step
+        i = np.clip(fi.astype(int), 0, n_elevation - 2)
+        j = np.clip(fj.astype(int), 0, n_columns - 2)
+        wi = fi - i
+        wj = fj - j
+
+        R = self.radii
+        radius = (1.0 - wi) * ((1.0 - wj) * R[i, j] + wj * R[i, j + 1]) + wi * (
+            (1.0 - wj) * R[i + 1, j] + wj * R[i + 1, j + 1]
+        )
+        with np.errstate(divide="ignore"):
+            factors = radius / r
+
+        # Près de la surface, l'interpolation peut placer le cas du mauvais côté
+        with np.errstate(divide="ignore"):
+            near = np.flatnonzero(np.abs(1.0 / factors - 1.0) <= self.band)
+        for row in np.unique(i[near]):
+            cases = near[i[near] == row]
+            factors[cases] = self._exact_factors(loads[cases], row)
+
+        return float(factors[0]) if single else factors
+
+    def _exact_factors(self, loads: np.ndarray, row: int) -> np.ndarray:
+        """λ par lancer de rayons contre les triangles d'une bande d'élévation de la grille"""
+        low, high = self._bands
+        candidates = np.flatnonzero(
+            (low <= self.elevations[row + 1]) & (high >= self.elevations[row])
+        )
+        factors = np.empty(len(loads))
+        block = max(1, _RAY_BLOCK // max(1, len(candidates)))
+        for start in range(0, len(loads), block):
+            rays = slice(start, start + block)
+            factors[rays] = self.surface._ray_hits(loads[rays], candidates).min(axis=1)
+        return factors
+
+    def utilization(self, loads: np.ndarray) -> Union[float, np.ndarray]:
+        """
+        Taux d'utilisation 1/λ (≤ 1 : section résistante)
+
+        Args:
+            loads: Cas de charge [N, M_y, M_z] (3,) ou (n, 3)
+
+        Returns:
+            Taux d'utilisation (0 pour une charge nulle)
+        """
+        factor = self.load_factor(loads)
+        with np.errstate(divide="ignore"):
+            return 1.0 / factor
+
+    def is_safe(self, loads: np.ndarray) -> Union[bool, np.ndarray]:
+        """Teste si les cas de charge sont à l'intérieur de la surface (λ ≥ 1)"""
+        factor = self.load_factor(loads)
+        return factor >= 1.0
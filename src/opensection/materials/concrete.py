@@ -11,8 +11,12 @@ Cette convention est traditionnelle en béton armé où le béton travaille
 principalement en compression.
 """
 
+from typing import Optional, Tuple
+
 import numpy as np
 
+from opensection.utils.hashing import content_fingerprint
+
 
 class ConcreteEC2:
     """
@@ -48,6 +52,20 @@ class ConcreteEC2:
         # Module d'élasticité sécant
         self.Ecm = 22000 * ((fck + 8) / 10) ** 0.3
 
+    def fingerprint(self) -> str:
+        """Empreinte des paramètres de la loi (identique pour deux bétons équivalents)"""
+        return content_fingerprint(
+            type(self).__name__,
+            self.fck,
+            self.gamma_c,
+            self.alpha_cc,
+            self.fcd,
+            self.epsilon_c2,
+            self.epsilon_cu2,
+            self.n,
+            self.Ecm,
+        )
+
     def stress(self, epsilon: float) -> float:
         """
         Calcule la contrainte pour une déformation donnée
@@ -121,3 +139,57 @@ class ConcreteEC2:
         Et[mask] = self.fcd * self.n * (1 - ratio) ** (self.n - 1) / self.epsilon_c2
 
         return Et
+
+    def stress_and_tangent(
+        self,
+        epsilon: np.ndarray,
+        out_sigma: Optional[np.ndarray] = None,
+        out_Et: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Contrainte et module tangent en une seule passe
+
+        Le terme t = 1 - e/e_c2, borné à [0, 1], est calculé une seule fois
+        et partagé par les deux grandeurs (t = 1 en traction, t = 0 sur le
+        plateau). Pour n = 2 : s = fcd (1 - t²) et Et = 2 fcd t / e_c2.
+
+        Args:
+            epsilon: Déformations (tableau de forme quelconque)
+            out_sigma: Tableau de sortie optionnel pour les contraintes
+            out_Et: Tableau de sortie optionnel pour les modules tangents
+
+        Returns:
+            (sigma, Et) de même forme que epsilon, en MPa
+        """
+        epsilon = np.asarray(epsilon, dtype=float)
+        if out_sigma is None:
+            out_sigma = np.empty_like(epsilon)
+        if out_Et is None:
+            out_Et = np.empty_like(epsilon)
+
+        # t est construit dans out_Et, puis mis à l'échelle en place
+        t = np.divide(epsilon, self.epsilon_c2, out=out_Et)
+        np.subtract(1.0, t, out=t)
+        np.clip(t, 0.0, 1.0, out=t)
+
+        if self.n == 2.0:
+            np.multiply(t, t, out=out_sigma)
+            t *= 2.0 * self.fcd / self.epsilon_c2
+        else:
+            # t^(n-1) n'est évalué que sur la branche parabolique (0 < t < 1)
+            idx = np.flatnonzero((t > 0.0) & (t < 1.0))
+            t_p = np.take(t, idx)
+            t_n1 = t_p ** (self.n - 1)
+            np.copyto(out_sigma, t)
+            np.put(out_sigma, idx, t_n1 * t_p)
+            t *= self.fcd * self.n / self.epsilon_c2
+            np.put(out_Et, idx, t_n1 * (self.fcd * self.n / self.epsilon_c2))
+        np.subtract(1.0, out_sigma, out=out_sigma)
+        out_sigma *= self.fcd
+
+        # Traction : pas de rigidité ; au-delà de e_cu2 : rupture
+        # (produits par des masques booléens, sans indexation)
+        out_Et *= epsilon >= 0
+        out_sigma *= epsilon <= self.epsilon_cu2
+
+        return out_sigma, out_Et
@@ -11,8 +11,12 @@ Cette convention suit les standards de la mécanique des solides où l'acier
 travaille principalement en traction.
 """
 
+from typing import Optional, Tuple
+
 import numpy as np
 
+from opensection.utils.hashing import content_fingerprint
+
 
 class SteelEC2:
     """
@@ -52,6 +56,20 @@ class SteelEC2:
         self.epsilon_uk = 0.05  # 5% pour classe B
         self.epsilon_ud = 0.9 * self.epsilon_uk
 
+    def fingerprint(self) -> str:
+        """Empreinte des paramètres de la loi (identique pour deux aciers équivalents)"""
+        return content_fingerprint(
+            type(self).__name__,
+            self.fyk,
+            self.gamma_s,
+            self.Es,
+            self.include_hardening,
+            self.k,
+            self.fyd,
+            self.epsilon_yk,
+            self.epsilon_ud,
+        )
+
     def stress(self, epsilon: float) -> float:
         """
         Calcule la contrainte
@@ -131,9 +149,63 @@ class SteelEC2:
 
         return Et
 
+    def stress_and_tangent(
+        self,
+        epsilon: np.ndarray,
+        out_sigma: Optional[np.ndarray] = None,
+        out_Et: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Contrainte et module tangent en une seule passe
+
+        |e| et les masques des branches élastique / plastique / rupture sont
+        calculés une seule fois pour les deux grandeurs.
+
+        Args:
+            epsilon: Déformations (tableau de forme quelconque)
+            out_sigma: Tableau de sortie optionnel pour les contraintes
+            out_Et: Tableau de sortie optionnel pour les modules tangents
+
+        Returns:
+            (sigma, Et) de même forme que epsilon, en MPa
+        """
+        epsilon = np.asarray(epsilon, dtype=float)
+        if out_sigma is None:
+            out_sigma = np.empty_like(epsilon)
+        if out_Et is None:
+            out_Et = np.empty_like(epsilon)
+
+        abs_eps = np.abs(epsilon)
+        elastic = abs_eps <= self.epsilon_yk
+        intact = abs_eps <= self.epsilon_ud
+
+        np.multiply(epsilon, self.Es, out=out_sigma)
+        if self.include_hardening:
+            Esh = self.k * self.Es
+            plastic = np.copysign(self.fyd + Esh * (abs_eps - self.epsilon_yk), epsilon)
+            out_sigma[...] = np.where(elastic, out_sigma, plastic)
+            np.multiply(elastic, self.Es - Esh, out=out_Et)
+            out_Et += Esh
+        else:
+            np.clip(out_sigma, -self.fyd, self.fyd, out=out_sigma)
+            np.multiply(elastic, self.Es, out=out_Et)
+
+        # Rupture au-delà de e_ud
+        out_sigma *= intact
+        out_Et *= intact
+
+        return out_sigma, out_Et
+
 
 class PrestressingSteelEC2:
-    """Acier de précontrainte selon EC2"""
+    """
+    Acier de précontrainte selon EC2
+
+    Loi en traction seule : s = Ep·e·(1 - (e/e_pu)^m) pour 0 ≤ e ≤ e_pu,
+    nulle en compression et au-delà de e_pu (rupture). Les déformations sont
+    les déformations totales du toron (prédéformation comprise, voir
+    RebarGroup.add_rebars).
+    """
 
     def __init__(self, fp01k: float, Ep: float = 195000):
         """
@@ -146,6 +218,19 @@ class PrestressingSteelEC2:
         self.epsilon_p01 = fp01k / Ep
         self.epsilon_pu = 0.02
         self.m = 2.0
+        # Déformation limite des plans ultimes
+        self.epsilon_ud = self.epsilon_pu
+
+    @property
+    def Es(self) -> float:
+        """Module d'Young (MPa), nom commun aux aciers du solveur"""
+        return self.Ep
+
+    def fingerprint(self) -> str:
+        """Empreinte des paramètres de la loi (identique pour deux aciers équivalents)"""
+        return content_fingerprint(
+            type(self).__name__, self.fp01k, self.Ep, self.epsilon_pu, self.m
+        )
 
     def stress(self, epsilon: float) -> float:
         """Loi contrainte-déformation pour précontrainte"""
@@ -157,9 +242,68 @@ class PrestressingSteelEC2:
         else:
             return 0.0
 
+    def tangent_modulus(self, epsilon: float) -> float:
+        """Module tangent Ep·(1 - (m+1)·(e/e_pu)^m), négatif après le pic"""
+        if 0 <= epsilon <= self.epsilon_pu:
+            ratio = epsilon / self.epsilon_pu
+            return (self.fp01k / self.epsilon_p01) * (1 - (self.m + 1) * ratio**self.m)
+        return 0.0
+
+    def stress_vectorized(self, epsilon: np.ndarray) -> np.ndarray:
+        """Version vectorisée"""
+        return self.stress_and_tangent(epsilon)[0]
+
+    def tangent_modulus_vectorized(self, epsilon: np.ndarray) -> np.ndarray:
+        """Version vectorisée du module tangent"""
+        return self.stress_and_tangent(epsilon)[1]
+
+    def stress_and_tangent(
+        self,
+        epsilon: np.ndarray,
+        out_sigma: Optional[np.ndarray] = None,
+        out_Et: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Contrainte et module tangent en une seule passe
+
+        (e/e_pu)^m et le masque du domaine actif 0 ≤ e ≤ e_pu sont calculés une
+        seule fois pour les deux grandeurs.
+
+        Args:
+            epsilon: Déformations (positives en traction, tableau de forme quelconque)
+            out_sigma: Tableau de sortie optionnel pour les contraintes
+            out_Et: Tableau de sortie optionnel pour les modules tangents
+
+        Returns:
+            (sigma, Et) de même forme que epsilon, en MPa
+        """
+        epsilon = np.asarray(epsilon, dtype=float)
+        if out_sigma is None:
+            out_sigma = np.empty_like(epsilon)
+        if out_Et is None:
+            out_Et = np.empty_like(epsilon)
+
+        E = self.fp01k / self.epsilon_p01
+        # |e| : pas de puissance non entière d'un négatif (branche masquée ensuite)
+        ratio_m = (np.abs(epsilon) / self.epsilon_pu) ** self.m
+        active = (epsilon >= 0) & (epsilon <= self.epsilon_pu)
+
+        # s = E·e·(1 - r^m), Et = E·(1 - (m+1)·r^m)
+        np.multiply(ratio_m, -E, out=out_Et)
+        out_Et += E
+        np.multiply(epsilon, out_Et, out=out_sigma)
+        ratio_m *= -self.m * E
+        out_Et += ratio_m
+
+        # Traction seule, rupture au-delà de e_pu
+        out_sigma *= active
+        out_Et *= active
+
+        return out_sigma, out_Et
+
 
 class StructuralSteelEC3:
-    """Acier de charpente selon EC3"""
+    """Acier de charpente selon EC3 (élasto-plastique parfait, symétrique)"""
 
     def __init__(self, fy: float, gamma_M0: float = 1.0, Ea: float = 210000):
         """
@@ -173,6 +317,18 @@ class StructuralSteelEC3:
         self.Ea = Ea
         self.fyd = fy / gamma_M0
         self.epsilon_y = self.fyd / Ea
+        # Déformation limite des plans ultimes (ductilité EC3 3.2.2 : e_u ≥ 15·e_y) ;
+        # la loi elle-même n'a pas de rupture
+        self.epsilon_ud = 15 * self.epsilon_y
+
+    @property
+    def Es(self) -> float:
+        """Module d'Young (MPa), nom commun aux aciers du solveur"""
+        return self.Ea
+
+    def fingerprint(self) -> str:
+        """Empreinte des paramètres de la loi (identique pour deux aciers équivalents)"""
+        return content_fingerprint(type(self).__name__, self.fy, self.gamma_M0, self.Ea)
 
     def stress(self, epsilon: float) -> float:
         """Loi élasto-plastique parfaite"""
@@ -189,3 +345,41 @@ class StructuralSteelEC3:
             return self.Ea
         else:
             return 0.0
+
+    def stress_vectorized(self, epsilon: np.ndarray) -> np.ndarray:
+        """Version vectorisée"""
+        epsilon = np.asarray(epsilon, dtype=float)
+        return np.clip(self.Ea * epsilon, -self.fyd, self.fyd)
+
+    def tangent_modulus_vectorized(self, epsilon: np.ndarray) -> np.ndarray:
+        """Version vectorisée du module tangent"""
+        return (np.abs(epsilon) <= self.epsilon_y) * float(self.Ea)
+
+    def stress_and_tangent(
+        self,
+        epsilon: np.ndarray,
+        out_sigma: Optional[np.ndarray] = None,
+        out_Et: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Contrainte et module tangent en une seule passe
+
+        Args:
+            epsilon: Déformations (tableau de forme quelconque)
+            out_sigma: Tableau de sortie optionnel pour les contraintes
+            out_Et: Tableau de sortie optionnel pour les modules tangents
+
+        Returns:
+            (sigma, Et) de même forme que epsilon, en MPa
+        """
+        epsilon = np.asarray(epsilon, dtype=float)
+        if out_sigma is None:
+            out_sigma = np.empty_like(epsilon)
+        if out_Et is None:
+            out_Et = np.empty_like(epsilon)
+
+        np.multiply(epsilon, self.Ea, out=out_sigma)
+        np.multiply(np.abs(epsilon) <= self.epsilon_y, self.Ea, out=out_Et)
+        np.clip(out_sigma, -self.fyd, self.fyd, out=out_sigma)
+
+        return out_sigma, out_Et
@@ -3,12 +3,32 @@ Postprocess module for opensection
 
 This module provides visualization and reporting tools
 for section analysis results.
+
+SectionPlotter and ReportGenerator are imported on first access, so that
+importing this package does not load matplotlib.
 """
 
-from opensection.postprocess.report import ReportGenerator
-from opensection.postprocess.visualization import SectionPlotter
+import importlib
 
 __all__ = [
     "SectionPlotter",
     "ReportGenerator",
 ]
+
+_LAZY_ATTRIBUTES = {
+    "SectionPlotter": "opensection.postprocess.visualization",
+    "ReportGenerator": "opensection.postprocess.report",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,268 @@
+"""
+Optimisation du ferraillage d'une section rectangulaire
+
+Les ferraillages candidats (diamètre, barres en nappe supérieure et
+inférieure) sont positionnés avec CoverHelper, filtrés par l'espacement et
+les taux d'armature (EC2Verification.check_rebar_ratios) sans calcul, puis
+vérifiés à l'ELU sur tous les cas de charge en un appel de
+SectionSolver.solve_many. Le maillage béton est partagé entre candidats
+(SectionSolver.with_rebars).
+
+Pour un diamètre donné, la résistance est supposée croissante avec le nombre
+de barres de chaque nappe. La grille (n_sup, n_inf) est alors parcourue en
+escalier le long de la frontière entre candidats refusés et acceptés : un
+candidat dominé par un refusé (au plus autant de barres dans chaque nappe)
+ou dominant un accepté n'est jamais calculé, ni un candidat plus lourd que
+la meilleure solution trouvée. Il reste O(n_sup + n_inf) calculs par
+diamètre au lieu de n_sup·n_inf.
+
+Axes de CoverHelper : y vertical (hauteur, nappes "top" et "bottom"),
+z horizontal (largeur). Un moment M_z positif comprime la nappe supérieure.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from opensection.eurocodes.verification import EC2Verification
+from opensection.geometry.contour import Contour
+from opensection.geometry.section import Section
+from opensection.materials.concrete import ConcreteEC2
+from opensection.materials.steel import SteelEC2
+from opensection.reinforcement.helpers import CoverHelper
+from opensection.reinforcement.rebar import RebarGroup
+from opensection.solver.cache import SolverStateCache, default_solver_cache
+from opensection.solver.section_solver import BatchSolverResult, SectionSolver
+
+# Diamètres courants des barres (m)
+STANDARD_DIAMETERS = (0.010, 0.012, 0.014, 0.016, 0.020, 0.025, 0.032)
+
+
+@dataclass(frozen=True)
+class RebarLayout:
+    """
+    Ferraillage candidat : deux nappes d'un même diamètre
+
+    Attributes:
+        diameter: Diamètre des barres (m)
+        n_top: Nombre de barres de la nappe supérieure
+        n_bottom: Nombre de barres de la nappe inférieure
+    """
+
+    diameter: float
+    n_top: int
+    n_bottom: int
+
+    @property
+    def area(self) -> float:
+        """Section totale d'acier (m²)"""
+        return (self.n_top + self.n_bottom) * np.pi * (self.diameter / 2) ** 2
+
+    def to_rebar_group(self, width: float, height: float, cover: float) -> RebarGroup:
+        """Groupe d'armatures positionné avec l'enrobage (add_layer_with_cover)"""
+        rebars = RebarGroup()
+        for position, n_bars in (("top", self.n_top), ("bottom", self.n_bottom)):
+            if n_bars > 0:
+                rebars.add_layer_with_cover(position, n_bars, self.diameter, width, height, cover)
+        return rebars
+
+
+@dataclass
+class LayoutDesign:
+    """
+    Résultat de l'optimisation
+
+    Attributes:
+        layout: Ferraillage d'aire minimale vérifié, ou None
+        rebars: Armatures correspondantes, ou None
+        results: Résultats ELU de chaque cas de charge, ou None
+        n_candidates: Candidats respectant l'espacement minimal
+        n_screened: Candidats écartés par les taux d'armature (sans calcul)
+        n_solved: Candidats calculés
+        n_pruned: Candidats écartés par dominance ou par l'aire (sans calcul)
+    """
+
+    layout: Optional[RebarLayout]
+    rebars: Optional[RebarGroup]
+    results: Optional[BatchSolverResult]
+    n_candidates: int
+    n_screened: int
+    n_solved: int
+    n_pruned: int
+
+    @property
+    def found(self) -> bool:
+        """Vrai si un ferraillage satisfait toutes les vérifications"""
+        return self.layout is not None
+
+
+class RebarLayoutOptimizer:
+    """
+    Recherche le ferraillage d'aire minimale d'une section rectangulaire
+
+    Un candidat est retenu si tous les cas de charge convergent et satisfont
+    EC2Verification.check_ULS, et si check_rebar_ratios est satisfait.
+    """
+
+    def __init__(
+        self,
+        width: float,
+        height: float,
+        concrete: ConcreteEC2,
+        steel: SteelEC2,
+        cover: float = 0.03,
+        diameters: Sequence[float] = STANDARD_DIAMETERS,
+        n_bars: Tuple[int, int] = (2, 8),
+        min_clear_spacing: float = 0.020,
+        fiber_area: float = 0.0001,
+        mesh_method: str = "grid",
+        cache: Optional[SolverStateCache] = default_solver_cache,
+    ):
+        """
+        Args:
+            width: Largeur de la section (m, direction z)
+            height: Hauteur de la section (m, direction y)
+            concrete: Matériau béton
+            steel: Matériau acier
+            cover: Enrobage (m)
+            diameters: Diamètres candidats (m)
+            n_bars: Nombre de barres par nappe (min, max)
+            min_clear_spacing: Espacement libre minimal entre barres (m), au
+                moins égal au diamètre (EC2 8.2)
+            fiber_area: Aire cible des fibres (m²)
+            mesh_method: Méthode de maillage
+            cache: Cache des états préparés (maillage béton)
+        """
+        if n_bars[0] < 1 or n_bars[1] < n_bars[0]:
+            raise ValueError("n_bars doit vérifier 1 <= min <= max")
+
+        self.width = width
+        self.height = height
+        self.concrete = concrete
+        self.steel = steel
+        self.cover = cover
+        self.diameters = tuple(sorted(diameters))
+        self.n_bars = n_bars
+        self.min_clear_spacing = min_clear_spacing
+
+        # Hauteur selon y, largeur selon z (axes de CoverHelper)
+        self.section = Section([Contour.rectangle(height, width)])
+        self._solver = SectionSolver(
+            self.section,
+            concrete,
+            steel,
+            RebarGroup(),
+            fiber_area=fiber_area,
+            mesh_method=mesh_method,
+            cache=cache,
+        )
+
+    def max_bars_per_layer(self, diameter: float) -> int:
+        """Nombre maximal de barres d'une nappe respectant l'espacement libre"""
+        n_max = self.n_bars[0] - 1
+        for n_bars in range(self.n_bars[0], self.n_bars[1] + 1):
+            positions = CoverHelper.layer_positions_with_cover(
+                "bottom", self.width, self.height, n_bars, diameter, self.cover
+            )
+            z = np.sort([position[1] for position in positions])
+            if n_bars > 1 and np.min(np.diff(z)) - diameter < max(self.min_clear_spacing, diameter):
+                break
+            n_max = n_bars
+        return n_max
+
+    def candidates(self) -> List[RebarLayout]:
+        """Ferraillages respectant l'espacement, par aire croissante"""
+        layouts = []
+        for diameter in self.diameters:
+            n_range = range(self.n_bars[0], self.max_bars_per_layer(diameter) + 1)
+            layouts += [
+                RebarLayout(diameter, n_top, n_bottom) for n_top in n_range for n_bottom in n_range
+            ]
+        return sorted(layouts, key=lambda layout: (layout.area, layout.diameter))
+
+    def evaluate(self, layout: RebarLayout, loads: np.ndarray) -> Tuple[bool, BatchSolverResult]:
+        """
+        Vérifie un ferraillage sur tous les cas de charge
+
+        Args:
+            layout: Ferraillage candidat
+            loads: Cas de charge (n, 3) [N, M_y, M_z] (kN, kN·m)
+
+        Returns:
+            (vérifié, résultats)
+        """
+        rebars = layout.to_rebar_group(self.width, self.height, self.cover)
+        results = self._solver.with_rebars(rebars).solve_many(loads)
+
+        ok = bool(np.all(results.converged))
+        for i in range(len(results)):
+            if not ok:
+                break
+            checks = EC2Verification.check_ULS(
+                results.to_result(i), self.concrete.fcd, self.steel.fyd
+            )
+            ok = all(check["ok"] for check in checks.values())
+        return ok, results
+
+    def optimize(self, loads: np.ndarray) -> LayoutDesign:
+        """
+        Ferraillage d'aire minimale vérifiant tous les cas de charge
+
+        Args:
+            loads: Cas de charge [N, M_y, M_z] (3,) ou (n, 3) (kN, kN·m)
+
+        Returns:
+            LayoutDesign (layout None si aucun candidat ne convient)
+        """
+        loads = np.atleast_2d(np.asarray(loads, dtype=float))
+        Ac = self.section.properties.area
+
+        best: Optional[Tuple[RebarLayout, BatchSolverResult]] = None
+        n_candidates = n_screened = n_solved = 0
+
+        for diameter in self.diameters:
+            n_min, n_max = self.n_bars[0], self.max_bars_per_layer(diameter)
+            if n_max < n_min:
+                continue
+            n_candidates += (n_max - n_min + 1) ** 2
+
+            # Escalier : plus de barres en haut si refusé, moins en bas sinon
+            n_top, n_bottom = n_min, n_max
+            while n_top <= n_max and n_bottom >= n_min:
+                layout = RebarLayout(diameter, n_top, n_bottom)
+                ratios = EC2Verification.check_rebar_ratios(layout.area, Ac)
+
+                if best is not None and layout.area >= best[0].area:
+                    n_bottom -= 1
+                elif not ratios["max_ok"]:
+                    n_screened += 1
+                    n_bottom -= 1
+                elif not ratios["min_ok"]:
+                    n_screened += 1
+                    n_top += 1
+                else:
+                    n_solved += 1
+                    ok, results = self.evaluate(layout, loads)
+                    if ok:
+                        best = (layout, results)
+                        n_bottom -= 1
+                    else:
+                        n_top += 1
+
+        design: Optional[RebarLayout] = None
+        rebars: Optional[RebarGroup] = None
+        checks: Optional[BatchSolverResult] = None
+        if best is not None:
+            design, checks = best
+            rebars = design.to_rebar_group(self.width, self.height, self.cover)
+
+        return LayoutDesign(
+            layout=design,
+            rebars=rebars,
+            results=checks,
+            n_candidates=n_candidates,
+            n_screened=n_screened,
+            n_solved=n_solved,
+            n_pruned=n_candidates - n_screened - n_solved,
+        )
@@ -3,10 +3,14 @@ Gestion des armatures
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from opensection.utils.hashing import content_fingerprint
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
 try:
     from opensection.reinforcement.helpers import CoverHelper
 except ImportError:
@@ -24,6 +28,9 @@ class Rebar:
         z: Coordonnée z (m)
         diameter: Diamètre (m)
         n: Nombre de barres
+        prestrain: Prédéformation initiale (positive en traction), ex. σ_p0/E_p
+            d'un toron de précontrainte
+        material: Loi de l'acier, ou None pour l'acier du solveur
         area: Aire totale (m²)
     """
 
@@ -31,6 +38,8 @@ class Rebar:
     z: float
     diameter: float
     n: int = 1
+    prestrain: float = 0.0
+    material: Any = None
 
     @property
     def area(self) -> float:
@@ -43,15 +52,219 @@ class Rebar:
         return (self.y, self.z)
 
 
+class _StoredRebar(Rebar):
+    """
+    Armature d'un groupe en lecture seule (voir RebarGroup.rebars)
+
+    Les armatures sont stockées en colonnes : modifier cette copie lève une
+    erreur au lieu d'être sans effet sur le groupe.
+    """
+
+    def __init__(self, *values):
+        for field, value in zip(("y", "z", "diameter", "n", "prestrain", "material"), values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"Armature en lecture seule ({name!r}) : utiliser RebarGroup.add_rebar ou add_rebars"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Rebar):
+            return NotImplemented
+        fields = ("y", "z", "diameter", "n", "prestrain", "material")
+        return all(getattr(self, f) == getattr(other, f) for f in fields)
+
+    def __repr__(self) -> str:
+        return Rebar.__repr__(self).replace(type(self).__name__, "Rebar", 1)
+
+
 class RebarGroup:
-    """Groupe d'armatures"""
+    """
+    Groupe d'armatures
+
+    Les armatures sont stockées en colonnes (y, z, diamètre, nombre de barres,
+    prédéformation, indice de matériau) dans des tableaux à capacité
+    croissante, et le tableau des barres [y, z, A] du solveur est complété à
+    chaque ajout : to_array() en renvoie une vue en lecture seule, sans copie
+    (prestrain_array() et material_index_array() pour les autres grandeurs
+    par barre). Les matériaux propres à certaines armatures sont mémorisés une
+    fois chacun (materials) ; l'indice -1 désigne l'acier du solveur. Les
+    méthodes add_* ajoutent leurs positions en un seul bloc vectorisé
+    (add_rebars).
+    """
 
     def __init__(self):
-        self.rebars: List[Rebar] = []
+        # Colonnes y, z, diamètre, n, prédéformation, matériau (struct of arrays),
+        # _size entrées utiles
+        self._fields = np.empty((6, 8))
+        self._size = 0
+        # Barres développées [y, z, A] (une ligne par barre), prédéformations et matériaux
+        self._bars = np.empty((8, 3))
+        self._bar_prestrains = np.empty(8)
+        self._bar_materials = np.empty(8, dtype=int)
+        # Matériaux distincts (par empreinte) des armatures qui en précisent un
+        self._materials: List[Any] = []
+        self._material_keys: Dict[str, int] = {}
+        self._n_bars = 0
+        self._total_area: Optional[float] = None
+        self._rebars: Optional[Tuple[Rebar, ...]] = None
+
+    @staticmethod
+    def _grow(array: np.ndarray, axis: int, required: int) -> np.ndarray:
+        """Agrandit un tableau par doublement de capacité"""
+        capacity = array.shape[axis]
+        if required <= capacity:
+            return array
+        shape = list(array.shape)
+        shape[axis] = max(required, 2 * capacity)
+        grown = np.empty(shape, dtype=array.dtype)
+        index = [slice(None)] * array.ndim
+        index[axis] = slice(0, capacity)
+        grown[tuple(index)] = array
+        return grown
+
+    def add_rebars(
+        self,
+        y: ArrayLike,
+        z: ArrayLike,
+        diameter: ArrayLike,
+        n: ArrayLike = 1,
+        prestrain: ArrayLike = 0.0,
+        material: Any = None,
+    ):
+        """
+        Ajoute des armatures en bloc (arguments scalaires ou tableaux diffusés)
+
+        Args:
+            y, z: Coordonnées (m)
+            diameter: Diamètre(s) (m)
+            n: Nombre(s) de barres à chaque position
+            prestrain: Prédéformation(s) initiale(s), positive(s) en traction
+                (torons de précontrainte : σ_p/E_p après pertes)
+            material: Loi de l'acier de ces armatures (ex. PrestressingSteelEC2),
+                ou None pour l'acier du solveur
 
-    def add_rebar(self, y: float, z: float, diameter: float, n: int = 1):
+        Examples:
+            >>> rebars = RebarGroup()
+            >>> # Paroi moulée : 200 barres HA20 espacées de 15 cm
+            >>> rebars.add_rebars(y=0.25, z=np.arange(200) * 0.15, diameter=0.020)
+        """
+        y, z, diameter, n, prestrain = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(value, dtype=float))
+                for value in (y, z, diameter, n, prestrain)
+            )
+        )
+        if y.ndim != 1:
+            raise ValueError("add_rebars attend des scalaires ou des tableaux 1D")
+        count = len(y)
+        counts = n.astype(int)
+        if np.any(counts != n) or np.any(counts < 1):
+            raise ValueError("Le nombre de barres doit être un entier >= 1")
+
+        index = self._material_index(material)
+        start = self._size
+        self._fields = self._grow(self._fields, 1, start + count)
+        self._fields[:5, start : start + count] = (y, z, diameter, n, prestrain)
+        self._fields[5, start : start + count] = index
+        self._size += count
+
+        # Aire d'une barre, calculée comme Rebar.area / n
+        area = n * np.pi * (diameter / 2) ** 2
+        bars = np.repeat(np.column_stack([y, z, area / n]), counts, axis=0)
+        first = self._n_bars
+        self._bars = self._grow(self._bars, 0, first + len(bars))
+        self._bars[first : first + len(bars)] = bars
+        self._bar_prestrains = self._grow(self._bar_prestrains, 0, first + len(bars))
+        self._bar_prestrains[first : first + len(bars)] = np.repeat(prestrain, counts)
+        self._bar_materials = self._grow(self._bar_materials, 0, first + len(bars))
+        self._bar_materials[first : first + len(bars)] = index
+        self._n_bars += len(bars)
+
+        self._total_area = None
+        self._rebars = None
+
+    def add_rebar(
+        self,
+        y: float,
+        z: float,
+        diameter: float,
+        n: int = 1,
+        prestrain: float = 0.0,
+        material: Any = None,
+    ):
         """Ajoute une armature à une position donnée"""
-        self.rebars.append(Rebar(y, z, diameter, n))
+        self.add_rebars(y, z, diameter, n, prestrain, material)
+
+    def _material_index(self, material: Any) -> int:
+        """Indice d'un matériau dans materials (-1 pour l'acier du solveur)"""
+        if material is None:
+            return -1
+        key = material.fingerprint()
+        if key not in self._material_keys:
+            self._material_keys[key] = len(self._materials)
+            self._materials.append(material)
+        return self._material_keys[key]
+
+    @property
+    def materials(self) -> List[Any]:
+        """Matériaux distincts précisés par les armatures, dans l'ordre des indices"""
+        return list(self._materials)
+
+    @property
+    def rebars(self) -> Tuple[Rebar, ...]:
+        """
+        Armatures sous forme de tuple de Rebar en lecture seule (compatibilité)
+
+        Le tuple est construit à partir des colonnes : ajouter ou modifier une
+        armature lève une erreur, utiliser add_rebar, add_rebars ou les
+        méthodes add_*.
+        """
+        if self._rebars is None:
+            y, z, diameter, n, prestrain, index = self._fields[:, : self._size]
+            materials = self._materials + [None]  # indice -1 : acier du solveur
+            self._rebars = tuple(
+                _StoredRebar(
+                    float(y_i), float(z_i), float(d_i), int(n_i), float(p_i), materials[int(m)]
+                )
+                for y_i, z_i, d_i, n_i, p_i, m in zip(y, z, diameter, n, prestrain, index)
+            )
+        return self._rebars
+
+    @property
+    def y(self) -> np.ndarray:
+        """Coordonnées y des armatures (vue en lecture seule)"""
+        return self._column(0)
+
+    @property
+    def z(self) -> np.ndarray:
+        """Coordonnées z des armatures (vue en lecture seule)"""
+        return self._column(1)
+
+    @property
+    def diameters(self) -> np.ndarray:
+        """Diamètres des armatures (vue en lecture seule)"""
+        return self._column(2)
+
+    @property
+    def prestrains(self) -> np.ndarray:
+        """Prédéformations initiales des armatures (vue en lecture seule)"""
+        return self._column(4)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Nombre de barres de chaque armature"""
+        return self._fields[3, : self._size].astype(int)
+
+    def _column(self, i: int) -> np.ndarray:
+        view = self._fields[i, : self._size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        """Nombre d'armatures (positions), comme len(rebars)"""
+        return self._size
 
     def add_rebar_with_cover(
         self,
@@ -124,8 +337,8 @@ class RebarGroup:
             position, section_width, section_height, n_bars, diameter, cover, spacing
         )
 
-        for y, z in positions:
-            self.add_rebar(y, z, diameter, 1)
+        y, z = np.array(positions, dtype=float).reshape(-1, 2).T
+        self.add_rebars(y, z, diameter, 1)
 
     def add_circular_array_with_cover(
         self,
@@ -157,8 +370,8 @@ class RebarGroup:
             n_bars, diameter_section, diameter_rebar, cover, start_angle
         )
 
-        for y, z in positions:
-            self.add_rebar(y, z, diameter_rebar, 1)
+        y, z = np.array(positions, dtype=float).reshape(-1, 2).T
+        self.add_rebars(y, z, diameter_rebar, 1)
 
     def add_linear_array(self, y1: float, z1: float, y2: float, z2: float, n: int, diameter: float):
         """
@@ -170,11 +383,8 @@ class RebarGroup:
             n: Nombre de barres
             diameter: Diamètre
         """
-        for i in range(n):
-            t = i / (n - 1) if n > 1 else 0
-            y = y1 + t * (y2 - y1)
-            z = z1 + t * (z2 - z1)
-            self.add_rebar(y, z, diameter, 1)
+        t = np.arange(n) / (n - 1) if n > 1 else np.zeros(n)
+        self.add_rebars(y1 + t * (y2 - y1), z1 + t * (z2 - z1), diameter, 1)
 
     def add_circular_array(
         self,
@@ -195,26 +405,63 @@ class RebarGroup:
             diameter: Diamètre
             start_angle: Angle de départ (radians)
         """
-        for i in range(n):
-            theta = start_angle + 2 * np.pi * i / n
-            y = center_y + radius * np.cos(theta)
-            z = center_z + radius * np.sin(theta)
-            self.add_rebar(y, z, diameter, 1)
+        theta = start_angle + 2 * np.pi * np.arange(n) / n
+        self.add_rebars(
+            center_y + radius * np.cos(theta), center_z + radius * np.sin(theta), diameter, 1
+        )
 
     @property
     def total_area(self) -> float:
-        """Aire totale d'armatures"""
-        return sum(r.area for r in self.rebars)
+        """Aire totale d'armatures (mise en cache jusqu'au prochain ajout)"""
+        if self._total_area is None:
+            diameter, n = self._fields[2:4, : self._size]
+            self._total_area = float(np.sum(n * np.pi * (diameter / 2) ** 2))
+        return self._total_area
 
     @property
     def n_rebars(self) -> int:
         """Nombre total de barres"""
-        return sum(r.n for r in self.rebars)
+        return self._n_bars
+
+    def fingerprint(self) -> str:
+        """
+        Empreinte du contenu (position, diamètre, nombre, prédéformation et
+        matériau de chaque armature)
+        """
+        return content_fingerprint(
+            "RebarGroup",
+            self._fields[:, : self._size].T,
+            [material.fingerprint() for material in self._materials],
+        )
 
     def to_array(self) -> np.ndarray:
-        """Convertit en array numpy (n_rebars, 3) -> [y, z, area]"""
-        data = []
-        for rebar in self.rebars:
-            for _ in range(rebar.n):
-                data.append([rebar.y, rebar.z, rebar.area / rebar.n])
-        return np.array(data)
+        """
+        Barres développées (n_rebars, 3) -> [y, z, area]
+
+        Renvoie une vue en lecture seule, sans copie ; les ajouts ultérieurs ne
+        la modifient pas.
+        """
+        view = self._bars[: self._n_bars]
+        view.flags.writeable = False
+        return view
+
+    def prestrain_array(self) -> np.ndarray:
+        """
+        Prédéformations des barres développées (n_rebars,), dans l'ordre de to_array()
+
+        Vue en lecture seule, sans copie.
+        """
+        view = self._bar_prestrains[: self._n_bars]
+        view.flags.writeable = False
+        return view
+
+    def material_index_array(self) -> np.ndarray:
+        """
+        Indice du matériau de chaque barre développée (n_rebars,), dans l'ordre
+        de to_array() : indice dans materials, ou -1 pour l'acier du solveur
+
+        Vue en lecture seule, sans copie.
+        """
+        view = self._bar_materials[: self._n_bars]
+        view.flags.writeable = False
+        return view
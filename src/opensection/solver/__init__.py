@@ -5,9 +5,33 @@ This module provides numerical solvers for section analysis
 using fiber discretization and Newton-Raphson method.
 """
 
-from opensection.solver.section_solver import SectionSolver, SolverResult
+from opensection.solver.cache import (
+    PreparedSection,
+    SolverStateCache,
+    default_solver_cache,
+    prepare_section,
+)
+from opensection.solver.member import MemberAnalysis, MemberResult, MomentCurvatureTable
+from opensection.solver.moment_curvature import MomentCurvatureAnalysis, MomentCurvatureResult
+from opensection.solver.section_solver import (
+    BatchSolverResult,
+    SectionSolver,
+    SolverResult,
+    StrainLimits,
+)
 
 __all__ = [
     "SectionSolver",
     "SolverResult",
+    "BatchSolverResult",
+    "StrainLimits",
+    "MomentCurvatureAnalysis",
+    "MomentCurvatureResult",
+    "MomentCurvatureTable",
+    "MemberAnalysis",
+    "MemberResult",
+    "SolverStateCache",
+    "PreparedSection",
+    "prepare_section",
+    "default_solver_cache",
 ]
@@ -8,6 +8,7 @@ from opensection.geometry.section import Section
 from opensection.materials.concrete import ConcreteEC2
 from opensection.materials.steel import SteelEC2
 from opensection.reinforcement.rebar import RebarGroup
+from opensection.solver.cache import SolverStateCache, default_solver_cache
 from opensection.solver.section_solver import SectionSolver, SolverResult
 from opensection.validation.validators import SectionValidator
 
@@ -24,10 +25,15 @@ def validate_and_solve(
     max_iter: Optional[int] = None,
     use_relative_tol: bool = False,
     exposure_class: Optional[str] = None,
+    cache: Optional[SolverStateCache] = default_solver_cache,
 ) -> SolverResult:
     """
     Validate inputs (geometry, materials, reinforcement, loads) then solve.
     Raises validation exceptions if inputs are inconsistent.
+
+    The fiber mesh and solver setup are reused from ``cache`` (shared
+    ``default_solver_cache`` by default) when the section and reinforcement
+    content is unchanged; pass ``cache=None`` to always rebuild them.
     """
     # Validate inputs
     SectionValidator.validate_all(
@@ -42,7 +48,9 @@ def validate_and_solve(
     )
 
     # Solve
-    solver = SectionSolver(section=section, concrete=concrete, steel=steel, rebars=rebars)
+    solver = SectionSolver(
+        section=section, concrete=concrete, steel=steel, rebars=rebars, cache=cache
+    )
     return solver.solve(
         N=N, My=My, Mz=Mz, tol=tol, max_iter=max_iter, use_relative_tol=use_relative_tol
     )
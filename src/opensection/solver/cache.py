@@ -0,0 +1,269 @@
+"""
+Cache des états préparés du solveur
+
+La préparation d'un SectionSolver (maillage de fibres, tableau des armatures,
+propriétés géométriques, coordonnées centrées et matrices [1, y, z]) ne dépend
+que de la géométrie, des armatures et des paramètres de maillage. Elle est
+mémorisée dans un cache LRU borné, indexé par les empreintes de contenu
+(Section.fingerprint, RebarGroup.fingerprint) : une boucle de vérification qui
+recrée un solveur pour la même section ne remaille plus.
+
+Les tableaux mis en cache sont en lecture seule et partagés entre solveurs ;
+les tableaux de travail restent propres à chaque solveur.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from opensection.geometry.properties import GeometricProperties
+from opensection.geometry.section import Section
+from opensection.reinforcement.rebar import RebarGroup
+from opensection.solver.polygon_integrator import PolygonIntegrator
+from opensection.utils.hashing import content_fingerprint
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Marque un tableau en lecture seule (partagé entre solveurs)"""
+    array.flags.writeable = False
+    return array
+
+
+def group_geometry(
+    points: np.ndarray, yc: float, zc: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Matrices géométriques d'un groupe de points d'intégration
+
+    Args:
+        points: Tableau (n, 3) des [y, z, A]
+        yc, zc: Centre de gravité de la section
+
+    Returns:
+        G = [1, y, z], H = A·[1, z, y] et W = H ⊗ G aplati (n, 9), en
+        coordonnées centrées (lecture seule)
+    """
+    y = points[:, 0] - yc
+    z = points[:, 1] - zc
+    A = points[:, 2]
+    ones = np.ones_like(y)
+    G = np.column_stack([ones, y, z])
+    H = A[:, None] * np.column_stack([ones, z, y])
+    W = (H[:, :, None] * G[:, None, :]).reshape(len(y), 9)
+    return _read_only(G), _read_only(H), _read_only(W)
+
+
+@dataclass(frozen=True)
+class PreparedSection:
+    """
+    État géométrique préparé d'un solveur (partagé, lecture seule)
+
+    Attributes:
+        properties: Propriétés géométriques de la section
+        fibers: Fibres béton (n, 3) [y, z, A] (vide en intégration polygonale)
+        rebar_array: Armatures (n, 3) [y, z, A]
+        groups: Géométrie par type de points : {"concrete"|"steel": (G, H, W)}
+        polygon_integrator: Intégrateur sur contours, ou None
+    """
+
+    properties: GeometricProperties
+    fibers: np.ndarray
+    rebar_array: np.ndarray
+    groups: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]
+    polygon_integrator: Optional[PolygonIntegrator]
+
+    @property
+    def centroid(self) -> Tuple[float, float]:
+        """Centre de gravité (yc, zc)"""
+        return self.properties.centroid
+
+    def with_rebar_array(self, rebar_array: np.ndarray) -> "PreparedSection":
+        """État identique pour d'autres armatures (béton partagé, sans remaillage)"""
+        yc, zc = self.centroid
+        groups = {kind: geometry for kind, geometry in self.groups.items() if kind != "steel"}
+        if len(rebar_array) > 0:
+            groups["steel"] = group_geometry(rebar_array, yc, zc)
+
+        return PreparedSection(
+            properties=self.properties,
+            fibers=self.fibers,
+            rebar_array=_read_only(rebar_array),
+            groups=groups,
+            polygon_integrator=self.polygon_integrator,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        properties: GeometricProperties,
+        fibers: np.ndarray,
+        rebar_array: np.ndarray,
+        polygon_integrator: Optional[PolygonIntegrator] = None,
+    ) -> "PreparedSection":
+        """
+        Construit l'état à partir du maillage et des armatures déjà calculés
+
+        Les matrices [1, y, z] sont recalculées (ex. après désérialisation).
+        """
+        yc, zc = properties.centroid
+        groups = {}
+        for kind, points in (("concrete", fibers), ("steel", rebar_array)):
+            if len(points) > 0:
+                groups[kind] = group_geometry(points, yc, zc)
+
+        return cls(
+            properties=properties,
+            fibers=_read_only(fibers),
+            rebar_array=_read_only(rebar_array),
+            groups=groups,
+            polygon_integrator=polygon_integrator,
+        )
+
+
+def prepare_section(
+    section: Section,
+    rebars: RebarGroup,
+    fiber_area: float = 0.0001,
+    mesh_method: str = "grid",
+    mesh_options: Optional[Dict[str, Any]] = None,
+    integration: str = "fiber",
+) -> PreparedSection:
+    """
+    Prépare la géométrie d'un solveur (maillage, armatures, matrices centrées)
+
+    Args:
+        section: Section géométrique
+        rebars: Groupe d'armatures
+        fiber_area: Aire cible des fibres (m²)
+        mesh_method: Méthode de maillage (voir Section.create_fiber_mesh)
+        mesh_options: Options supplémentaires du maillage
+        integration: "fiber" ou "polygon"
+
+    Returns:
+        PreparedSection
+    """
+    properties = section.properties
+    yc, zc = properties.centroid
+
+    polygon_integrator = None
+    if integration == "polygon":
+        polygon_integrator = PolygonIntegrator(section.contours, yc, zc)
+        fibers = np.zeros((0, 3))
+    else:
+        fibers = section.create_fiber_mesh(fiber_area, method=mesh_method, **(mesh_options or {}))
+    rebar_array = rebars.to_array()
+
+    return PreparedSection.from_arrays(properties, fibers, rebar_array, polygon_integrator)
+
+
+class SolverStateCache:
+    """
+    Cache LRU borné des états préparés du solveur
+
+    La clé combine les empreintes de la section et des armatures avec les
+    paramètres de maillage ; les matériaux n'interviennent pas dans l'état
+    préparé. Les accès sont protégés par un verrou.
+
+    Attributes:
+        maxsize: Nombre maximal d'états conservés
+        hits: Nombre d'accès servis par le cache
+        misses: Nombre d'états préparés faute d'entrée
+    """
+
+    def __init__(self, maxsize: int = 32):
+        """
+        Args:
+            maxsize: Nombre maximal d'états conservés (>= 1)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize doit être >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, PreparedSection]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        section: Section,
+        rebars: RebarGroup,
+        fiber_area: float = 0.0001,
+        mesh_method: str = "grid",
+        mesh_options: Optional[Dict[str, Any]] = None,
+        integration: str = "fiber",
+    ) -> str:
+        """Clé de cache : empreintes du contenu et paramètres de maillage"""
+        if integration == "polygon":
+            # Sans maillage, les paramètres de maillage sont sans effet
+            fiber_area, mesh_method, mesh_options = 0.0, "", None
+        return content_fingerprint(
+            section.fingerprint(),
+            rebars.fingerprint(),
+            fiber_area,
+            mesh_method,
+            dict(mesh_options or {}),
+            integration,
+        )
+
+    def get_or_prepare(
+        self,
+        section: Section,
+        rebars: RebarGroup,
+        fiber_area: float = 0.0001,
+        mesh_method: str = "grid",
+        mesh_options: Optional[Dict[str, Any]] = None,
+        integration: str = "fiber",
+    ) -> PreparedSection:
+        """
+        Renvoie l'état préparé, en le calculant et le mémorisant si absent
+
+        Args:
+            Voir prepare_section
+
+        Returns:
+            PreparedSection (partagé, lecture seule)
+        """
+        key = self.make_key(section, rebars, fiber_area, mesh_method, mesh_options, integration)
+        with self._lock:
+            state = self._entries.get(key)
+            if state is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return state
+            self.misses += 1
+
+        state = prepare_section(section, rebars, fiber_area, mesh_method, mesh_options, integration)
+
+        with self._lock:
+            self._entries[key] = state
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return state
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Statistiques : hits, misses, size, maxsize"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Cache partagé utilisé par validate_and_solve
+default_solver_cache = SolverStateCache()
@@ -0,0 +1,407 @@
+"""
+Analyse d'un élément (poutre ou poteau) à partir de tables moment-courbure
+
+L'élément est discrétisé en stations. La relation M-κ de chaque section
+(à effort normal constant) est calculée une seule fois par
+MomentCurvatureAnalysis, puis interpolée : les stations dont la section a le
+même contenu (géométrie, armatures, matériaux, maillage) partagent la même
+table. Les flèches s'obtiennent par double intégration des courbures
+(w'' = -κ) et l'effet P-delta des poteaux élancés par itération sur la
+déformée, sans appel au solveur de fibres pendant les itérations.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from opensection.solver.moment_curvature import MomentCurvatureAnalysis
+from opensection.solver.section_solver import SectionSolver
+from opensection.utils import content_fingerprint
+
+# Segment d'élément : (x_début, x_fin, solveur de la section)
+Segment = Tuple[float, float, SectionSolver]
+
+
+@dataclass
+class MomentCurvatureTable:
+    """
+    Relation M-κ tabulée d'une section, dans les deux sens de flexion
+
+    Les courbures négatives correspondent à la flexion de sens opposé
+    (angle + π). Chaque branche est limitée à son moment maximal, de sorte que
+    le moment est croissant avec la courbure et s'inverse par interpolation.
+
+    Attributes:
+        curvature: Courbures signées κ (1/m), croissantes
+        moment: Moments signés correspondants (kN·m), croissants
+        N: Effort normal de la table (kN)
+        angle: Direction du côté comprimé des courbures positives (radians)
+    """
+
+    curvature: np.ndarray
+    moment: np.ndarray
+    N: float
+    angle: float
+
+    @classmethod
+    def from_analysis(
+        cls,
+        analysis: MomentCurvatureAnalysis,
+        N: float = 0.0,
+        angle: float = 0.0,
+        n_points: int = 60,
+    ) -> "MomentCurvatureTable":
+        """
+        Calcule la table jusqu'aux moments maximaux des deux sens de flexion
+
+        Args:
+            analysis: Analyse moment-courbure de la section
+            N: Effort normal constant (kN, compression positive)
+            angle: Direction du côté comprimé des courbures positives (radians)
+            n_points: Nombre de courbures par sens de flexion
+
+        Returns:
+            MomentCurvatureTable
+        """
+        branches = []
+        for direction in (angle, angle + np.pi):
+            curve = analysis.compute_to_failure(N, direction, n_points)
+            kappa = curve.curvature[curve.converged]
+            moment = curve.moment[curve.converged]
+            peak = int(np.argmax(moment))
+            branches.append((kappa[: peak + 1], moment[: peak + 1]))
+
+        (kappa_pos, moment_pos), (kappa_neg, moment_neg) = branches
+        # Sens opposé : courbure et moment changent de signe ; κ = 0 est commun
+        curvature = np.concatenate([-kappa_neg[:0:-1], kappa_pos])
+        moment = np.concatenate([-moment_neg[:0:-1], moment_pos])
+        return cls(
+            curvature=curvature,
+            moment=np.maximum.accumulate(moment),
+            N=float(N),
+            angle=float(angle),
+        )
+
+    @property
+    def M_min(self) -> float:
+        """Moment maximal de la flexion de sens opposé (kN·m, négatif)"""
+        return float(self.moment[0])
+
+    @property
+    def M_max(self) -> float:
+        """Moment maximal de la flexion de sens positif (kN·m)"""
+        return float(self.moment[-1])
+
+    def curvature_at(self, moments: np.ndarray) -> np.ndarray:
+        """
+        Courbures correspondant à des moments, par interpolation linéaire
+
+        Args:
+            moments: Moments signés (kN·m)
+
+        Returns:
+            Courbures (1/m) ; NaN pour les moments hors de [M_min, M_max] (rupture)
+        """
+        moments = np.asarray(moments, dtype=float)
+        kappa = np.interp(moments, self.moment, self.curvature)
+        return np.where((moments >= self.M_min) & (moments <= self.M_max), kappa, np.nan)
+
+
+@dataclass
+class MemberResult:
+    """
+    Résultats d'une analyse d'élément aux stations
+
+    Attributes:
+        x: Abscisses des stations (m)
+        moment: Moments (kN·m), du second ordre le cas échéant
+        curvature: Courbures (1/m)
+        rotation: Rotations w' (rad)
+        deflection: Flèches w (m), positives du côté des moments positifs
+        N: Effort normal (kN)
+        converged: True si les itérations P-delta ont convergé sans rupture
+        failed: True si un moment dépasse la capacité d'une station
+        n_iter: Nombre d'itérations (1 au premier ordre)
+    """
+
+    x: np.ndarray
+    moment: np.ndarray
+    curvature: np.ndarray
+    rotation: np.ndarray
+    deflection: np.ndarray
+    N: float
+    converged: bool
+    failed: bool
+    n_iter: int
+
+    @property
+    def max_deflection(self) -> float:
+        """Flèche de plus grande valeur absolue (m), signée"""
+        return float(self.deflection[np.argmax(np.abs(self.deflection))])
+
+    @property
+    def max_moment(self) -> float:
+        """Moment de plus grande valeur absolue (kN·m), signé"""
+        return float(self.moment[np.argmax(np.abs(self.moment))])
+
+
+def _cumulative_trapezoid(values: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Intégrale cumulée par la méthode des trapèzes, nulle en x[0]"""
+    increments = 0.5 * (values[1:] + values[:-1]) * np.diff(x)
+    return np.concatenate([[0.0], np.cumsum(increments)])
+
+
+class MemberAnalysis:
+    """
+    Flèches et effets du second ordre d'une poutre ou d'un poteau
+
+    Appuis disponibles :
+    - "simply_supported" : w(0) = w(L) = 0 ; N appliqué sur la corde
+    - "cantilever" : encastrement en x = 0 (w = w' = 0), N appliqué en x = L
+
+    Les tables M-κ sont mémorisées par contenu de section et par effort normal ;
+    une instance les réutilise pour toutes les stations et tous les appels.
+    """
+
+    SUPPORTS = ("simply_supported", "cantilever")
+
+    def __init__(
+        self,
+        length: float,
+        sections: Union[SectionSolver, Sequence[Segment]],
+        n_stations: int = 41,
+        support: str = "simply_supported",
+        angle: float = 0.0,
+        n_points: int = 60,
+    ):
+        """
+        Args:
+            length: Longueur de l'élément (m)
+            sections: Solveur de la section courante, ou segments
+                (x_début, x_fin, solveur) couvrant [0, length]
+            n_stations: Nombre de stations (>= 3), réparties uniformément
+            support: Conditions d'appui (voir SUPPORTS)
+            angle: Direction du côté comprimé des moments positifs (radians,
+                0 : côté +y comprimé, moment M_z positif)
+            n_points: Courbures par sens de flexion dans les tables M-κ
+        """
+        if length <= 0:
+            raise ValueError("La longueur de l'élément doit être positive")
+        if n_stations < 3:
+            raise ValueError("n_stations doit être >= 3")
+        if support not in self.SUPPORTS:
+            raise ValueError(f"Conditions d'appui inconnues : {support!r}")
+
+        self.length = float(length)
+        self.support = support
+        self.angle = float(angle)
+        self.n_points = n_points
+        self.x = np.linspace(0.0, self.length, n_stations)
+
+        if isinstance(sections, SectionSolver):
+            sections = [(0.0, self.length, sections)]
+
+        # Regroupement des stations par contenu de section
+        self._solvers: List[SectionSolver] = []
+        self._analyses: List[MomentCurvatureAnalysis] = []
+        keys: Dict[str, int] = {}
+        self._station_group = np.full(n_stations, -1, dtype=int)
+        for x_start, x_end, solver in sections:
+            key = self._section_key(solver)
+            if key not in keys:
+                keys[key] = len(self._solvers)
+                self._solvers.append(solver)
+                self._analyses.append(MomentCurvatureAnalysis(solver))
+            inside = (self.x >= x_start) & (self.x <= x_end) & (self._station_group < 0)
+            self._station_group[inside] = keys[key]
+        self._group_keys = list(keys)
+        if np.any(self._station_group < 0):
+            raise ValueError("Les segments ne couvrent pas toute la longueur de l'élément")
+
+        self._tables: Dict[Tuple[str, float], MomentCurvatureTable] = {}
+
+    @staticmethod
+    def _section_key(solver: SectionSolver) -> str:
+        """Empreinte du contenu d'une section : géométrie, armatures, matériaux, maillage"""
+        zones = [
+            (contour.to_array(), contour.is_hole, material.fingerprint())
+            for contour, material in solver.concrete_zones
+        ]
+        return content_fingerprint(
+            solver.section.fingerprint(),
+            solver.rebars.fingerprint(),
+            solver.concrete.fingerprint(),
+            solver.steel.fingerprint(),
+            zones,
+            solver.integration,
+            solver.fibers,
+        )
+
+    @property
+    def n_tables(self) -> int:
+        """Nombre de tables M-κ calculées"""
+        return len(self._tables)
+
+    def table(self, group: int, N: float = 0.0) -> MomentCurvatureTable:
+        """
+        Table M-κ d'un groupe de stations, calculée au premier appel
+
+        Args:
+            group: Indice du groupe de sections (voir station_groups)
+            N: Effort normal (kN)
+
+        Returns:
+            MomentCurvatureTable
+        """
+        key = (self._group_keys[group], float(N))
+        table = self._tables.get(key)
+        if table is None:
+            table = MomentCurvatureTable.from_analysis(
+                self._analyses[group], N, self.angle, self.n_points
+            )
+            self._tables[key] = table
+        return table
+
+    @property
+    def station_groups(self) -> np.ndarray:
+        """Groupe de section de chaque station"""
+        return self._station_group.copy()
+
+    def _station_values(self, values: Union[float, np.ndarray, Callable]) -> np.ndarray:
+        """Valeurs aux stations d'une fonction de x, d'un tableau ou d'une constante"""
+        if callable(values):
+            values = values(self.x)
+        values = np.broadcast_to(np.asarray(values, dtype=float), self.x.shape)
+        return np.array(values, dtype=float)
+
+    def curvatures(self, moments: np.ndarray, N: float = 0.0) -> np.ndarray:
+        """
+        Courbures aux stations par interpolation des tables M-κ
+
+        Args:
+            moments: Moments aux stations (kN·m)
+            N: Effort normal (kN)
+
+        Returns:
+            Courbures (1/m) ; NaN aux stations dont le moment dépasse la capacité
+        """
+        moments = np.asarray(moments, dtype=float)
+        kappa = np.empty_like(moments)
+        for group in range(len(self._solvers)):
+            stations = self._station_group == group
+            kappa[stations] = self.table(group, N).curvature_at(moments[stations])
+        return kappa
+
+    def _integrate(self, kappa: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Rotations et flèches (w'' = -κ) selon les conditions d'appui"""
+        rotation = -_cumulative_trapezoid(kappa, self.x)
+        deflection = _cumulative_trapezoid(rotation, self.x)
+        if self.support == "simply_supported":
+            # Rotation initiale telle que w(L) = 0
+            theta_0 = -deflection[-1] / self.length
+            rotation = rotation + theta_0
+            deflection = deflection + theta_0 * self.x
+        return rotation, deflection
+
+    def _imperfection_shape(self) -> np.ndarray:
+        """Déformée initiale unitaire (premier mode), orientée comme celle des moments positifs"""
+        if self.support == "simply_supported":
+            return np.sin(np.pi * self.x / self.length)
+        return np.cos(0.5 * np.pi * self.x / self.length) - 1.0
+
+    def _eccentricity(self, w: np.ndarray) -> np.ndarray:
+        """Excentricité de N par rapport à sa ligne d'action"""
+        if self.support == "simply_supported":
+            return w
+        return w - w[-1]
+
+    def deflections(
+        self, moments: Union[float, np.ndarray, Callable], N: float = 0.0
+    ) -> MemberResult:
+        """
+        Flèches au premier ordre sous une distribution de moments
+
+        Args:
+            moments: Moments (kN·m) : fonction de x, valeurs aux stations ou constante
+            N: Effort normal (kN, compression positive)
+
+        Returns:
+            MemberResult (flèches NaN si une station est rompue)
+        """
+        M = self._station_values(moments)
+        kappa = self.curvatures(M, N)
+        rotation, deflection = self._integrate(kappa)
+        failed = bool(np.any(np.isnan(kappa)))
+        return MemberResult(
+            x=self.x.copy(),
+            moment=M,
+            curvature=kappa,
+            rotation=rotation,
+            deflection=deflection,
+            N=float(N),
+            converged=not failed,
+            failed=failed,
+            n_iter=1,
+        )
+
+    def second_order(
+        self,
+        moments: Union[float, np.ndarray, Callable],
+        N: float,
+        imperfection: float = 0.0,
+        tol: float = 1e-6,
+        max_iter: int = 100,
+    ) -> MemberResult:
+        """
+        Moments et flèches du second ordre (P-delta) à effort normal constant
+
+        Itère M = M0 + N·e(w + w0), où e est l'excentricité par rapport à la
+        ligne d'action de N et w0 l'imperfection, jusqu'à stabilisation de la
+        déformée. Seules les tables M-κ sont utilisées pendant les itérations.
+        Au-delà de la charge critique, les moments dépassent la capacité d'une
+        station : le résultat est signalé rompu.
+
+        Args:
+            moments: Moments du premier ordre M0 (kN·m) : fonction de x,
+                valeurs aux stations ou constante
+            N: Effort normal (kN, compression positive)
+            imperfection: Amplitude de la déformée initiale (m), selon le premier
+                mode de flambement ; positive, elle amplifie les moments positifs
+            tol: Tolérance sur la variation de flèche, relative à la flèche maximale
+            max_iter: Nombre maximal d'itérations
+
+        Returns:
+            MemberResult (flèches dues aux courbures, imperfection non incluse)
+        """
+        M0 = self._station_values(moments)
+        w0 = imperfection * self._imperfection_shape()
+        w = np.zeros_like(self.x)
+        M, kappa, rotation = M0, np.zeros_like(self.x), np.zeros_like(self.x)
+        converged = failed = False
+        iteration = 0
+
+        for iteration in range(1, max_iter + 1):
+            M = M0 + N * self._eccentricity(w + w0)
+            kappa = self.curvatures(M, N)
+            if np.any(np.isnan(kappa)):
+                failed = True
+                break
+            rotation, w_new = self._integrate(kappa)
+            change = float(np.max(np.abs(w_new - w)))
+            w = w_new
+            if change <= tol * max(float(np.max(np.abs(w))), 1e-12):
+                converged = True
+                break
+
+        return MemberResult(
+            x=self.x.copy(),
+            moment=M,
+            curvature=kappa,
+            rotation=rotation,
+            deflection=w,
+            N=float(N),
+            converged=converged,
+            failed=failed,
+            n_iter=iteration,
+        )
@@ -0,0 +1,264 @@
+"""
+Relation moment-courbure à effort normal constant (pilotage en courbure)
+
+SectionSolver.solve impose les efforts : au-delà du moment maximal, ou sur
+le palier du béton (module tangent nul), la matrice tangente devient
+singulière. Ici la courbure κ et sa direction sont imposées et seule la
+déformation au centre de gravité e0 est inconnue : N(e0) = N_Ed est une
+équation scalaire, croissante en e0 tant que les déformations restent dans
+les limites ε_cu2 (béton) et -ε_ud (acier). Elle est résolue par Newton
+protégé par l'encadrement correspondant (bissection si le pas de Newton en
+sort ou si dN/de0 s'annule) ; un pas sans racine admissible (rupture) est
+signalé non convergé. Chaque pas de courbure part de l'état convergé précédent,
+extrapolé linéairement.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from opensection.solver.section_solver import SectionSolver
+from opensection.utils import NumericalConstants
+
+# Pas initial de recherche d'encadrement sur e0
+_BRACKET_STEP = 1e-4
+
+
+@dataclass
+class MomentCurvatureResult:
+    """
+    Courbe moment-courbure, stockée en colonnes
+
+    Attributes:
+        curvature: Courbures imposées κ (1/m)
+        moment: Moment dans la direction de flexion (kN·m), M_z·cos(angle) + M_y·sin(angle)
+        epsilon_0: Déformation au centre de gravité
+        My: Moments autour de y (kN·m)
+        Mz: Moments autour de z (kN·m)
+        N: Efforts normaux obtenus (kN)
+        converged: Convergence de chaque pas
+        n_iter: Itérations de chaque pas
+        angle: Direction du côté comprimé (radians)
+    """
+
+    curvature: np.ndarray
+    moment: np.ndarray
+    epsilon_0: np.ndarray
+    My: np.ndarray
+    Mz: np.ndarray
+    N: np.ndarray
+    converged: np.ndarray
+    n_iter: np.ndarray
+    angle: float
+
+    def __len__(self) -> int:
+        return len(self.curvature)
+
+    @property
+    def deformations(self) -> np.ndarray:
+        """Vecteurs [e0, χ_y, χ_z] de tous les pas (n, 3)"""
+        return np.column_stack(
+            [
+                self.epsilon_0,
+                self.curvature * np.cos(self.angle),
+                self.curvature * np.sin(self.angle),
+            ]
+        )
+
+    @property
+    def peak_index(self) -> int:
+        """Indice du moment maximal"""
+        return int(np.argmax(self.moment))
+
+
+class MomentCurvatureAnalysis:
+    """
+    Calcule la relation moment-courbure d'une section à N constant
+
+    Une instance utilise les tampons de travail du solveur : elle n'est pas
+    thread-safe (un solveur par thread).
+    """
+
+    def __init__(self, solver: SectionSolver):
+        """
+        Args:
+            solver: Solveur de la section (géométrie, matériaux, armatures)
+        """
+        self.solver = solver
+        # ε_cu2 de chaque point du béton, allongement admissible de chaque barre
+        # (ε_ud de son acier moins sa prédéformation)
+        limits = solver.strain_limits()
+        self._vertices = limits.concrete_points
+        self._epsilon_cu2 = limits.epsilon_cu2
+        self._rebars = limits.rebar_points
+        self._elongation_limits = limits.elongation
+
+    def _admissible_range(self, chi: np.ndarray) -> Tuple[float, float]:
+        """
+        Encadrement de e0 à courbure fixée par les déformations limites
+
+        Au-delà de ε_cu2 (béton) ou de -ε_ud (acier), les lois chutent et N(e0)
+        n'est plus monotone : la racine cherchée est dans [e0_min, e0_max].
+        Chaque barre est limitée par l'ε_ud de son acier, prédéformation déduite ;
+        chaque point du béton par l'ε_cu2 de sa zone (SectionSolver.strain_limits).
+        """
+        upper = float(np.min(self._epsilon_cu2 - self._vertices @ chi))
+        lower = -np.inf
+        if len(self._rebars) > 0:
+            lower = -float(np.min(self._elongation_limits + self._rebars @ chi))
+        return lower, upper
+
+    def _axial_force(self, e0: float, chi: np.ndarray) -> Tuple[float, float, np.ndarray]:
+        """N(e0), dN/de0 et efforts [N, M_y, M_z] à courbure fixée"""
+        F, K = self.solver.compute_internal_forces(np.array([e0, chi[0], chi[1]]))
+        assert K is not None  # with_tangent=True
+        return float(F[0]), float(K[0, 0]), F
+
+    def _solve_e0(
+        self, N: float, chi: np.ndarray, e0: float, tol: float, max_iter: int
+    ) -> Tuple[float, np.ndarray, bool, int]:
+        """
+        Résout N(e0) = N à courbure fixée : Newton protégé par un encadrement
+
+        Returns:
+            (e0, efforts, convergé, itérations)
+        """
+        lower, upper = self._admissible_range(chi)
+        e0 = min(max(e0, lower), upper)
+        # Bornes confirmées par le signe d'un résidu évalué (sinon : limites admissibles)
+        found_lower = found_upper = False
+        step = _BRACKET_STEP
+        for iteration in range(1, max_iter + 1):
+            N_e0, dN, F = self._axial_force(e0, chi)
+            residual = N_e0 - N
+            if abs(residual) <= tol:
+                return e0, F, True, iteration
+
+            # N croît avec e0 : le signe du résidu place e0 par rapport à la racine
+            if residual > 0:
+                upper, found_upper = e0, True
+            else:
+                lower, found_lower = e0, True
+
+            if upper - lower <= NumericalConstants.EPSILON_ZERO * max(1.0, abs(e0)):
+                # Racine localisée à la précision machine, éventuellement sur une
+                # limite admissible (plan ultime) ; sinon aucune racine admissible
+                if found_lower and found_upper:
+                    return e0, F, True, iteration
+                bound = lower if found_upper else upper
+                N_bound, _, F_bound = self._axial_force(bound, chi)
+                on_limit = (N_bound - N <= tol) if found_upper else (N_bound - N >= -tol)
+                if on_limit and lower <= upper:
+                    return bound, F_bound, True, iteration + 1
+                return e0, F, False, iteration + 1
+
+            candidate = e0 - residual / dN if dN > NumericalConstants.EPSILON_ZERO else np.nan
+            if np.isfinite(lower):
+                if not lower < candidate < upper:
+                    candidate = 0.5 * (lower + upper)
+            elif not np.isfinite(candidate) or abs(candidate - e0) > step:
+                # Pas de borne inférieure (sans armatures) : pas croissants vers la racine
+                candidate = e0 - step
+                step *= 2.0
+            e0 = float(candidate)
+
+        N_e0, _, F = self._axial_force(e0, chi)
+        return e0, F, abs(N_e0 - N) <= tol, max_iter
+
+    def compute(
+        self,
+        curvatures: np.ndarray,
+        N: float = 0.0,
+        angle: float = 0.0,
+        tol: Optional[float] = None,
+        max_iter: Optional[int] = None,
+        e0_start: Optional[float] = None,
+    ) -> MomentCurvatureResult:
+        """
+        Courbe moment-courbure pour des courbures imposées
+
+        Les courbures sont parcourues dans l'ordre donné (en général
+        croissantes) ; chaque pas part de e0 extrapolé des deux pas précédents.
+
+        Args:
+            curvatures: Courbures κ (1/m), dans l'ordre du chargement
+            N: Effort normal constant (kN, compression positive)
+            angle: Direction du côté comprimé dans le plan (y, z), en radians
+                (0 : côté +y comprimé, moment M_z positif)
+            tol: Tolérance sur N (kN, défaut NumericalConstants.TOL_FORCE_DEFAULT)
+            max_iter: Itérations maximales par pas (défaut NumericalConstants.MAX_ITER_DEFAULT)
+            e0_start: Déformation initiale du premier pas (défaut : N/EA)
+
+        Returns:
+            MomentCurvatureResult
+        """
+        tol = NumericalConstants.TOL_FORCE_DEFAULT if tol is None else tol
+        max_iter = NumericalConstants.MAX_ITER_DEFAULT if max_iter is None else max_iter
+        curvatures = np.atleast_1d(np.asarray(curvatures, dtype=float))
+        direction = np.array([np.cos(angle), np.sin(angle)])
+
+        n = len(curvatures)
+        e0_values = np.zeros(n)
+        forces = np.zeros((n, 3))
+        converged = np.zeros(n, dtype=bool)
+        n_iter = np.zeros(n, dtype=int)
+
+        e0 = self.solver._initial_guess(N)[0] if e0_start is None else float(e0_start)
+        for i, kappa in enumerate(curvatures):
+            guess = e0
+            if i >= 2 and converged[i - 1] and converged[i - 2]:
+                # Prédicteur : extrapolation linéaire de e0 en fonction de κ
+                dk = curvatures[i - 1] - curvatures[i - 2]
+                if dk != 0.0:
+                    slope = (e0_values[i - 1] - e0_values[i - 2]) / dk
+                    guess = e0 + slope * (kappa - curvatures[i - 1])
+
+            e0_i, F, converged[i], n_iter[i] = self._solve_e0(
+                N, kappa * direction, guess, tol, max_iter
+            )
+            e0_values[i] = e0_i
+            forces[i] = F
+            if converged[i]:
+                e0 = e0_i
+
+        return MomentCurvatureResult(
+            curvature=curvatures,
+            moment=forces[:, 2] * direction[0] + forces[:, 1] * direction[1],
+            epsilon_0=e0_values,
+            My=forces[:, 1],
+            Mz=forces[:, 2],
+            N=forces[:, 0],
+            converged=converged,
+            n_iter=n_iter,
+            angle=angle,
+        )
+
+    def ultimate_curvature(self, N: float = 0.0, angle: float = 0.0) -> float:
+        """
+        Courbure ultime sous N : celle du plan de déformation ultime (pivots
+        A, B ou C) d'effort normal N (voir compute_capacity)
+        """
+        # Import différé : le module interaction dépend du solveur
+        from opensection.interaction.capacity import compute_capacity
+
+        capacity = compute_capacity(self.solver, N, angle, tolerance=1e-12)
+        return float(np.hypot(capacity.deformation[1], capacity.deformation[2]))
+
+    def compute_to_failure(
+        self, N: float = 0.0, angle: float = 0.0, n_points: int = 50, **options
+    ) -> MomentCurvatureResult:
+        """
+        Courbe moment-courbure de κ = 0 jusqu'à la courbure ultime
+
+        Args:
+            N: Effort normal constant (kN)
+            angle: Direction du côté comprimé (radians)
+            n_points: Nombre de courbures, réparties uniformément
+            **options: Options de compute (tol, max_iter)
+
+        Returns:
+            MomentCurvatureResult (dernier point : rupture du béton ou de l'acier)
+        """
+        kappa_u = self.ultimate_curvature(N, angle)
+        return self.compute(np.linspace(0.0, kappa_u, n_points), N, angle, **options)
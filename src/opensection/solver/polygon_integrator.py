@@ -0,0 +1,198 @@
+"""
+Intégration des efforts du béton directement sur les contours (sans maillage)
+
+La déformation étant linéaire en (y, z), le domaine de chaque contour est
+découpé par les droites d'iso-déformation bornant les branches de la loi
+parabole-rectangle. Sur chaque morceau, la contrainte est une fonction de la
+seule coordonnée u mesurée selon le gradient de déformation ; le théorème de
+Green ramène alors chaque intégrale de surface à une intégrale sur les arêtes
+du morceau :
+
+    ∫∫ h(u) v^m dA = ∮ H(u) v^m dv      avec H' = h
+
+H est évaluée par une quadrature de Gauss-Legendre interne et l'intégrale de
+bord par une quadrature de Gauss-Legendre sur chaque arête. Les deux règles à
+3 points sont exactes pour la loi parabole-rectangle avec n = 2 ; pour le béton
+haute résistance (n non entier), le résultat reste une approximation d'ordre
+élevé. Le coût par évaluation est proportionnel au nombre de sommets des
+contours, et non au nombre de fibres.
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from opensection.geometry.contour import Contour
+from opensection.geometry.mesh import clip_polygon_half_plane, polygon_area_moments
+
+# Gauss-Legendre à 3 points sur [0, 1]
+_GL_POINTS = 0.5 + 0.5 * np.array([-np.sqrt(0.6), 0.0, np.sqrt(0.6)])
+_GL_WEIGHTS = np.array([5.0, 8.0, 5.0]) / 18.0
+
+
+class PolygonIntegrator:
+    """
+    Intégrateur des résultantes et de la rigidité tangente du béton sur les contours
+
+    Attributes:
+        contours: Liste de (sommets centrés (n, 2), signe) ; le signe tient compte
+            de l'orientation du contour et des trous
+    """
+
+    def __init__(self, contours: Sequence[Contour], yc: float, zc: float):
+        """
+        Args:
+            contours: Contours de la section
+            yc, zc: Point de référence des déformations (centre de gravité)
+        """
+        self.contours: List[Tuple[np.ndarray, float]] = []
+        for contour in contours:
+            coords = contour.to_array() - np.array([yc, zc])
+            orientation = np.sign(polygon_area_moments(coords)[0])
+            if orientation == 0:
+                continue
+            sign = -orientation if contour.is_hole else orientation
+            self.contours.append((coords, float(sign)))
+
+    @staticmethod
+    def _bands(material) -> List[Tuple[float, float]]:
+        """Intervalles de déformation sur lesquels la loi est régulière et non nulle"""
+        return [(0.0, material.epsilon_c2), (material.epsilon_c2, material.epsilon_cu2)]
+
+    def _clipped_pieces(self, d: np.ndarray, lo: float, hi: float):
+        """Morceaux des contours où lo <= e <= hi, avec leur signe"""
+        epsilon_0, chi_y, chi_z = d
+        for coords, sign in self.contours:
+            eps = epsilon_0 + chi_y * coords[:, 0] + chi_z * coords[:, 1]
+            piece = clip_polygon_half_plane(coords, eps - lo)
+            if len(piece) >= 3:
+                eps = epsilon_0 + chi_y * piece[:, 0] + chi_z * piece[:, 1]
+                piece = clip_polygon_half_plane(piece, hi - eps)
+            if len(piece) >= 3:
+                yield piece, sign
+
+    def integrate(self, material, d: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcule les résultantes et la matrice tangente du béton
+
+        Args:
+            material: Loi béton (ConcreteEC2 : epsilon_c2, epsilon_cu2 et lois vectorisées)
+            d: Vecteur [e0, χ_y, χ_z]
+
+        Returns:
+            F: [∫σ dA, ∫σ z dA, ∫σ y dA] (MPa·m²)
+            K: Matrice tangente 3x3 (mêmes unités que la somme sur les fibres)
+        """
+        epsilon_0, chi_y, chi_z = d
+        kappa = np.hypot(chi_y, chi_z)
+        # Repère (u, v) : u selon le gradient de déformation (direct, det = +1)
+        if kappa > 0:
+            cos_t, sin_t = chi_y / kappa, chi_z / kappa
+        else:
+            cos_t, sin_t = 1.0, 0.0
+        rotation = np.array([[cos_t, -sin_t], [sin_t, cos_t]])
+
+        # Intégrales [σ, σu, σv, Et, Et·u, Et·v, Et·u², Et·uv, Et·v²]
+        totals = np.zeros(9)
+        for lo, hi in self._bands(material):
+            pieces = list(self._clipped_pieces(d, lo, hi))
+            if not pieces:
+                continue
+
+            # Arêtes de tous les morceaux dans le repère (u, v)
+            starts, ends, signs, origins = [], [], [], []
+            for piece, sign in pieces:
+                uv = piece @ rotation
+                starts.append(uv)
+                ends.append(np.roll(uv, -1, axis=0))
+                signs.append(np.full(len(uv), sign))
+                # Origine de H : u moyen du morceau (reste dans la bande)
+                origins.append(np.full(len(uv), uv[:, 0].mean()))
+            a = np.vstack(starts)
+            b = np.vstack(ends)
+            sign = np.concatenate(signs)
+            u0 = np.concatenate(origins)
+
+            # Points de Gauss sur les arêtes (n_arêtes, 3)
+            u_q = a[:, 0:1] + _GL_POINTS * (b[:, 0:1] - a[:, 0:1])
+            v_q = a[:, 1:2] + _GL_POINTS * (b[:, 1:2] - a[:, 1:2])
+            dv = b[:, 1] - a[:, 1]
+
+            # Points internes pour H(u_q) = ∫_{u0}^{u_q} h (n_arêtes, 3, 3)
+            span = u_q - u0[:, None]
+            tau = u0[:, None, None] + _GL_POINTS * span[:, :, None]
+            eps = np.clip(epsilon_0 + kappa * tau, lo, hi)
+            sigma, Et = material.stress_and_tangent(eps)
+
+            H = np.stack(
+                [
+                    sigma,
+                    sigma * tau,
+                    Et,
+                    Et * tau,
+                    Et * tau * tau,
+                ]
+            )
+            H = np.sum(H * _GL_WEIGHTS, axis=-1) * span  # (5, n_arêtes, 3)
+
+            edge_weight = (sign * dv)[:, None] * _GL_WEIGHTS  # (n_arêtes, 3)
+            H_s, H_su, H_e, H_eu, H_euu = (np.sum(h * edge_weight, axis=1) for h in H)
+            H_sv = np.sum(H[0] * v_q * edge_weight, axis=1)
+            H_ev = np.sum(H[2] * v_q * edge_weight, axis=1)
+            H_evv = np.sum(H[2] * v_q * v_q * edge_weight, axis=1)
+            H_euv = np.sum(H[3] * v_q * edge_weight, axis=1)
+
+            totals += [
+                H_s.sum(),
+                H_su.sum(),
+                H_sv.sum(),
+                H_e.sum(),
+                H_eu.sum(),
+                H_ev.sum(),
+                H_euu.sum(),
+                H_euv.sum(),
+                H_evv.sum(),
+            ]
+
+        s, s_u, s_v, e, e_u, e_v, e_uu, e_uv, e_vv = totals
+
+        # Retour au repère (y, z) : y = c·u - s·v, z = s·u + c·v
+        s_y = cos_t * s_u - sin_t * s_v
+        s_z = sin_t * s_u + cos_t * s_v
+        e_y = cos_t * e_u - sin_t * e_v
+        e_z = sin_t * e_u + cos_t * e_v
+        e_yy = cos_t**2 * e_uu - 2 * cos_t * sin_t * e_uv + sin_t**2 * e_vv
+        e_zz = sin_t**2 * e_uu + 2 * cos_t * sin_t * e_uv + cos_t**2 * e_vv
+        e_yz = cos_t * sin_t * (e_uu - e_vv) + (cos_t**2 - sin_t**2) * e_uv
+
+        F = np.array([s, s_z, s_y])
+        K = np.array(
+            [
+                [e, e_y, e_z],
+                [e_z, e_yz, e_zz],
+                [e_y, e_yy, e_yz],
+            ]
+        )
+        return F, K
+
+    def max_stress(self, material, d: np.ndarray) -> float:
+        """
+        Contrainte maximale du béton sur la section
+
+        La loi étant croissante sur chaque bande et la déformation linéaire, le
+        maximum est atteint en un sommet d'un morceau découpé.
+
+        Args:
+            material: Loi béton
+            d: Vecteur [e0, χ_y, χ_z]
+
+        Returns:
+            max |σ| (MPa)
+        """
+        epsilon_0, chi_y, chi_z = d
+        sigma_max = 0.0
+        for lo, hi in self._bands(material):
+            for piece, _ in self._clipped_pieces(d, lo, hi):
+                eps = np.clip(epsilon_0 + chi_y * piece[:, 0] + chi_z * piece[:, 1], lo, hi)
+                sigma_max = max(sigma_max, float(np.max(np.abs(material.stress_vectorized(eps)))))
+        return sigma_max
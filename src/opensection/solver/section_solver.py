@@ -4,15 +4,18 @@ Méthode de Newton-Raphson avec discrétisation par fibres
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from opensection.geometry.contour import Contour
 from opensection.geometry.section import Section
 from opensection.materials.concrete import ConcreteEC2
 from opensection.materials.steel import SteelEC2
 from opensection.reinforcement.rebar import RebarGroup
-from opensection.utils import NumericalConstants, UnitConverter, clamp, is_converged, safe_divide
+from opensection.solver.cache import PreparedSection, SolverStateCache, prepare_section
+from opensection.solver.polygon_integrator import PolygonIntegrator
+from opensection.utils import NumericalConstants, UnitConverter, is_converged
 
 
 @dataclass
@@ -42,11 +45,252 @@ class SolverResult:
         return abs(self.epsilon_0) / np.sqrt(self.chi_y**2 + self.chi_z**2)
 
 
+@dataclass
+class BatchSolverResult:
+    """
+    Résultats d'une résolution multi-cas, stockés en colonnes
+
+    Chaque attribut est un tableau de longueur n_cases, dans l'ordre des cas
+    de charge fournis à SectionSolver.solve_many.
+    """
+
+    epsilon_0: np.ndarray  # Déformation axiale au CG
+    chi_y: np.ndarray  # Courbure autour de y
+    chi_z: np.ndarray  # Courbure autour de z
+    N: np.ndarray  # Effort normal (kN)
+    My: np.ndarray  # Moment autour de y (kN·m)
+    Mz: np.ndarray  # Moment autour de z (kN·m)
+    sigma_c_max: np.ndarray  # Contrainte béton max (MPa)
+    sigma_s_max: np.ndarray  # Contrainte acier max (MPa)
+    converged: np.ndarray  # Convergence (bool)
+    n_iter: np.ndarray  # Nombre d'itérations
+    reason: np.ndarray  # 'converged' | 'singular' | 'max_iter'
+
+    def __len__(self) -> int:
+        return len(self.epsilon_0)
+
+    @property
+    def deformations(self) -> np.ndarray:
+        """Vecteurs [e0, χ_y, χ_z] de tous les cas (n_cases, 3)"""
+        return np.column_stack([self.epsilon_0, self.chi_y, self.chi_z])
+
+    def to_result(self, i: int) -> SolverResult:
+        """Extrait le résultat du cas i sous forme de SolverResult"""
+        return SolverResult(
+            epsilon_0=float(self.epsilon_0[i]),
+            chi_y=float(self.chi_y[i]),
+            chi_z=float(self.chi_z[i]),
+            N=float(self.N[i]),
+            My=float(self.My[i]),
+            Mz=float(self.Mz[i]),
+            sigma_c_max=float(self.sigma_c_max[i]),
+            sigma_s_max=float(self.sigma_s_max[i]),
+            converged=bool(self.converged[i]),
+            n_iter=int(self.n_iter[i]),
+            reason=str(self.reason[i]),
+        )
+
+
+@dataclass
+class StrainLimits:
+    """
+    Déformations limites des matériaux d'un solveur, en coordonnées centrées
+
+    Attributes:
+        concrete_points: Points limites du béton (n, 2)
+        epsilon_cu2: Déformation ultime du béton en chaque point
+        epsilon_c2: Déformation au pic du même béton en chaque point
+        rebar_points: Positions des armatures (m, 2)
+        elongation: Allongement admissible de chaque armature (convention du
+            solveur : ε ≥ -elongation), ε_ud de son acier moins sa prédéformation
+    """
+
+    concrete_points: np.ndarray
+    epsilon_cu2: np.ndarray
+    epsilon_c2: np.ndarray
+    rebar_points: np.ndarray
+    elongation: np.ndarray
+
+
+def _points_on_edges(coords: np.ndarray, points: np.ndarray, tol: float) -> np.ndarray:
+    """Points (n, 2) situés à moins de tol d'une arête du polygone coords"""
+    edges = np.roll(coords, -1, axis=0) - coords
+    offsets = points[:, None, :] - coords[None, :, :]
+    lengths = np.maximum(np.einsum("ij,ij->i", edges, edges), NumericalConstants.EPSILON_ZERO)
+    s = np.clip(np.einsum("nij,ij->ni", offsets, edges) / lengths, 0.0, 1.0)
+    distances = np.linalg.norm(offsets - s[:, :, None] * edges[None, :, :], axis=2)
+    return np.any(distances <= tol, axis=1)
+
+
+# Nombre maximal d'éléments (cas x fibres) des tableaux de travail multi-cas
+_BATCH_BLOCK = 1 << 22
+
+# Attributs reconstruits après désérialisation (voir SectionSolver.__getstate__)
+_TRANSIENT_ATTRIBUTES = frozenset(
+    ["prepared", "polygon_integrator", "fibers", "rebar_array", "yc", "zc", "_groups"]
+    + ["_state_d", "_state_F", "_state_K_polygon"]
+)
+
+
+class _FiberGroup:
+    """
+    Points d'intégration d'un même type (fibres béton ou armatures)
+
+    Les tableaux géométriques, préparés une seule fois en coordonnées centrées,
+    sont G = [1, y, z], H = A·[1, z, y] et W = H ⊗ G aplati (n, 9), de sorte
+    que F = Hᵀ·σ et K = Et·W (remis en 3x3). Les tampons eps, sigma et Et,
+    propres au solveur, sont réutilisés d'une évaluation mono-cas à l'autre.
+
+    Les points sont triés par matériau : chaque loi est évaluée sur une tranche
+    contiguë des tampons (segments), tandis que G·d, Hᵀ·σ et Et·W restent un
+    seul produit pour tout le groupe.
+
+    Les lois sont évaluées dans leur propre convention de signe : pour les
+    aciers (traction positive), ε = -(G·d) + ε_p0 avec la prédéformation
+    éventuelle des barres, et σ change de signe ; Et est inchangé.
+    """
+
+    # Signe de la convention des lois par rapport au solveur (compression positive)
+    _SIGNS = {"concrete": 1.0, "steel": -1.0}
+
+    def __init__(
+        self,
+        kind: str,
+        segments: List[Tuple[slice, Any]],
+        G: np.ndarray,
+        H: np.ndarray,
+        W: np.ndarray,
+        initial_strain: Optional[np.ndarray] = None,
+    ):
+        """
+        Args:
+            kind: "concrete" ou "steel"
+            segments: Tranches (slice, loi) couvrant les points, une par matériau
+                (loi : stress_and_tangent, stress_vectorized)
+            G, H, W: Matrices géométriques des points triés par matériau (voir
+                cache.group_geometry)
+            initial_strain: Prédéformations des points dans la convention de la
+                loi (None si toutes nulles)
+        """
+        self.kind = kind
+        self.segments = segments
+        self.G = G
+        self.H = H
+        self.W = W
+        self.sign = self._SIGNS[kind]
+        self.initial_strain = initial_strain
+
+        # Tampons de travail mono-cas
+        self.eps = np.empty(len(G))
+        self.sigma = np.empty(len(G))
+        self.Et = np.empty(len(G))
+
+    @classmethod
+    def sorted_by_material(
+        cls,
+        kind: str,
+        geometry: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        default: Any,
+        materials: Sequence[Any] = (),
+        index: Optional[np.ndarray] = None,
+        initial_strain: Optional[np.ndarray] = None,
+    ) -> "_FiberGroup":
+        """
+        Groupe dont les points sont triés (tri stable) par indice de matériau
+
+        Args:
+            kind: "concrete" ou "steel"
+            geometry: Matrices (G, H, W) des points dans l'ordre préparé
+            default: Matériau des points d'indice -1
+            materials: Matériaux des indices 0, 1, ...
+            index: Indice de matériau de chaque point (None : tous par défaut)
+            initial_strain: Prédéformations des points (None si toutes nulles)
+        """
+        n = len(geometry[0])
+        if index is None or not np.any(index >= 0):
+            return cls(kind, [(slice(0, n), default)], *geometry, initial_strain)
+
+        # Copie unique, triée, des matrices partagées
+        order = np.argsort(index, kind="stable")
+        index = index[order]
+        G, H, W = (array[order] for array in geometry)
+        if initial_strain is not None:
+            initial_strain = initial_strain[order]
+
+        bounds = np.flatnonzero(np.diff(index)) + 1
+        segments = [
+            (slice(start, end), default if index[start] < 0 else materials[index[start]])
+            for start, end in zip([0, *bounds.tolist()], [*bounds.tolist(), n])
+        ]
+        return cls(kind, segments, G, H, W, initial_strain)
+
+    def __len__(self) -> int:
+        return len(self.G)
+
+    def material_strain(self, eps: np.ndarray) -> np.ndarray:
+        """Convertit en place des déformations G·d dans la convention des lois"""
+        if self.sign < 0:
+            np.negative(eps, out=eps)
+        if self.initial_strain is not None:
+            eps += self.initial_strain
+        return eps
+
+    def evaluate(self, d: np.ndarray) -> np.ndarray:
+        """
+        Évalue les lois aux points du groupe et mémorise σ et Et dans les tampons
+
+        Returns:
+            Contribution Hᵀ·σ aux efforts (3,), en MPa·m²
+        """
+        np.dot(self.G, d, out=self.eps)
+        self.material_strain(self.eps)
+        for block, material in self.segments:
+            material.stress_and_tangent(self.eps[block], self.sigma[block], self.Et[block])
+        return self.sign * (self.sigma @ self.H)
+
+    def evaluate_batch(
+        self, D: np.ndarray, with_tangent: bool = True
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Évalue les lois pour plusieurs déformations (n_cases, 3)
+
+        Returns:
+            Contributions Hᵀ·σ (n_cases, 3) et Et·W (n_cases, 9) ou None, en MPa·m²
+        """
+        eps = self.material_strain(D @ self.G.T)
+        if with_tangent:
+            sigma, Et = np.empty_like(eps), np.empty_like(eps)
+            for block, material in self.segments:
+                sigma[:, block], Et[:, block] = material.stress_and_tangent(eps[:, block])
+            return self.sign * (sigma @ self.H), Et @ self.W
+        return self.sign * (self.stress_batch(eps) @ self.H), None
+
+    def stress_batch(self, eps: np.ndarray) -> np.ndarray:
+        """Contraintes (n_cases, n) pour des déformations déjà converties"""
+        sigma = np.empty_like(eps)
+        for block, material in self.segments:
+            sigma[:, block] = material.stress_vectorized(eps[:, block])
+        return sigma
+
+    def tangent(self) -> np.ndarray:
+        """Contribution Et·W à la matrice tangente (3, 3) au dernier point évalué"""
+        return (self.Et @ self.W).reshape(3, 3)
+
+    def max_stress(self) -> float:
+        """Contrainte maximale en valeur absolue au dernier point évalué (MPa)"""
+        return float(np.max(np.abs(self.sigma)))
+
+
 class SectionSolver:
     """
     Solveur pour section en flexion composée déviée
     Résout le système : F(d) = S
     où d = (e0, χ_y, χ_z) et S = (N, M_y, M_z)
+
+    La géométrie des fibres et des armatures (coordonnées centrées, matrices
+    [1, y, z]) est préparée à la construction et les tableaux de travail sont
+    réutilisés d'un appel à l'autre : une instance n'est pas thread-safe, il
+    faut un solveur par thread.
     """
 
     def __init__(
@@ -56,27 +300,223 @@ class SectionSolver:
         steel: SteelEC2,
         rebars: RebarGroup,
         fiber_area: float = 0.0001,
+        mesh_method: str = "grid",
+        mesh_options: Optional[Dict[str, Any]] = None,
+        integration: str = "fiber",
+        cache: Optional[SolverStateCache] = None,
+        concrete_zones: Optional[Sequence[Tuple[Contour, Any]]] = None,
     ):
         """
         Args:
             section: Section géométrique
-            concrete: Matériau béton
-            steel: Matériau acier
-            rebars: Groupe d'armatures
+            concrete: Matériau béton (fibres hors des zones concrete_zones)
+            steel: Matériau acier des armatures (SteelEC2, PrestressingSteelEC2
+                ou StructuralSteelEC3)
+            rebars: Groupe d'armatures (prédéformations éventuelles des torons,
+                matériaux propres à certaines armatures, voir RebarGroup.add_rebars)
             fiber_area: Aire cible des fibres (m²)
+            mesh_method: Méthode de maillage ("grid", "clipped" ou "triangle",
+                voir Section.create_fiber_mesh)
+            mesh_options: Options supplémentaires du maillage (ex. refine_direction
+                pour la méthode "triangle")
+            integration: Intégration du béton : "fiber" (somme sur les fibres) ou
+                "polygon" (intégration exacte sur les contours, sans maillage,
+                voir PolygonIntegrator)
+            cache: Cache des états préparés (maillage, armatures, matrices
+                centrées) ; None pour toujours préparer (voir SolverStateCache)
+            concrete_zones: Paires (contour, béton) : les fibres dont le centre est
+                dans le contour prennent ce béton (la dernière zone l'emporte). Le
+                contour peut être un des contours de la section (béton par contour,
+                ex. préfabriqué et coulé en place) ou une zone intérieure (noyau
+                confiné). Intégration par fibres uniquement.
         """
+        if integration not in ("fiber", "polygon"):
+            raise ValueError(f"Méthode d'intégration inconnue : {integration!r}")
+        if concrete_zones and integration == "polygon":
+            raise ValueError("concrete_zones requiert l'intégration par fibres")
+
         self.section = section
         self.concrete = concrete
         self.steel = steel
         self.rebars = rebars
+        self.concrete_zones = list(concrete_zones or [])
+
+        self.integration = integration
+
+        # Maillage, armatures et matrices centrées (éventuellement partagés)
+        if cache is not None:
+            prepared = cache.get_or_prepare(
+                section, rebars, fiber_area, mesh_method, mesh_options, integration
+            )
+        else:
+            prepared = prepare_section(
+                section, rebars, fiber_area, mesh_method, mesh_options, integration
+            )
+        self._attach(prepared)
 
-        # Créer le maillage de fibres
-        self.fibers = section.create_fiber_mesh(fiber_area)
-        self.rebar_array = rebars.to_array()
+    def _attach(self, prepared: PreparedSection) -> None:
+        """Installe l'état préparé et crée les tampons de travail propres au solveur"""
+        self.prepared = prepared
 
         # Centre de gravité de la section
-        props = section.properties
-        self.yc, self.zc = props.centroid
+        self.yc, self.zc = prepared.centroid
+
+        # Fibres béton (vide si le béton est intégré sur les contours)
+        self.polygon_integrator: Optional[PolygonIntegrator] = prepared.polygon_integrator
+        self.fibers = prepared.fibers
+        self.rebar_array = prepared.rebar_array
+
+        # Groupes de points d'intégration triés par matériau, avec leurs tampons de travail
+        self._groups: List[_FiberGroup] = []
+        if "concrete" in prepared.groups:
+            zone_materials, index = self._zone_index(self.fibers)
+            self._groups.append(
+                _FiberGroup.sorted_by_material(
+                    "concrete", prepared.groups["concrete"], self.concrete, zone_materials, index
+                )
+            )
+        if "steel" in prepared.groups:
+            prestrains = self.rebars.prestrain_array()
+            self._groups.append(
+                _FiberGroup.sorted_by_material(
+                    "steel",
+                    prepared.groups["steel"],
+                    self.steel,
+                    self.rebars.materials,
+                    np.asarray(self.rebars.material_index_array()),
+                    np.asarray(prestrains) if np.any(prestrains) else None,
+                )
+            )
+
+        # Dernier état évalué : d, efforts bruts et tangente polygonale
+        self._state_d: Optional[np.ndarray] = None
+        self._state_F = np.zeros(3)
+        self._state_K_polygon: Optional[np.ndarray] = None
+
+    def _zone_index(self, fibers: np.ndarray) -> Tuple[List[Any], Optional[np.ndarray]]:
+        """
+        Bétons distincts des zones et indice de béton de chaque fibre (-1 : béton
+        par défaut), ou None sans zones
+        """
+        if not self.concrete_zones:
+            return [], None
+        materials: List[Any] = []
+        keys: Dict[str, int] = {}
+        index = np.full(len(fibers), -1, dtype=int)
+        for contour, material in self.concrete_zones:
+            key = material.fingerprint()
+            if key not in keys:
+                keys[key] = len(materials)
+                materials.append(material)
+            index[contour.contains_points(fibers[:, 0], fibers[:, 1])] = keys[key]
+        return materials, index
+
+    def strain_limits(self) -> StrainLimits:
+        """
+        Déformations limites des matériaux en place (plans ultimes, moment-courbure)
+
+        Béton : sommets de la section, plus, avec des zones, leurs sommets situés
+        dans la section et les centres des fibres ; chaque point prend le plus
+        petit ε_cu2 des bétons qui l'atteignent (zones contenant le point ou
+        passant par lui, béton par défaut hors des zones). Armatures : ε_ud de
+        l'acier de chaque barre moins sa prédéformation.
+        """
+        contours = self.section.contours
+        blocks = [c.to_array() for c in contours if not c.is_hole]
+        tol = 1e-9 * max(1.0, float(np.ptp(np.vstack(blocks))))
+        if self.concrete_zones:
+            blocks += [c.to_array() for c in contours if c.is_hole]
+            for contour, _ in self.concrete_zones:
+                vertices = contour.to_array()
+                inside = np.zeros(len(vertices), dtype=bool)
+                for c in contours:
+                    strict = c.contains_points(vertices[:, 0], vertices[:, 1])
+                    if c.is_hole:
+                        inside &= ~strict
+                    else:
+                        inside |= strict | _points_on_edges(c.to_array(), vertices, tol)
+                blocks.append(vertices[inside])
+            blocks.append(self.fibers[:, :2])
+        points = np.vstack(blocks)
+
+        epsilon_cu2 = np.full(len(points), np.inf)
+        epsilon_c2 = np.full(len(points), np.inf)
+
+        def reach(mask: np.ndarray, material: Any) -> None:
+            mask = mask & (material.epsilon_cu2 < epsilon_cu2)
+            epsilon_cu2[mask] = material.epsilon_cu2
+            epsilon_c2[mask] = material.epsilon_c2
+
+        covered = np.zeros(len(points), dtype=bool)
+        for contour, material in self.concrete_zones:
+            inside = contour.contains_points(points[:, 0], points[:, 1])
+            covered |= inside
+            reach(inside | _points_on_edges(contour.to_array(), points, tol), material)
+        reach(~covered, self.concrete)
+
+        rebars = self.rebars
+        epsilon_ud = np.array([m.epsilon_ud for m in rebars.materials] + [self.steel.epsilon_ud])
+        elongation = epsilon_ud[np.asarray(rebars.material_index_array())] - np.asarray(
+            rebars.prestrain_array()
+        )
+        centroid = np.array([self.yc, self.zc])
+        return StrainLimits(
+            concrete_points=points - centroid,
+            epsilon_cu2=epsilon_cu2,
+            epsilon_c2=epsilon_c2,
+            rebar_points=np.asarray(self.rebar_array, dtype=float).reshape(-1, 3)[:, :2] - centroid,
+            elongation=elongation,
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        État sérialisable allégé (pickle, pools de processus)
+
+        Seuls les données de la section, le maillage et les armatures sont
+        transmis ; les matrices [1, y, z] et les tampons de travail sont
+        reconstruits à la désérialisation.
+        """
+        state = {
+            key: value for key, value in self.__dict__.items() if key not in _TRANSIENT_ATTRIBUTES
+        }
+        prepared = self.prepared
+        state["_prepared_light"] = (
+            prepared.properties,
+            prepared.fibers,
+            prepared.rebar_array,
+            prepared.polygon_integrator,
+        )
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        properties, fibers, rebar_array, polygon_integrator = state.pop("_prepared_light")
+        self.__dict__.update(state)
+        self._attach(
+            PreparedSection.from_arrays(properties, fibers, rebar_array, polygon_integrator)
+        )
+
+    def with_rebars(self, rebars: RebarGroup) -> "SectionSolver":
+        """
+        Solveur de la même section avec d'autres armatures
+
+        Le maillage béton et ses matrices [1, y, z] sont partagés ; seule la
+        géométrie des armatures est préparée. Utile pour comparer des
+        ferraillages sans remailler (voir RebarLayoutOptimizer).
+
+        Args:
+            rebars: Nouveau groupe d'armatures
+
+        Returns:
+            Nouveau SectionSolver (tampons de travail propres)
+        """
+        prepared = self.prepared.with_rebar_array(rebars.to_array())
+        solver = SectionSolver.__new__(SectionSolver)
+        solver.__dict__.update(
+            {key: value for key, value in self.__dict__.items() if key not in _TRANSIENT_ATTRIBUTES}
+        )
+        solver.rebars = rebars
+        solver._attach(prepared)
+        return solver
 
     def compute_strain(self, y: float, z: float, d: np.ndarray) -> float:
         """
@@ -93,98 +533,122 @@ class SectionSolver:
         epsilon_0, chi_y, chi_z = d
         return epsilon_0 + chi_y * (y - self.yc) + chi_z * (z - self.zc)
 
-    def compute_internal_forces(self, d: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def _evaluate(self, d: np.ndarray) -> np.ndarray:
+        """
+        Évalue les lois de comportement pour d, sauf si d est le dernier état évalué
+
+        Les contraintes et modules tangents restent dans les tampons des groupes,
+        ce qui permet d'assembler la tangente d'un point d'essai accepté par la
+        recherche linéaire sans réévaluer les matériaux.
+
+        Returns:
+            Efforts bruts [N, M_y, M_z] en MPa·m² (tableau interne, ne pas modifier)
+        """
+        if self._state_d is not None and np.array_equal(d, self._state_d):
+            return self._state_F
+
+        F = np.zeros(3)
+        self._state_K_polygon = None
+
+        # Contribution du béton intégré sur les contours
+        if self.polygon_integrator is not None:
+            F_c, self._state_K_polygon = self.polygon_integrator.integrate(self.concrete, d)
+            F += F_c
+
+        # Contribution des fibres béton et des aciers : F = Hᵀ·σ
+        for group in self._groups:
+            F += group.evaluate(d)
+
+        self._state_d = d.copy()
+        self._state_F = F
+        return F
+
+    def compute_internal_forces(
+        self, d: np.ndarray, with_tangent: bool = True
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         """
         Calcule les efforts internes F(d) et la matrice tangente K
 
+        Un appel répété au même point (ex. après un essai accepté par la recherche
+        linéaire) réutilise les contraintes et modules tangents déjà évalués.
+
         Args:
             d: Vecteur [e0, χ_y, χ_z]
+            with_tangent: Assembler aussi la matrice tangente (False pour une
+                évaluation du seul résidu)
 
         Returns:
             F: Vecteur [N, M_y, M_z]
-            K: Matrice tangente 3x3
+            K: Matrice tangente 3x3, ou None si with_tangent=False
         """
-        epsilon_0, chi_y, chi_z = d
-
-        # Initialiser
-        F = np.zeros(3)
-        K = np.zeros((3, 3))
-
-        # Contribution du béton (fibres)
-        if len(self.fibers) > 0:
-            y_fibers = self.fibers[:, 0] - self.yc
-            z_fibers = self.fibers[:, 1] - self.zc
-            A_fibers = self.fibers[:, 2]
-
-            # Déformations des fibres
-            eps_fibers = epsilon_0 + chi_y * y_fibers + chi_z * z_fibers
-
-            # Contraintes et modules tangents
-            sigma_c = self.concrete.stress_vectorized(eps_fibers)
-            Et_c = self.concrete.tangent_modulus_vectorized(eps_fibers)
-
-            # Efforts internes
-            F[0] += np.sum(sigma_c * A_fibers)
-            F[1] += np.sum(sigma_c * A_fibers * z_fibers)
-            F[2] += np.sum(sigma_c * A_fibers * y_fibers)
-
-            # Matrice tangente
-            K[0, 0] += np.sum(Et_c * A_fibers)
-            K[0, 1] += np.sum(Et_c * A_fibers * y_fibers)
-            K[0, 2] += np.sum(Et_c * A_fibers * z_fibers)
-            K[1, 0] += np.sum(Et_c * A_fibers * z_fibers)
-            K[1, 1] += np.sum(Et_c * A_fibers * z_fibers * y_fibers)
-            K[1, 2] += np.sum(Et_c * A_fibers * z_fibers**2)
-            K[2, 0] += np.sum(Et_c * A_fibers * y_fibers)
-            K[2, 1] += np.sum(Et_c * A_fibers * y_fibers**2)
-            K[2, 2] += np.sum(Et_c * A_fibers * y_fibers * z_fibers)
-
-        # Contribution des aciers
-        if len(self.rebar_array) > 0:
-            y_rebars = self.rebar_array[:, 0] - self.yc
-            z_rebars = self.rebar_array[:, 1] - self.zc
-            A_rebars = self.rebar_array[:, 2]
-
-            # Déformations des aciers
-            eps_rebars = epsilon_0 + chi_y * y_rebars + chi_z * z_rebars
-
-            # Contraintes et modules tangents
-            sigma_s = self.steel.stress_vectorized(eps_rebars)
-            Et_s = self.steel.tangent_modulus_vectorized(eps_rebars)
-
-            # Efforts internes
-            F[0] += np.sum(sigma_s * A_rebars)
-            F[1] += np.sum(sigma_s * A_rebars * z_rebars)
-            F[2] += np.sum(sigma_s * A_rebars * y_rebars)
-
-            # Matrice tangente
-            K[0, 0] += np.sum(Et_s * A_rebars)
-            K[0, 1] += np.sum(Et_s * A_rebars * y_rebars)
-            K[0, 2] += np.sum(Et_s * A_rebars * z_rebars)
-            K[1, 0] += np.sum(Et_s * A_rebars * z_rebars)
-            K[1, 1] += np.sum(Et_s * A_rebars * z_rebars * y_rebars)
-            K[1, 2] += np.sum(Et_s * A_rebars * z_rebars**2)
-            K[2, 0] += np.sum(Et_s * A_rebars * y_rebars)
-            K[2, 1] += np.sum(Et_s * A_rebars * y_rebars**2)
-            K[2, 2] += np.sum(Et_s * A_rebars * y_rebars * z_rebars)
+        d = np.asarray(d, dtype=float)
+        F_raw = self._evaluate(d)
 
         # Conversion: sigma (MPa) * A (m²) -> Force (kN)
-        # Utilisation de UnitConverter pour garantir la cohérence
-        # Note: Les efforts sont déjà calculés en "unités brutes" (MPa·m²)
+        # Note: Les efforts sont calculés en "unités brutes" (MPa·m²)
         # et doivent être convertis en kN et kN·m
-        F *= 1000.0  # MPa·m² = MN -> kN
+        F = F_raw * 1000.0  # MPa·m² = MN -> kN
+        if not with_tangent:
+            return F, None
+
+        # Matrice tangente K = Et·W à partir des modules mémorisés
+        K = np.zeros((3, 3))
+        if self._state_K_polygon is not None:
+            K += self._state_K_polygon
+        for group in self._groups:
+            K += group.tangent()
         K *= 1000.0  # Ajuster la matrice tangente
 
         return F, K
 
+    def _axial_stiffness(self) -> float:
+        """Rigidité axiale élastique totale EA (kN), pour l'estimation initiale"""
+        props = self.prepared.properties
+        EA_concrete = UnitConverter.modulus_area_to_stiffness(self.concrete.Ecm, props.area)
+        EA_steel = UnitConverter.modulus_area_to_stiffness(self.steel.Es, self.rebars.total_area)
+        return float(EA_concrete + EA_steel)
+
+    @staticmethod
+    def _default_settings(
+        tol: Optional[float], max_iter: Optional[int], use_relative_tol: bool
+    ) -> Tuple[float, int]:
+        """Tolérance et nombre d'itérations par défaut (NumericalConstants)"""
+        if tol is None:
+            tol = (
+                NumericalConstants.TOL_FORCE_DEFAULT
+                if not use_relative_tol
+                else NumericalConstants.TOL_RESIDUAL_REL_DEFAULT
+            )
+        if max_iter is None:
+            max_iter = NumericalConstants.MAX_ITER_DEFAULT
+        return tol, max_iter
+
+    def _initial_guess(self, N: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Estimation élastique [N/EA, 0, 0], e0 limité à ±2‰
+
+        Pour un tableau d'efforts normaux (solve_many), une estimation par cas (n, 3).
+        """
+        EA_total = self._axial_stiffness()
+        N = np.asarray(N, dtype=float)
+        d0 = np.zeros(N.shape + (3,))  # χ_y et χ_z initiaux nuls
+
+        # Estimation initiale de epsilon_0 basée sur effort axial
+        # epsilon_0 = N / EA (avec limitation à ±2‰)
+        if EA_total > NumericalConstants.EPSILON_ZERO:
+            d0[..., 0] = np.clip(N / EA_total, -0.002, 0.002)
+
+        return d0
+
     def solve(
         self,
         N: float,
         My: float = 0,
         Mz: float = 0,
-        tol: float = None,
-        max_iter: int = None,
+        tol: Optional[float] = None,
+        max_iter: Optional[int] = None,
         use_relative_tol: bool = False,
+        d0: Optional[np.ndarray] = None,
     ) -> SolverResult:
         """
         Résout F(d) = S par Newton-Raphson
@@ -195,55 +659,43 @@ class SectionSolver:
             Mz: Moment autour de z (kN·m)
             tol: Tolérance de convergence (défaut: NumericalConstants.TOL_FORCE_DEFAULT)
             max_iter: Nombre max d'itérations (défaut: NumericalConstants.MAX_ITER_DEFAULT)
+            d0: Déformation initiale [e0, χ_y, χ_z] (défaut : estimation élastique
+                [N/EA, 0, 0]), par exemple l'état convergé d'un cas voisin
 
         Returns:
             SolverResult avec les résultats
         """
-        # Utiliser les constantes par défaut si non spécifiées
-        if tol is None:
-            tol = (
-                NumericalConstants.TOL_FORCE_DEFAULT
-                if not use_relative_tol
-                else NumericalConstants.TOL_RESIDUAL_REL_DEFAULT
-            )
-        if max_iter is None:
-            max_iter = NumericalConstants.MAX_ITER_DEFAULT
+        tol, max_iter = self._default_settings(tol, max_iter, use_relative_tol)
+        S = np.array([N, My, Mz], dtype=float)
 
-        S = np.array([N, My, Mz])
-
-        # Initialisation basée sur estimation linéaire élastique
-        props = self.section.properties
+        if d0 is None:
+            d = self._initial_guess(N)
+        else:
+            d = np.array(d0, dtype=float)
+            if d.shape != (3,):
+                raise ValueError("d0 doit être un vecteur [e0, χ_y, χ_z]")
 
-        # Calculer la rigidité axiale totale (kN)
-        EA_concrete = UnitConverter.modulus_area_to_stiffness(self.concrete.Ecm, props.area)
-        EA_steel = UnitConverter.modulus_area_to_stiffness(self.steel.Es, self.rebars.total_area)
-        EA_total = EA_concrete + EA_steel
+        return self._newton(S, d, tol, max_iter, use_relative_tol)[0]
 
-        # Estimation initiale de epsilon_0 basée sur effort axial
-        # epsilon_0 = N / EA (avec limitation)
-        if EA_total > NumericalConstants.EPSILON_ZERO:
-            eps0_guess = safe_divide(N, EA_total, default=0.0)
-            eps0_guess = clamp(eps0_guess, -0.002, 0.002)  # Limiter à ±2‰
-        else:
-            eps0_guess = 0.0
-
-        d = np.array(
-            [
-                eps0_guess,  # e0 initial
-                0.0,  # χ_y initial
-                0.0,  # χ_z initial
-            ]
-        )
+    def _newton(
+        self, S: np.ndarray, d: np.ndarray, tol: float, max_iter: int, use_relative_tol: bool
+    ) -> Tuple[SolverResult, Optional[np.ndarray]]:
+        """
+        Itérations de Newton-Raphson avec recherche linéaire depuis d
 
+        Returns:
+            Résultat et matrice tangente K (kN) au dernier état d
+        """
         converged = False
         reason = "max_iter"
         residual_norm_history: List[float] = []
         step_norm_history: List[float] = []
 
-        for iter in range(max_iter):
-            # Calculer F(d) et K(d)
-            F, K = self.compute_internal_forces(d)
+        # Calculer F(d) et K(d) ; ensuite, l'état accepté par la recherche
+        # linéaire fournit F et K sans nouvelle évaluation des matériaux
+        F, K = self.compute_internal_forces(d)
 
+        for iter in range(max_iter):
             # Résidu
             R = F - S
             residual_norm = float(np.linalg.norm(R))
@@ -256,10 +708,13 @@ class SectionSolver:
                 break
 
             # Résoudre K·Δd = -R
+            if K is None or not self._is_regular(K):
+                # Matrice singulière (ou numériquement singulière)
+                reason = "singular"
+                break
             try:
                 delta_d = np.linalg.solve(K, -R)
             except np.linalg.LinAlgError:
-                # Matrice singulière
                 reason = "singular"
                 break
 
@@ -269,7 +724,7 @@ class SectionSolver:
 
             for _ in range(NumericalConstants.MAX_ITER_LINE_SEARCH):
                 d_trial = d + alpha * delta_d
-                F_trial, _ = self.compute_internal_forces(d_trial)
+                F_trial, _ = self.compute_internal_forces(d_trial, with_tangent=False)
                 R_trial = F_trial - S
                 norm_R_trial = np.linalg.norm(R_trial)
 
@@ -291,26 +746,22 @@ class SectionSolver:
             # Stocker la norme du pas
             step_norm_history.append(float(np.linalg.norm(delta_d)))
 
+            # Efforts et tangente au point accepté (dernier point d'essai évalué)
+            F, K = self.compute_internal_forces(d)
+
         # Calculer les contraintes max
         epsilon_0, chi_y, chi_z = d
 
-        sigma_c_max = 0.0
-        if len(self.fibers) > 0:
-            y_fibers = self.fibers[:, 0] - self.yc
-            z_fibers = self.fibers[:, 1] - self.zc
-            eps_fibers = epsilon_0 + chi_y * y_fibers + chi_z * z_fibers
-            sigma_c = self.concrete.stress_vectorized(eps_fibers)
-            sigma_c_max = np.max(np.abs(sigma_c))
-
-        sigma_s_max = 0.0
-        if len(self.rebar_array) > 0:
-            y_rebars = self.rebar_array[:, 0] - self.yc
-            z_rebars = self.rebar_array[:, 1] - self.zc
-            eps_rebars = epsilon_0 + chi_y * y_rebars + chi_z * z_rebars
-            sigma_s = self.steel.stress_vectorized(eps_rebars)
-            sigma_s_max = np.max(np.abs(sigma_s))
+        maxima = {"concrete": 0.0, "steel": 0.0}
+        if self.polygon_integrator is not None:
+            maxima["concrete"] = self.polygon_integrator.max_stress(self.concrete, d)
+        self._evaluate(d)
+        for group in self._groups:
+            maxima[group.kind] = group.max_stress()
+        sigma_c_max = maxima["concrete"]
+        sigma_s_max = maxima["steel"]
 
-        return SolverResult(
+        result = SolverResult(
             epsilon_0=epsilon_0,
             chi_y=chi_y,
             chi_z=chi_z,
@@ -325,3 +776,307 @@ class SectionSolver:
             step_norm_history=step_norm_history,
             reason=reason,
         )
+        return result, K
+
+    def solve_path(
+        self,
+        loads: np.ndarray,
+        tol: Optional[float] = None,
+        max_iter: Optional[int] = None,
+        use_relative_tol: bool = False,
+        predictor: Optional[str] = "tangent",
+    ) -> List[SolverResult]:
+        """
+        Résout une suite ordonnée de cas de charge (chemin de chargement)
+
+        Chaque pas part de l'état convergé du pas précédent, corrigé par un
+        prédicteur : "tangent" (d + K⁻¹·ΔS avec la tangente à l'état convergé),
+        "secant" (extrapolation linéaire des deux derniers états convergés) ou
+        None (état précédent tel quel). Si le départ à chaud ne converge pas, le
+        pas est repris depuis l'estimation élastique : le résultat est celui du
+        départ à froid s'il converge, sinon celui du départ à chaud, et n_iter
+        cumule dans les deux cas les itérations des deux tentatives.
+
+        Args:
+            loads: Cas de charge [N, M_y, M_z] (n_steps, 3) en kN et kN·m, dans
+                l'ordre du chemin
+            tol: Tolérance de convergence (défaut: NumericalConstants.TOL_FORCE_DEFAULT)
+            max_iter: Nombre max d'itérations par pas
+            use_relative_tol: Tolérance relative à la norme de chaque cas de charge
+            predictor: "tangent", "secant" ou None
+
+        Returns:
+            Liste de SolverResult, un par pas
+        """
+        if predictor not in ("tangent", "secant", None):
+            raise ValueError(f"Prédicteur inconnu : {predictor!r}")
+        tol, max_iter = self._default_settings(tol, max_iter, use_relative_tol)
+        loads = np.atleast_2d(np.asarray(loads, dtype=float))
+        if loads.ndim != 2 or loads.shape[1] != 3:
+            raise ValueError("loads doit être de forme (n_steps, 3) : [N, M_y, M_z]")
+
+        results: List[SolverResult] = []
+        history: List[Tuple[np.ndarray, np.ndarray]] = []  # (S, d) convergés
+        K_last: Optional[np.ndarray] = None
+
+        for S in loads:
+            d0 = self._predict(S, history, K_last, predictor)
+            result, K = self._newton(S, d0, tol, max_iter, use_relative_tol)
+
+            if not result.converged and history:
+                # Départ à froid si le départ à chaud échoue
+                cold, K_cold = self._newton(
+                    S, self._initial_guess(S[0]), tol, max_iter, use_relative_tol
+                )
+                n_iter = result.n_iter + cold.n_iter
+                if cold.converged:
+                    result, K = cold, K_cold
+                result.n_iter = n_iter
+
+            if result.converged:
+                d = np.array([result.epsilon_0, result.chi_y, result.chi_z])
+                history = (history + [(S, d)])[-2:]
+                K_last = K
+            results.append(result)
+
+        return results
+
+    def _predict(
+        self,
+        S: np.ndarray,
+        history: List[Tuple[np.ndarray, np.ndarray]],
+        K_last: Optional[np.ndarray],
+        predictor: Optional[str],
+    ) -> np.ndarray:
+        """Déformation initiale d'un pas de solve_path"""
+        if not history:
+            return self._initial_guess(S[0])
+
+        S_prev, d_prev = history[-1]
+        if predictor == "tangent" and K_last is not None and self._is_regular(K_last):
+            return d_prev + np.linalg.solve(K_last, S - S_prev)
+
+        if predictor in ("tangent", "secant") and len(history) == 2:
+            # Extrapolation sécante : projection de l'incrément de charge sur le
+            # pas précédent
+            S_old, d_old = history[0]
+            step_prev = S_prev - S_old
+            norm2 = float(step_prev @ step_prev)
+            if norm2 > NumericalConstants.EPSILON_ZERO:
+                ratio = float((S - S_prev) @ step_prev) / norm2
+                return d_prev + ratio * (d_prev - d_old)
+
+        return d_prev.copy()
+
+    def compute_internal_forces_batch(
+        self, D: np.ndarray, with_tangent: bool = True
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Calcule les efforts internes pour plusieurs états de déformation à la fois
+
+        Les déformations de tous les cas sont formées en une matrice
+        (n_cas, n_fibres), traitée par blocs pour borner la mémoire.
+
+        Args:
+            D: Vecteurs [e0, χ_y, χ_z] (n_cases, 3)
+            with_tangent: Calculer aussi les matrices tangentes
+
+        Returns:
+            F: Efforts [N, M_y, M_z] (n_cases, 3) en kN et kN·m
+            K: Matrices tangentes (n_cases, 3, 3), ou None si with_tangent=False
+        """
+        D = np.atleast_2d(np.asarray(D, dtype=float))
+        n_cases = len(D)
+        F = np.zeros((n_cases, 3))
+        K: Optional[np.ndarray] = np.zeros((n_cases, 3, 3)) if with_tangent else None
+
+        for group in self._groups:
+            rows = max(1, _BATCH_BLOCK // len(group))
+            for start in range(0, n_cases, rows):
+                block = slice(start, start + rows)
+                F_group, K_group = group.evaluate_batch(D[block], with_tangent)
+                F[block] += F_group
+                if K is not None and K_group is not None:
+                    K[block] += K_group.reshape(-1, 3, 3)
+
+        if self.polygon_integrator is not None:
+            for i, d in enumerate(D):
+                F_c, K_c = self.polygon_integrator.integrate(self.concrete, d)
+                F[i] += F_c
+                if K is not None:
+                    K[i] += K_c
+
+        # Conversion MPa·m² -> kN
+        F *= 1000.0
+        if K is not None:
+            K *= 1000.0
+        return F, K
+
+    def _batch_max_stresses(self, D: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Contraintes maximales béton et acier pour chaque cas (n_cases,)"""
+        n_cases = len(D)
+        maxima = {"concrete": np.zeros(n_cases), "steel": np.zeros(n_cases)}
+
+        for group in self._groups:
+            rows = max(1, _BATCH_BLOCK // len(group))
+            for start in range(0, n_cases, rows):
+                block = slice(start, start + rows)
+                sigma = group.stress_batch(group.material_strain(D[block] @ group.G.T))
+                maxima[group.kind][block] = np.max(np.abs(sigma), axis=1)
+
+        if self.polygon_integrator is not None:
+            for i, d in enumerate(D):
+                maxima["concrete"][i] = self.polygon_integrator.max_stress(self.concrete, d)
+
+        return maxima["concrete"], maxima["steel"]
+
+    def solve_many(
+        self,
+        loads: np.ndarray,
+        tol: Optional[float] = None,
+        max_iter: Optional[int] = None,
+        use_relative_tol: bool = False,
+    ) -> BatchSolverResult:
+        """
+        Résout F(d) = S pour plusieurs cas de charge simultanément
+
+        Newton-Raphson vectorisé sur les cas : les déformations forment une
+        matrice (n_cas, n_fibres), les systèmes tangents 3x3 empilés sont résolus
+        en une fois par np.linalg.solve, et chaque cas a son propre masque de
+        convergence et son propre pas de recherche linéaire. Les cas convergés
+        sont retirés du calcul.
+
+        Args:
+            loads: Cas de charge [N, M_y, M_z] (n_cases, 3) en kN et kN·m
+            tol: Tolérance de convergence (défaut: NumericalConstants.TOL_FORCE_DEFAULT)
+            max_iter: Nombre max d'itérations (défaut: NumericalConstants.MAX_ITER_DEFAULT)
+            use_relative_tol: Tolérance relative à la norme de chaque cas de charge
+
+        Returns:
+            BatchSolverResult (un tableau par grandeur)
+        """
+        tol, max_iter = self._default_settings(tol, max_iter, use_relative_tol)
+
+        S = np.atleast_2d(np.asarray(loads, dtype=float))
+        if S.shape[1] != 3:
+            raise ValueError("loads doit être de forme (n_cases, 3) : [N, M_y, M_z]")
+        n_cases = len(S)
+
+        # Tolérance absolue équivalente par cas
+        tol_case = np.full(n_cases, float(tol))
+        if use_relative_tol:
+            ref_norm = np.linalg.norm(S, axis=1)
+            tol_case = np.where(ref_norm > 1e-12, tol * ref_norm, tol)
+
+        # Initialisation élastique (comme solve)
+        D = self._initial_guess(S[:, 0])
+
+        converged = np.zeros(n_cases, dtype=bool)
+        singular = np.zeros(n_cases, dtype=bool)
+        n_iter = np.full(n_cases, max_iter, dtype=int)
+        active = np.arange(n_cases)
+
+        for iteration in range(max_iter):
+            if len(active) == 0:
+                break
+
+            F, K = self.compute_internal_forces_batch(D[active])
+            assert K is not None  # with_tangent=True
+            R = F - S[active]
+            norm_R = np.linalg.norm(R, axis=1)
+
+            done = norm_R < tol_case[active]
+            converged[active[done]] = True
+            n_iter[active[done]] = iteration + 1
+
+            # Résoudre K·Δd = -R pour les cas restants
+            keep = ~done
+            active, R, K, norm_R = active[keep], R[keep], K[keep], norm_R[keep]
+            if len(active) == 0:
+                break
+            delta, ok = self._batch_linear_solve(K, -R)
+            singular[active[~ok]] = True
+            n_iter[active[~ok]] = iteration + 1
+            active, delta, norm_R = active[ok], delta[ok], norm_R[ok]
+
+            # Recherche linéaire par cas
+            alpha = np.full(len(active), NumericalConstants.ALPHA_INITIAL)
+            pending = np.ones(len(active), dtype=bool)
+            d_start = D[active]
+            for _ in range(NumericalConstants.MAX_ITER_LINE_SEARCH):
+                idx = np.flatnonzero(pending)
+                if len(idx) == 0:
+                    break
+                d_trial = d_start[idx] + alpha[idx, None] * delta[idx]
+                D[active[idx]] = d_trial
+                F_trial, _ = self.compute_internal_forces_batch(d_trial, with_tangent=False)
+                improved = np.linalg.norm(F_trial - S[active[idx]], axis=1) < norm_R[idx]
+
+                alpha[idx[~improved]] *= NumericalConstants.ALPHA_REDUCTION
+                # Pas amélioré, ou pas trop petit : le dernier essai est retenu
+                pending[idx[improved | (alpha[idx] < NumericalConstants.ALPHA_MIN)]] = False
+
+        # Efforts et contraintes à l'état final
+        F, _ = self.compute_internal_forces_batch(D, with_tangent=False)
+        sigma_c_max, sigma_s_max = self._batch_max_stresses(D)
+
+        reason = np.full(n_cases, "max_iter", dtype=object)
+        reason[singular] = "singular"
+        reason[converged] = "converged"
+
+        return BatchSolverResult(
+            epsilon_0=D[:, 0].copy(),
+            chi_y=D[:, 1].copy(),
+            chi_z=D[:, 2].copy(),
+            N=F[:, 0],
+            My=F[:, 1],
+            Mz=F[:, 2],
+            sigma_c_max=sigma_c_max,
+            sigma_s_max=sigma_s_max,
+            converged=converged,
+            n_iter=n_iter,
+            reason=reason,
+        )
+
+    @staticmethod
+    def _is_regular(K: np.ndarray) -> np.ndarray:
+        """
+        Teste si les matrices tangentes sont inversibles numériquement
+
+        Le critère porte sur le conditionnement plutôt que sur l'échec de la
+        factorisation, qui dépend des arrondis pour une matrice de rang déficient
+        (ex. seules les armatures de deux lits travaillent).
+
+        Args:
+            K: Matrice (3, 3) ou matrices empilées (n, 3, 3)
+
+        Returns:
+            Booléen (ou tableau de booléens)
+        """
+        K = np.asarray(K)
+        finite = np.isfinite(K).all(axis=(-2, -1))
+        cond = np.full(finite.shape, np.inf)
+        with np.errstate(all="ignore"):
+            cond[finite] = np.linalg.cond(K[finite])
+        return cond <= NumericalConstants.MAX_CONDITION_NUMBER
+
+    @classmethod
+    def _batch_linear_solve(cls, K: np.ndarray, rhs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Résout les systèmes 3x3 empilés K·x = rhs
+
+        Returns:
+            x (n, 3) et masque des systèmes réguliers (n,) ; x = 0 pour les systèmes
+            singuliers
+        """
+        x = np.zeros_like(rhs)
+        ok = cls._is_regular(K)
+        try:
+            x[ok] = np.linalg.solve(K[ok], rhs[ok][:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            for i in np.flatnonzero(ok):
+                try:
+                    x[i] = np.linalg.solve(K[i], rhs[i])
+                except np.linalg.LinAlgError:
+                    ok[i] = False
+        return x, ok
@@ -14,10 +14,12 @@ from opensection.utils.constants import (
     MaterialConstants,
     NumericalConstants,
 )
+from opensection.utils.hashing import content_fingerprint
 from opensection.utils.math_helpers import (
     angle_between_vectors,
     check_positive_definite,
     clamp,
+    find_root_bracketed,
     interpolate_linear,
     is_converged,
     normalize_vector,
@@ -51,4 +53,6 @@ __all__ = [
     "smooth_max",
     "rotation_matrix_2d",
     "check_positive_definite",
+    "find_root_bracketed",
+    "content_fingerprint",
 ]
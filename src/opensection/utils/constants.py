@@ -54,6 +54,7 @@ class NumericalConstants:
     # Numerical stability
     EPSILON_ZERO = 1e-12  # Small number for zero checks
     LARGE_NUMBER = 1e10  # Large number for infinity
+    MAX_CONDITION_NUMBER = 1e12  # Tangent matrices above this are treated as singular
 
     # Mesh parameters
     DEFAULT_FIBER_AREA = 0.0001  # m² (1 cm²)
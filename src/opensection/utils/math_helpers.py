@@ -2,7 +2,7 @@
 Mathematical helper functions for opensection
 """
 
-from typing import Optional, Tuple, Union
+from typing import Callable, Optional, Tuple, Union
 
 import numpy as np
 
@@ -270,3 +270,100 @@ def check_positive_definite(matrix: np.ndarray, epsilon: float = 1e-12) -> bool:
         return np.all(eigenvalues > epsilon)
     except Exception:
         return False
+
+
+def find_root_bracketed(
+    func: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: Optional[float] = None,
+    fb: Optional[float] = None,
+    xtol: float = 1e-12,
+    ftol: float = 0.0,
+    max_iter: int = 100,
+) -> Tuple[float, float, int, bool]:
+    """
+    Find a root of func in [a, b] with Brent's method
+
+    Inverse quadratic interpolation and secant steps are used while they
+    shrink the bracket fast enough, with a bisection fallback otherwise, so
+    the bracket always contains a sign change and convergence is guaranteed.
+
+    Args:
+        func: Scalar function
+        a, b: Bracket ends (func(a) and func(b) of opposite signs)
+        fa, fb: Known values of func at a and b (evaluated if None)
+        xtol: Absolute tolerance on the root
+        ftol: Stop as soon as |func(x)| <= ftol
+        max_iter: Maximum number of iterations
+
+    Returns:
+        Tuple of (root, func(root), number of func evaluations, converged)
+
+    Raises:
+        ValueError: If func(a) and func(b) have the same sign
+
+    Examples:
+        >>> root, value, n_eval, converged = find_root_bracketed(lambda x: x**2 - 2, 0.0, 2.0)
+        >>> abs(root - np.sqrt(2)) < 1e-12
+        True
+    """
+    n_eval = 0
+    if fa is None:
+        fa = func(a)
+        n_eval += 1
+    if fb is None:
+        fb = func(b)
+        n_eval += 1
+    if fa == 0.0:
+        return a, fa, n_eval, True
+    if fb == 0.0:
+        return b, fb, n_eval, True
+    if (fa > 0.0) == (fb > 0.0):
+        raise ValueError(f"Root not bracketed: f({a}) = {fa}, f({b}) = {fb}")
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iter):
+        if (fb > 0.0) == (fc > 0.0):
+            # Keep the sign change between b and c
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2.0 * np.finfo(float).eps * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or abs(fb) <= ftol:
+            return b, fb, n_eval, True
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0.0:
+                q = -q
+            else:
+                p = -p
+            if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0.0 else -tol)
+        fb = func(b)
+        n_eval += 1
+
+    return b, fb, n_eval, False
@@ -0,0 +1,27 @@
+"""
+Configuration pytest commune
+
+Les tests marqués benchmark comparent des temps d'exécution : sensibles à la
+charge de la machine, ils sont ignorés par défaut et exécutés avec
+--run-benchmarks.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="exécuter les tests de temps d'exécution (marqueur benchmark)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark : exécuter avec --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -5,7 +5,8 @@ Tests unitaires pour le module géométrie
 import numpy as np
 import pytest
 
-from opensection.geometry import CircularSection, Contour, Point, RectangularSection
+from opensection.geometry import CircularSection, Contour, Point, RectangularSection, TSection
+from opensection.geometry.section import Section
 
 
 def test_point_creation():
@@ -50,5 +51,215 @@ def test_circular_section():
     assert abs(props.I_yy - I_expected) / I_expected < 0.02
 
 
+def test_contains_points_matches_scalar():
+    """La version vectorisée reproduit exactement contains_point"""
+    contour = Contour.polygon([(0, 0), (0.4, 0), (0.4, 0.2), (0.2, 0.2), (0.2, 0.3), (0, 0.3)])
+    y, z = np.meshgrid(np.linspace(-0.1, 0.5, 31), np.linspace(-0.1, 0.4, 26), indexing="ij")
+
+    inside = contour.contains_points(y, z)
+    expected = np.array([contour.contains_point(yi, zi) for yi, zi in zip(y.ravel(), z.ravel())])
+
+    assert inside.shape == y.shape
+    assert np.array_equal(inside.ravel(), expected)
+
+
+@pytest.mark.parametrize(
+    "section",
+    [
+        RectangularSection(width=0.3, height=0.5),
+        CircularSection(diameter=0.5),
+        TSection(flange_width=0.8, flange_thickness=0.15, web_width=0.3, web_height=0.5),
+        Section(
+            [
+                Contour.rectangle(0.6, 0.6),
+                Contour(Contour.rectangle(0.3, 0.3, center_y=0.05).points, is_hole=True),
+            ]
+        ),
+    ],
+    ids=["rectangle", "circle", "t_section", "hollow"],
+)
+def test_clipped_mesh_exact_area_and_first_moments(section):
+    """Le maillage découpé reproduit exactement l'aire et le centroïde"""
+    props = section.properties
+    fibers = section.create_fiber_mesh(0.005, method="clipped")
+
+    area = fibers[:, 2].sum()
+    y_c = np.sum(fibers[:, 0] * fibers[:, 2]) / area
+    z_c = np.sum(fibers[:, 1] * fibers[:, 2]) / area
+
+    assert len(fibers) < 100
+    assert np.isclose(area, props.area, rtol=1e-12)
+    assert np.isclose(y_c, props.centroid[0], atol=1e-12)
+    assert np.isclose(z_c, props.centroid[1], atol=1e-12)
+
+    # Seule l'inertie propre des cellules est négligée
+    I_yy = np.sum((fibers[:, 1] - z_c) ** 2 * fibers[:, 2])
+    assert abs(I_yy - props.I_yy) / props.I_yy < 0.1
+
+
+@pytest.mark.parametrize(
+    "section",
+    [
+        CircularSection(diameter=0.5),
+        TSection(flange_width=0.8, flange_thickness=0.15, web_width=0.3, web_height=0.5),
+        Section(
+            [
+                Contour.rectangle(1.0, 0.6),
+                Contour(Contour.rectangle(0.2, 0.2, center_y=-0.25).points, is_hole=True),
+                Contour(Contour.rectangle(0.2, 0.2, center_y=0.25).points, is_hole=True),
+            ]
+        ),
+        Section([Contour.circle(0.5, 48), Contour(Contour.circle(0.35).points, is_hole=True)]),
+    ],
+    ids=["circle", "t_section", "two_holes", "ring"],
+)
+def test_triangle_mesh_exact_moments(section):
+    """Le maillage triangulé reproduit exactement aire, centroïde et inerties"""
+    props = section.properties
+    fibers = section.create_fiber_mesh(0.002, method="triangle")
+
+    area = fibers[:, 2].sum()
+    y_c = np.sum(fibers[:, 0] * fibers[:, 2]) / area
+    z_c = np.sum(fibers[:, 1] * fibers[:, 2]) / area
+    I_yy = np.sum((fibers[:, 1] - z_c) ** 2 * fibers[:, 2])
+    I_zz = np.sum((fibers[:, 0] - y_c) ** 2 * fibers[:, 2])
+
+    assert np.all(fibers[:, 2] <= 0.002 * (1 + 1e-12))
+    assert np.isclose(area, props.area, rtol=1e-12)
+    assert np.isclose(y_c, props.centroid[0], atol=1e-12)
+    assert np.isclose(z_c, props.centroid[1], atol=1e-12)
+    assert np.isclose(I_yy, props.I_yy, rtol=1e-10)
+    assert np.isclose(I_zz, props.I_zz, rtol=1e-10)
+
+
+def test_triangle_mesh_refinement():
+    """Le raffinement densifie les fibres près de la fibre la plus comprimée"""
+    section = RectangularSection(width=0.3, height=0.5)
+    uniform = section.create_fiber_mesh(0.001, method="triangle")
+    refined = section.create_fiber_mesh(
+        0.001, method="triangle", refine_direction=(1.0, 0.0), refine_depth=0.2
+    )
+
+    top = refined[:, 0] > 0.09
+    assert np.count_nonzero(top) > 2 * np.count_nonzero(uniform[:, 0] > 0.09)
+    assert np.isclose(refined[:, 2].sum(), 0.15, rtol=1e-12)
+    assert refined[top, 2].max() <= 0.25 * 0.001 * (1 + 1e-12)
+
+
+def test_unknown_mesh_method():
+    with pytest.raises(ValueError):
+        RectangularSection(width=0.3, height=0.5).create_fiber_mesh(method="unknown")
+
+
+L_VERTICES = [(0, 0), (0.4, 0), (0.4, 0.1), (0.1, 0.1), (0.1, 0.6), (0, 0.6)]
+
+
+def test_geometric_moments_l_shape():
+    """Aire, centroïde et moments centrés d'une cornière (décomposition en rectangles)"""
+    m = Contour.polygon(L_VERTICES).geometric_moments()
+
+    # Rectangles 0.4 x 0.1 et 0.1 x 0.5
+    parts = [(0.04, 0.2, 0.05, 0.4, 0.1), (0.05, 0.05, 0.35, 0.1, 0.5)]
+    area = sum(a for a, *_ in parts)
+    cy = sum(a * y for a, y, *_ in parts) / area
+    cz = sum(a * z for a, _, z, *_ in parts) / area
+    I_yy = sum(a * h**2 / 12 + a * (z - cz) ** 2 for a, _, z, _, h in parts)
+    I_zz = sum(a * b**2 / 12 + a * (y - cy) ** 2 for a, y, _, b, _ in parts)
+    I_yz = sum(a * (y - cy) * (z - cz) for a, y, z, *_ in parts)
+
+    assert m.area == pytest.approx(area, rel=1e-12)
+    assert m.centroid == pytest.approx((cy, cz), rel=1e-12)
+    assert (m.I_yy, m.I_zz) == pytest.approx((I_yy, I_zz), rel=1e-12)
+    # Produit d'inertie signé (négatif pour cette cornière)
+    assert m.I_yz == pytest.approx(I_yz, rel=1e-12)
+    assert m.I_yz < 0
+
+
+def test_geometric_moments_orientation_independent():
+    """Un contour parcouru dans le sens horaire a le même centroïde et les mêmes moments"""
+    direct = Contour.polygon(L_VERTICES).geometric_moments()
+    reverse = Contour.polygon(L_VERTICES[::-1]).geometric_moments()
+
+    assert reverse.area == pytest.approx(direct.area, rel=1e-12)
+    assert reverse.centroid == pytest.approx(direct.centroid, rel=1e-12)
+    assert (reverse.I_yy, reverse.I_zz, reverse.I_yz) == pytest.approx(
+        (direct.I_yy, direct.I_zz, direct.I_yz), rel=1e-12
+    )
+
+
+def test_contour_coords_cached_and_read_only():
+    """Les sommets sont un tableau en lecture seule ; remplacer points invalide le cache"""
+    contour = Contour.rectangle(0.3, 0.5)
+    coords = contour.to_array()
+    assert contour.to_array() is coords
+    with pytest.raises(ValueError):
+        coords[0, 0] = 1.0
+
+    assert contour.geometric_moments() is contour.geometric_moments()
+    contour.points = Contour.rectangle(0.6, 0.5).points
+    assert contour.area() == pytest.approx(0.30)
+
+
+def test_contour_points_are_read_only():
+    """Modifier contour.points sur place lève une erreur au lieu d'être ignoré"""
+    contour = Contour.rectangle(0.3, 0.5)
+    points = contour.points
+
+    assert isinstance(points, tuple)
+    assert points[0] == Point(-0.15, -0.25)
+    with pytest.raises(AttributeError):
+        points.append(Point(0.0, 0.0))
+    with pytest.raises(TypeError):
+        points[0] = Point(0.0, 0.0)
+    with pytest.raises(AttributeError):
+        points[0].y = 1.0
+    assert contour.area() == pytest.approx(0.15)
+
+    # Chemin de modification : affecter une nouvelle liste (cache invalidé)
+    contour.points = [*points[:2], Point(0.15, 0.75), Point(-0.15, 0.75)]
+    assert contour.area() == pytest.approx(0.30)
+    np.testing.assert_allclose(contour.to_array()[2], [0.15, 0.75])
+
+
+def test_frozen_section_hash_and_equality():
+    """Deux sections figées de même contenu sont égales et de même hash"""
+    section = RectangularSection(width=0.3, height=0.5)
+    frozen = section.freeze()
+
+    assert frozen == Section([Contour.rectangle(0.3, 0.5)]).freeze()
+    assert hash(frozen) == hash(Section([Contour.rectangle(0.3, 0.5)]).freeze())
+    assert frozen != RectangularSection(width=0.3, height=0.6).freeze()
+    assert frozen.fingerprint() == section.fingerprint()
+    assert frozen.freeze() is frozen
+    assert frozen.properties.I_yy == pytest.approx(section.properties.I_yy)
+
+
+def test_frozen_section_is_immutable():
+    """Les attributs et contours d'une section figée ne sont pas modifiables"""
+    frozen = Section([Contour.rectangle(0.3, 0.5)]).freeze()
+
+    with pytest.raises(AttributeError):
+        frozen.contours = []
+    with pytest.raises(AttributeError):
+        frozen.contours[0].points = Contour.rectangle(0.6, 0.5).points
+    with pytest.raises(AttributeError):
+        frozen.contours[0].is_hole = True
+    with pytest.raises(ValueError):
+        frozen.contours[0].to_array()[0, 0] = 1.0
+    assert isinstance(frozen.contours, tuple)
+
+
+def test_frozen_section_mesh_memoized():
+    """Le maillage est calculé une fois par jeu de paramètres, en lecture seule"""
+    section = RectangularSection(width=0.3, height=0.5)
+    frozen = section.freeze()
+
+    fibers = frozen.create_fiber_mesh(0.0004)
+    assert frozen.create_fiber_mesh(0.0004) is fibers
+    assert not fibers.flags.writeable
+    np.testing.assert_array_equal(fibers, section.create_fiber_mesh(0.0004))
+    assert frozen.create_fiber_mesh(0.0004, method="clipped") is not fibers
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -10,10 +10,19 @@ from opensection import (
     CircularSection,
     ConcreteEC2,
     SteelEC2,
+    PrestressingSteelEC2,
     RebarGroup,
     SectionSolver,
 )
-from opensection.interaction import InteractionDiagram
+from opensection.interaction import (
+    CapacityIndex,
+    CapacityResult,
+    InteractionCurve,
+    InteractionDiagram,
+    InteractionSurface,
+    StrainDomainGenerator,
+    compute_NM_curves,
+)
 
 
 class TestInteractionDiagram:
@@ -273,6 +282,414 @@ class TestInteractionDiagramValidation:
         assert len(moments) > 0
 
 
+class TestStrainDomains:
+    """Tests du générateur par domaines de déformation (pivots A, B, C)"""
+
+    @staticmethod
+    def _solver(**kwargs):
+        section = RectangularSection(width=0.3, height=0.5)
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.10, z=0.0, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.10, z=0.0, diameter=0.020, n=3)
+        return SectionSolver(
+            section, ConcreteEC2(fck=30), SteelEC2(fyk=500), rebars, mesh_method="clipped", **kwargs
+        )
+
+    def test_pure_compression_and_tension(self):
+        """Extrémités de la courbe : ε_c2 uniforme et -ε_ud uniforme"""
+        solver = self._solver()
+        M_vals, N_vals = InteractionDiagram(solver).compute_NM_curve(n_points=50)
+
+        As = solver.rebars.total_area
+        N_compression = (solver.concrete.fcd * 0.15 + As * solver.steel.Es * 0.002) * 1000
+        N_tension = -As * solver.steel.fyd * 1000
+
+        assert N_vals[0] == pytest.approx(N_compression, rel=1e-9)
+        assert N_vals[-1] == pytest.approx(N_tension, rel=1e-9)
+        assert abs(M_vals[0]) < 1e-6
+        assert abs(M_vals[-1]) < 1e-6
+
+    def test_planes_reach_ultimate_strains(self):
+        """Chaque plan atteint ε_cu2, ε_ud ou le pivot C, sans les dépasser"""
+        solver = self._solver()
+        generator = StrainDomainGenerator(solver)
+        t = np.linspace(0.0, 3.0, 61)
+        D = generator.deformations(t)
+
+        eps_top = D[:, 0] + D[:, 1] * 0.15
+        eps_steel = D[:, 0] + D[:, 1] * (-0.10)
+        eps_cu2 = solver.concrete.epsilon_cu2
+        eps_ud = solver.steel.epsilon_ud
+
+        assert np.all(eps_top <= eps_cu2)
+        assert np.all(eps_steel >= -eps_ud)
+        # Pivot A : acier à -ε_ud ; pivot B : béton à ε_cu2
+        assert np.allclose(eps_steel[t <= 1.0], -eps_ud, rtol=1e-8)
+        assert np.allclose(eps_top[(t >= 1.0) & (t <= 2.0)], eps_cu2, rtol=1e-8)
+        # Pivot C : ε_c2 à la profondeur (1 - ε_c2/ε_cu2)·h
+        s_c = (1 - solver.concrete.epsilon_c2 / eps_cu2) * 0.3
+        eps_c = D[:, 0] + D[:, 1] * (0.15 - s_c)
+        assert np.allclose(eps_c[t >= 2.0], solver.concrete.epsilon_c2, rtol=1e-6)
+
+    def test_domains_are_continuous(self):
+        """Pas de saut entre les pivots A/B et B/C"""
+        generator = StrainDomainGenerator(self._solver())
+        for t in (1.0, 2.0):
+            D = generator.deformations([t - 1e-9, t + 1e-9])
+            assert np.allclose(D[0], D[1], rtol=1e-6, atol=1e-12)
+
+    def test_points_on_failure_envelope(self):
+        """Un point réduit de 10 % en moment est résistant (le solveur converge)"""
+        solver = self._solver()
+        generator = StrainDomainGenerator(solver)
+        t = np.linspace(0.6, 2.8, 8)
+        F = generator.evaluate(t)
+
+        # Départ depuis le plan ultime (l'estimation élastique fissure toute la
+        # section en traction)
+        for (N, _, M), d0 in zip(F, generator.deformations(t)):
+            result = solver.solve(N=N, My=0, Mz=0.9 * M, d0=d0)
+            assert result.converged
+            assert result.sigma_c_max <= solver.concrete.fcd + 1e-9
+
+    def test_bending_direction(self):
+        """Angle π/2 : côté +z comprimé, moment M_y positif"""
+        generator = StrainDomainGenerator(self._solver())
+        F = generator.evaluate(np.array([1.5]), angle=np.pi / 2)
+        assert F[0, 1] > 0
+        assert abs(F[0, 2]) < 1e-6 * abs(F[0, 1])
+
+    def test_prestrained_bars_reach_their_own_limit(self):
+        """Pivot A : la barre la plus proche de ε_pu (prédéformation comprise) la porte"""
+        section = RectangularSection(width=0.3, height=0.5)
+        tendon = PrestressingSteelEC2(fp01k=1500)
+        rebars = RebarGroup()
+        rebars.add_rebar(y=-0.10, z=0.0, diameter=0.015, n=2)
+        rebars.add_rebar(y=0.10, z=0.0, diameter=0.015, n=2, prestrain=0.012)
+        solver = SectionSolver(section, ConcreteEC2(fck=30), tendon, rebars, mesh_method="clipped")
+
+        t = np.linspace(0.0, 3.0, 121)
+        D = StrainDomainGenerator(solver).deformations(t)
+        y = np.array([-0.10, 0.10])
+        eps_material = -(D[:, [0]] + D[:, [1]] * y) + np.array([0.0, 0.012])
+
+        assert np.all(eps_material <= tendon.epsilon_pu)
+        # La barre déterminante change avec la courbure (barre supérieure en traction pure)
+        assert np.allclose(eps_material[t <= 1.0].max(axis=1), tendon.epsilon_pu, rtol=1e-8)
+        assert np.argmax(eps_material[0]) == 1
+        assert np.argmax(eps_material[np.flatnonzero(t <= 1.0)[-1]]) == 0
+
+    def test_curve_is_one_batch_call(self, monkeypatch):
+        """200 points en un seul appel vectorisé, sans résolution de Newton"""
+        solver = self._solver()
+        batch = solver.compute_internal_forces_batch
+        calls = []
+
+        def counted(D, *args, **kwargs):
+            calls.append(len(D))
+            return batch(D, *args, **kwargs)
+
+        def no_solve(*args, **kwargs):
+            raise AssertionError("solve ne doit pas être appelé")
+
+        monkeypatch.setattr(solver, "compute_internal_forces_batch", counted)
+        monkeypatch.setattr(solver, "solve", no_solve)
+        M_vals, N_vals = InteractionDiagram(solver).compute_NM_curve(n_points=200)
+
+        assert len(M_vals) == 200
+        assert calls == [200]
+
+
+class TestInteractionSurface:
+    """Tests de la surface de rupture N-M_y-M_z"""
+
+    @staticmethod
+    def _surface(n_angles=24, n_depths=31):
+        return InteractionSurface(TestStrainDomains._solver(), n_angles, n_depths)
+
+    def test_mesh_is_closed(self):
+        """Chaque arête est partagée par exactement deux triangles"""
+        surface = self._surface()
+        edges = np.sort(surface.triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        _, counts = np.unique(edges, axis=0, return_counts=True)
+        assert np.all(counts == 2)
+        assert len(surface.vertices) == 2 + 24 * 29
+
+    def test_poles_and_meridian_match_curve(self):
+        """Les pôles et le méridien angle = 0 coïncident avec la courbe N-M"""
+        surface = self._surface()
+        M_vals, N_vals = InteractionDiagram(surface.solver).compute_NM_curve(n_points=31)
+
+        assert surface.vertices[1, 0] == pytest.approx(N_vals[0], rel=1e-12)
+        assert surface.vertices[0, 0] == pytest.approx(N_vals[-1], rel=1e-12)
+        meridian = surface.vertices[2 : 2 + 29]
+        assert np.allclose(meridian[:, 0], N_vals[-2:0:-1])
+        assert np.allclose(meridian[:, 2], M_vals[-2:0:-1])
+
+    def test_load_factor_on_curve(self):
+        """Un point de la courbe uniaxiale a un facteur de charge ≈ 1"""
+        surface = self._surface()
+        F = surface.generator.evaluate(np.array([0.55, 1.3, 2.2]))
+
+        factors = surface.load_factor(F)
+        assert np.allclose(factors, 1.0, rtol=0.02)
+        assert surface.load_factor(0.5 * F[1]) == pytest.approx(2 * factors[1])
+        assert np.all(surface.is_safe(0.9 * F))
+        assert not np.any(surface.is_safe(1.1 * F))
+
+    def test_biaxial_symmetry(self):
+        """Section doublement symétrique : λ invariant par changement de signe des moments"""
+        surface = self._surface(n_angles=36)
+        load = np.array([800.0, 60.0, 90.0])
+        signs = np.array([[1, 1, 1], [1, -1, 1], [1, 1, -1], [1, -1, -1]])
+
+        # Aux diagonales des quadrangles près, qui ne sont pas symétriques
+        factors = surface.load_factor(load * signs)
+        assert np.allclose(factors, factors[0], rtol=1e-4)
+        assert surface.utilization(load) == pytest.approx(1 / factors[0])
+
+    def test_batch_query_matches_single(self):
+        """Requête vectorisée identique aux requêtes unitaires"""
+        surface = self._surface()
+        rng = np.random.default_rng(0)
+        loads = rng.normal(size=(50, 3)) * [1000.0, 100.0, 100.0]
+
+        factors = surface.load_factor(loads)
+        assert factors.shape == (50,)
+        assert np.all(np.isfinite(factors) & (factors > 0))
+        for load, factor in zip(loads[:5], factors[:5]):
+            assert surface.load_factor(load) == pytest.approx(factor)
+
+
+class TestCapacityIndex:
+    """Tests de l'index de la surface (requêtes en grand nombre)"""
+
+    @staticmethod
+    def _surface():
+        return InteractionSurface(TestStrainDomains._solver(), n_angles=24, n_depths=31)
+
+    def test_table_matches_ray_casting(self):
+        """Les rayons tabulés (bandes d'élévation) égalent le lancer sur tous les triangles"""
+        surface = self._surface()
+        index = surface.capacity_index(n_azimuth=36, n_elevation=19)
+        assert isinstance(index, CapacityIndex)
+
+        azimuths = np.arange(36) * 2 * np.pi / 36
+        beta, psi = np.meshgrid(index.elevations, azimuths, indexing="ij")
+        unit = np.stack([np.sin(beta), np.cos(beta) * np.cos(psi), np.cos(beta) * np.sin(psi)])
+        expected = surface.load_factor(unit.reshape(3, -1).T * index.scale)
+        assert np.allclose(index.radii[:, :-1].ravel(), expected)
+
+    def test_interpolated_utilization(self):
+        """Taux d'utilisation interpolé proche du lancer de rayons exact"""
+        surface = self._surface()
+        index = surface.capacity_index()
+        rng = np.random.default_rng(1)
+        loads = rng.normal(size=(500, 3)) * [1000.0, 100.0, 100.0]
+
+        exact = surface.utilization(loads)
+        approx = index.utilization(loads)
+        assert np.median(np.abs(approx / exact - 1)) < 2e-3
+        assert np.max(np.abs(approx / exact - 1)) < 0.03
+        assert index.utilization(np.zeros(3)) == 0.0
+
+    def test_never_accepts_unsafe_loads(self):
+        """Aucun cas rejeté par la surface exacte n'est accepté par l'index"""
+        surface = self._surface()
+        rng = np.random.default_rng(3)
+        loads = rng.uniform(-0.6, 0.6, size=(20_000, 3)) * np.abs(surface.vertices).max(axis=0)
+        expected = surface.is_safe(loads)
+
+        for n_azimuth, n_elevation in [(72, 37), (12, 7)]:
+            index = surface.capacity_index(n_azimuth=n_azimuth, n_elevation=n_elevation)
+            assert index.band >= 2 * index.tolerance
+            np.testing.assert_array_equal(index.is_safe(loads), expected)
+
+    def test_many_loads(self):
+        """Requête vectorisée sur un grand nombre de combinaisons"""
+        index = self._surface().capacity_index()
+        loads = np.random.default_rng(2).normal(size=(100_000, 3)) * [1000.0, 100.0, 100.0]
+
+        ratios = index.utilization(loads)
+        assert ratios.shape == (100_000,)
+        assert np.all(np.isfinite(ratios))
+        np.testing.assert_array_equal(ratios[:100], [index.utilization(F) for F in loads[:100]])
+
+    @pytest.mark.benchmark
+    def test_million_loads(self):
+        """Un million de combinaisons en une fraction de seconde"""
+        import time
+
+        index = self._surface().capacity_index()
+        loads = np.random.default_rng(2).normal(size=(1_000_000, 3)) * [1000.0, 100.0, 100.0]
+
+        start = time.perf_counter()
+        index.utilization(loads)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2.0
+
+
+class TestParallelGeneration:
+    """Tests de la génération sur pool de processus"""
+
+    @staticmethod
+    def _solvers():
+        solvers = []
+        for height, diameter in [(0.4, 0.016), (0.5, 0.020), (0.6, 0.025), (0.45, 0.012)]:
+            section = RectangularSection(width=0.3, height=height)
+            rebars = RebarGroup()
+            rebars.add_rebar(y=0.10, z=0.0, diameter=diameter, n=3)
+            rebars.add_rebar(y=-0.10, z=0.0, diameter=diameter, n=3)
+            solvers.append(SectionSolver(section, ConcreteEC2(fck=30), SteelEC2(fyk=500), rebars))
+        return solvers
+
+    def test_curves_match_serial_in_order(self):
+        """Résultats identiques à la boucle série, dans l'ordre des sections"""
+        from concurrent.futures import ProcessPoolExecutor
+
+        solvers = self._solvers()
+        expected = [InteractionDiagram(s).compute_NM_curve(n_points=40) for s in solvers]
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            curves = compute_NM_curves(
+                solvers, n_points=40, executor=executor, max_workers=2, chunksize=1
+            )
+
+        assert len(curves) == len(solvers)
+        for (M, N), (M_ref, N_ref) in zip(curves, expected):
+            assert np.array_equal(M, M_ref)
+            assert np.array_equal(N, N_ref)
+
+    def test_serial_mode(self):
+        """max_workers=1 : exécution dans le processus courant"""
+        solvers = self._solvers()[:2]
+        curves = compute_NM_curves(solvers, n_points=20, max_workers=1)
+        M_ref, N_ref = InteractionDiagram(solvers[1]).compute_NM_curve(n_points=20)
+        assert np.array_equal(curves[1][0], M_ref)
+        assert np.array_equal(curves[1][1], N_ref)
+
+    def test_surface_with_executor(self):
+        """Directions réparties par lots : même surface qu'en un seul appel"""
+        from concurrent.futures import ProcessPoolExecutor
+
+        solver = self._solvers()[0]
+        expected = InteractionSurface(solver, n_angles=12, n_depths=21)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            surface = InteractionSurface(
+                solver, n_angles=12, n_depths=21, executor=executor, max_workers=2
+            )
+
+        assert np.allclose(surface.vertices, expected.vertices, rtol=1e-12, atol=1e-9)
+        assert np.array_equal(surface.triangles, expected.triangles)
+
+
+class TestAdaptiveCurve:
+    """Tests de l'échantillonnage adaptatif de la courbe N-M"""
+
+    @staticmethod
+    def _chord_error(diagram, curve):
+        """Écart maximal (plan normé) d'une courbe dense au polygone échantillonné"""
+        from opensection.interaction.diagram import _chord_deviation
+
+        t_dense = np.linspace(0.0, 3.0, 3001)
+        dense = diagram.domains.evaluate(t_dense)[:, [2, 0]]
+        scale = np.ptp(diagram.domains.evaluate(np.linspace(0.0, 3.0, 13))[:, [2, 0]], axis=0)
+
+        t = curve.t[::-1]
+        points = np.column_stack([curve.M, curve.N])[::-1] / scale
+        k = np.clip(np.searchsorted(t, t_dense) - 1, 0, len(t) - 2)
+        return _chord_deviation(dense / scale, points[k], points[k + 1]).max()
+
+    def test_tolerance_is_met(self):
+        """L'écart à la courbe exacte reste de l'ordre de la tolérance"""
+        diagram = InteractionDiagram(TestStrainDomains._solver())
+        for tolerance in (1e-2, 1e-3):
+            curve = diagram.compute_NM_curve_adaptive(tolerance)
+            assert curve.n_evaluations == len(curve)
+            assert self._chord_error(diagram, curve) <= tolerance
+
+    def test_fewer_points_than_uniform(self):
+        """À nombre de points égal, l'échantillonnage uniforme est moins précis"""
+        diagram = InteractionDiagram(TestStrainDomains._solver())
+        curve = diagram.compute_NM_curve_adaptive(1e-3)
+
+        n = curve.n_evaluations
+        M, N = diagram.compute_NM_curve(n_points=n)
+        uniform = InteractionCurve(M=M, N=N, t=np.linspace(3.0, 0.0, n), n_evaluations=n)
+        assert self._chord_error(diagram, uniform) > 3 * self._chord_error(diagram, curve)
+
+    def test_same_orientation_as_uniform_curve(self):
+        """Compression pure en premier, points sur la courbe uniforme"""
+        diagram = InteractionDiagram(TestStrainDomains._solver())
+        curve = diagram.compute_NM_curve_adaptive(1e-2)
+        M, N = diagram.compute_NM_curve(n_points=13)
+
+        assert np.all(np.diff(curve.t) < 0)
+        assert curve.N[0] == pytest.approx(N[0])
+        assert curve.N[-1] == pytest.approx(N[-1])
+        F = diagram.domains.evaluate(curve.t)
+        assert np.allclose(F[:, 2], curve.M)
+
+    def test_evaluation_budget(self):
+        """max_evaluations borne le nombre d'évaluations"""
+        diagram = InteractionDiagram(TestStrainDomains._solver())
+        curve = diagram.compute_NM_curve_adaptive(1e-6, max_evaluations=40)
+        assert curve.n_evaluations == 40
+        assert len(curve) == 40
+
+
+class TestCapacity:
+    """Tests du moment résistant M_Rd(N, direction) par recherche de racine"""
+
+    _solver = staticmethod(TestStrainDomains._solver)
+
+    def test_matches_dense_curve(self):
+        """M_Rd coïncide avec la courbe N-M finement échantillonnée"""
+        diagram = InteractionDiagram(self._solver())
+        M_curve, N_curve = diagram.compute_NM_curve(n_points=4001)
+
+        for N in (-400.0, 0.0, 800.0, 2000.0, 3000.0):
+            result = diagram.capacity(N)
+            assert isinstance(result, CapacityResult)
+            assert result.converged
+            assert abs(result.N - N) < 1e-5 * np.ptp(N_curve)
+            expected = np.interp(N, N_curve[::-1], M_curve[::-1])
+            assert result.Mz == pytest.approx(expected, rel=2e-3)
+
+    def test_few_evaluations(self):
+        """Chaque évaluation est une intégration ; quelques-unes suffisent"""
+        diagram = InteractionDiagram(self._solver())
+        for N in (-400.0, 800.0, 3000.0):
+            assert diagram.capacity(N).n_evaluations <= 20
+
+    def test_pivots(self):
+        """Traction : pivot A ; compression modérée : pivot B ; forte compression : pivot C"""
+        diagram = InteractionDiagram(self._solver())
+        assert diagram.capacity(-800.0).pivot == "A"
+        assert diagram.capacity(1000.0).pivot == "B"
+        assert diagram.capacity(3000.0).pivot == "C"
+
+    def test_direction(self):
+        """angle = π/2 : flexion autour de y"""
+        diagram = InteractionDiagram(self._solver())
+        result = diagram.capacity(500.0, angle=np.pi / 2)
+        assert result.My > 0
+        assert abs(result.Mz) < 1e-3 * result.My
+
+        # Le plan trouvé est en équilibre avec les efforts rendus
+        F, _ = diagram.solver.compute_internal_forces(result.deformation, with_tangent=False)
+        np.testing.assert_allclose(F, [result.N, result.My, result.Mz], atol=1e-9)
+
+    def test_out_of_range(self):
+        """N au-delà des résistances axiales"""
+        diagram = InteractionDiagram(self._solver())
+        with pytest.raises(ValueError):
+            diagram.capacity(1e5)
+        with pytest.raises(ValueError):
+            diagram.capacity(-1e5)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -320,6 +320,48 @@ class TestSteelEC2Advanced:
         assert Et[2] == steel.Es
 
 
+class TestStressAndTangent:
+    """Tests de l'évaluation fusionnée contrainte / module tangent"""
+
+    @pytest.mark.parametrize("fck", [30, 50, 70, 90])
+    def test_concrete_matches_separate_laws(self, fck):
+        """Identique à stress_vectorized et tangent_modulus_vectorized"""
+        concrete = ConcreteEC2(fck=fck)
+        epsilons = np.linspace(-0.002, 0.005, 1001)
+
+        sigma, Et = concrete.stress_and_tangent(epsilons)
+
+        np.testing.assert_allclose(sigma, concrete.stress_vectorized(epsilons), atol=1e-12)
+        np.testing.assert_allclose(Et, concrete.tangent_modulus_vectorized(epsilons), rtol=1e-12)
+
+    @pytest.mark.parametrize("hardening", [False, True])
+    def test_steel_matches_separate_laws(self, hardening):
+        """Branches élastique, plastique et rupture identiques"""
+        steel = SteelEC2(fyk=500, include_hardening=hardening)
+        epsilons = np.linspace(-0.06, 0.06, 1201)
+
+        sigma, Et = steel.stress_and_tangent(epsilons)
+
+        np.testing.assert_allclose(sigma, steel.stress_vectorized(epsilons), atol=1e-9)
+        np.testing.assert_array_equal(Et, steel.tangent_modulus_vectorized(epsilons))
+
+    def test_nd_arrays_and_output_buffers(self):
+        """Tableaux 2D et écriture dans des tampons fournis"""
+        concrete = ConcreteEC2(fck=30)
+        epsilons = np.linspace(-0.001, 0.004, 12).reshape(3, 4)
+        out_sigma = np.empty_like(epsilons)
+        out_Et = np.empty_like(epsilons)
+
+        sigma, Et = concrete.stress_and_tangent(epsilons, out_sigma=out_sigma, out_Et=out_Et)
+
+        assert sigma is out_sigma
+        assert Et is out_Et
+        assert sigma.shape == (3, 4)
+        np.testing.assert_allclose(
+            sigma.ravel(), concrete.stress_vectorized(epsilons.ravel()), atol=1e-12
+        )
+
+
 class TestPrestressingSteelEC2:
     """Tests pour l'acier de précontrainte"""
 
@@ -344,5 +386,52 @@ class TestPrestressingSteelEC2:
         assert sigma == 0.0
 
 
+class TestVectorizedSteelLaws:
+    """Lois vectorisées et fusionnées des aciers de précontrainte et de charpente"""
+
+    @pytest.mark.parametrize(
+        "steel",
+        [ops.PrestressingSteelEC2(fp01k=1500), StructuralSteelEC3(fy=355)],
+        ids=["prestressing", "structural"],
+    )
+    def test_matches_scalar_laws(self, steel):
+        epsilons = np.linspace(-0.03, 0.03, 603)
+        sigma_ref = np.array([steel.stress(e) for e in epsilons])
+        Et_ref = np.array([steel.tangent_modulus(e) for e in epsilons])
+
+        np.testing.assert_allclose(steel.stress_vectorized(epsilons), sigma_ref, atol=1e-9)
+        np.testing.assert_allclose(steel.tangent_modulus_vectorized(epsilons), Et_ref, atol=1e-6)
+
+        out_sigma = np.empty((3, 201))
+        out_Et = np.empty((3, 201))
+        sigma, Et = steel.stress_and_tangent(epsilons.reshape(3, 201), out_sigma, out_Et)
+        assert sigma is out_sigma and Et is out_Et
+        np.testing.assert_allclose(sigma.ravel(), sigma_ref, atol=1e-9)
+        np.testing.assert_allclose(Et.ravel(), Et_ref, atol=1e-6)
+
+    def test_prestressing_tangent_is_derivative(self):
+        steel = ops.PrestressingSteelEC2(fp01k=1500)
+        epsilons = np.linspace(0.001, 0.019, 19)
+        h = 1e-7
+        upper = steel.stress_vectorized(epsilons + h)
+        lower = steel.stress_vectorized(epsilons - h)
+        numerical = (upper - lower) / (2 * h)
+        np.testing.assert_allclose(steel.tangent_modulus_vectorized(epsilons), numerical, rtol=1e-5)
+
+    def test_prestressing_tension_only_and_rupture(self):
+        steel = ops.PrestressingSteelEC2(fp01k=1500)
+        sigma, Et = steel.stress_and_tangent(np.array([-0.002, 0.0, 0.021]))
+        np.testing.assert_array_equal(sigma, 0.0)
+        np.testing.assert_array_equal(Et, [0.0, steel.Ep, 0.0])
+        assert steel.Es == steel.Ep
+
+    def test_fingerprints(self):
+        assert (
+            ops.PrestressingSteelEC2(fp01k=1500).fingerprint()
+            == ops.PrestressingSteelEC2(fp01k=1500).fingerprint()
+        )
+        assert StructuralSteelEC3(fy=355).fingerprint() != StructuralSteelEC3(fy=275).fingerprint()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,96 @@
+"""
+Tests unitaires pour l'optimisation du ferraillage
+"""
+
+import numpy as np
+import pytest
+
+from opensection import ConcreteEC2, SteelEC2
+from opensection.eurocodes import EC2Verification
+from opensection.reinforcement.optimizer import RebarLayout, RebarLayoutOptimizer
+
+
+def _optimizer(**kwargs):
+    options = dict(diameters=(0.012, 0.016, 0.020), n_bars=(2, 5))
+    options.update(kwargs)
+    return RebarLayoutOptimizer(0.3, 0.5, ConcreteEC2(fck=30), SteelEC2(fyk=500), **options)
+
+
+def _brute_force(optimizer, loads):
+    """Premier candidat vérifié par aire croissante, en calculant tout"""
+    for layout in optimizer.candidates():
+        ratios = EC2Verification.check_rebar_ratios(layout.area, optimizer.section.properties.area)
+        if not (ratios["min_ok"] and ratios["max_ok"]):
+            continue
+        ok, _ = optimizer.evaluate(layout, loads)
+        if ok:
+            return layout
+    return None
+
+
+class TestRebarLayout:
+    """Tests des ferraillages candidats"""
+
+    def test_area_and_positions(self):
+        """Aire totale et nappes placées avec l'enrobage"""
+        layout = RebarLayout(diameter=0.016, n_top=2, n_bottom=3)
+        assert layout.area == pytest.approx(5 * np.pi * 0.008**2)
+
+        rebars = layout.to_rebar_group(width=0.3, height=0.5, cover=0.03)
+        assert rebars.n_rebars == 5
+        y = sorted({round(rebar.y, 9) for rebar in rebars.rebars})
+        assert y == pytest.approx([-(0.25 - 0.038), 0.25 - 0.038])
+
+    def test_spacing_limits_bars_per_layer(self):
+        """Espacement libre minimal : moins de barres pour les gros diamètres"""
+        optimizer = _optimizer(diameters=(0.012, 0.032), n_bars=(2, 12))
+        assert optimizer.max_bars_per_layer(0.012) > optimizer.max_bars_per_layer(0.032)
+        for layout in optimizer.candidates():
+            assert layout.n_top <= optimizer.max_bars_per_layer(layout.diameter)
+
+
+class TestRebarLayoutOptimizer:
+    """Tests de la recherche du ferraillage minimal"""
+
+    @pytest.mark.parametrize(
+        "loads",
+        [
+            [[500.0, 0.0, 120.0], [1500.0, 0.0, 60.0], [200.0, 0.0, -50.0]],
+            [[0.0, 0.0, 150.0], [800.0, 0.0, -100.0]],
+            [[2500.0, 0.0, 200.0]],
+        ],
+    )
+    def test_matches_brute_force(self, loads):
+        """Même ferraillage qu'un calcul exhaustif, avec moins de calculs"""
+        optimizer = _optimizer()
+        design = optimizer.optimize(loads)
+        expected = _brute_force(optimizer, np.array(loads))
+
+        assert design.found
+        assert design.layout == expected
+        assert np.all(design.results.converged)
+        assert design.n_solved < len(optimizer.candidates()) / 2
+        assert design.n_candidates == design.n_screened + design.n_solved + design.n_pruned
+
+    def test_design_satisfies_checks(self):
+        """Le ferraillage retenu vérifie l'ELU et les taux d'armature"""
+        optimizer = _optimizer()
+        design = optimizer.optimize([[600.0, 0.0, 140.0]])
+
+        assert design.rebars.total_area == pytest.approx(design.layout.area)
+        ratios = EC2Verification.check_rebar_ratios(design.layout.area, 0.15)
+        assert ratios["min_ok"] and ratios["max_ok"]
+        checks = EC2Verification.check_ULS(
+            design.results.to_result(0), optimizer.concrete.fcd, optimizer.steel.fyd
+        )
+        assert all(check["ok"] for check in checks.values())
+
+    def test_no_feasible_layout(self):
+        """Charge hors d'atteinte : aucun ferraillage"""
+        design = _optimizer().optimize([[0.0, 0.0, 1000.0]])
+        assert not design.found
+        assert design.layout is None and design.results is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -395,5 +395,123 @@ class TestRebarGroupAdvanced:
             assert abs(spacing - expected_spacing) < 0.01
 
 
+class TestRebarGroupArrays:
+    """Tests du stockage en colonnes de RebarGroup"""
+
+    def test_add_rebars_broadcast(self):
+        """add_rebars diffuse scalaires et tableaux"""
+        group = RebarGroup()
+        group.add_rebars(y=0.25, z=np.arange(4) * 0.15, diameter=0.020, n=[1, 2, 1, 1])
+
+        assert len(group) == 4
+        assert group.n_rebars == 5
+        np.testing.assert_allclose(group.y, 0.25)
+        np.testing.assert_allclose(group.z, [0.0, 0.15, 0.30, 0.45])
+        np.testing.assert_array_equal(group.counts, [1, 2, 1, 1])
+        assert group.to_array().shape == (5, 3)
+
+    def test_add_rebars_invalid_count(self):
+        """Un nombre de barres non entier ou nul est refusé"""
+        group = RebarGroup()
+        with pytest.raises(ValueError):
+            group.add_rebars(0.0, 0.0, 0.016, n=0)
+        with pytest.raises(ValueError):
+            group.add_rebars(0.0, 0.0, 0.016, n=1.5)
+        assert len(group) == 0
+
+    def test_bulk_equals_individual(self):
+        """Ajout en bloc et ajouts unitaires donnent le même groupe"""
+        y = np.linspace(-0.2, 0.2, 7)
+        bulk = RebarGroup()
+        bulk.add_rebars(y, 0.1, 0.016, 2)
+        single = RebarGroup()
+        for y_i in y:
+            single.add_rebar(y_i, 0.1, 0.016, 2)
+
+        np.testing.assert_array_equal(bulk.to_array(), single.to_array())
+        assert bulk.fingerprint() == single.fingerprint()
+        assert bulk.total_area == pytest.approx(single.total_area, rel=1e-14)
+
+    def test_to_array_is_read_only_view(self):
+        """to_array ne copie pas et n'est pas modifiable"""
+        group = RebarGroup()
+        group.add_linear_array(-0.2, 0.0, 0.2, 0.0, 5, 0.020)
+
+        first, second = group.to_array(), group.to_array()
+        assert np.shares_memory(first, second)
+        with pytest.raises(ValueError):
+            first[0, 0] = 1.0
+
+    def test_rebars_compatibility_tuple(self):
+        """rebars est un tuple de Rebar en lecture seule, recalculé après un ajout"""
+        group = RebarGroup()
+        group.add_rebar(0.1, -0.2, 0.020, 3)
+        rebars = group.rebars
+        assert rebars == (Rebar(0.1, -0.2, 0.020, 3),)
+        assert repr(rebars[0]).startswith("Rebar(")
+
+        # Modifier la copie lèverait une erreur au lieu d'être sans effet
+        with pytest.raises(AttributeError):
+            rebars.append(Rebar(0.0, 0.0, 0.012))
+        with pytest.raises(AttributeError, match="add_rebar"):
+            rebars[0].n = 4
+        assert group.rebars[0].n == 3
+
+        area = group.total_area
+        group.add_rebar(0.0, 0.0, 0.012)
+        assert len(group.rebars) == 2
+        assert group.total_area == pytest.approx(area + Rebar(0.0, 0.0, 0.012).area)
+
+    def test_diaphragm_wall(self):
+        """Paroi moulée : milliers de barres, deux nappes"""
+        group = RebarGroup()
+        z = np.arange(2000) * 0.15
+        group.add_rebars(0.35, z, 0.025)
+        group.add_rebars(-0.35, z, 0.025)
+
+        assert group.n_rebars == 4000
+        assert group.total_area == pytest.approx(4000 * np.pi * 0.0125**2)
+        np.testing.assert_allclose(group.to_array()[2000:, 1], z)
+
+    def test_prestrains(self):
+        """Prédéformations par armature, développées par barre"""
+        group = RebarGroup()
+        group.add_rebar(0.0, 0.1, 0.020, 2)
+        group.add_rebar(0.0, -0.15, 0.015, 3, prestrain=0.005)
+
+        np.testing.assert_array_equal(group.prestrains, [0.0, 0.005])
+        np.testing.assert_array_equal(group.prestrain_array(), [0.0, 0.0, 0.005, 0.005, 0.005])
+        assert not group.prestrain_array().flags.writeable
+        assert group.rebars[1] == Rebar(0.0, -0.15, 0.015, 3, prestrain=0.005)
+
+        other = RebarGroup()
+        other.add_rebar(0.0, 0.1, 0.020, 2)
+        other.add_rebar(0.0, -0.15, 0.015, 3)
+        assert other.fingerprint() != group.fingerprint()
+
+    def test_materials(self):
+        """Matériau par armature, mémorisé une fois par contenu"""
+        from opensection.materials import PrestressingSteelEC2, SteelEC2
+
+        group = RebarGroup()
+        group.add_rebar(0.0, 0.2, 0.016, 2)
+        group.add_rebar(0.0, -0.2, 0.015, 3, prestrain=0.005, material=PrestressingSteelEC2(1500))
+        group.add_rebars([-0.1, 0.1], -0.22, 0.020, material=SteelEC2(fyk=400))
+        group.add_rebar(0.0, -0.18, 0.015, 1, material=PrestressingSteelEC2(1500))
+
+        assert len(group.materials) == 2
+        np.testing.assert_array_equal(
+            group.material_index_array(), [-1, -1, 0, 0, 0, 1, 1, 0]
+        )
+        assert group.rebars[0].material is None
+        assert group.rebars[1].material is group.materials[0]
+
+        plain = RebarGroup()
+        plain.add_rebar(0.0, 0.2, 0.016, 2, material=SteelEC2(fyk=400))
+        other = RebarGroup()
+        other.add_rebar(0.0, 0.2, 0.016, 2, material=SteelEC2(fyk=500))
+        assert plain.fingerprint() != other.fingerprint()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,11 +5,16 @@ Tests for the section solver
 import numpy as np
 import pytest
 
-from opensection.geometry.section import CircularSection, RectangularSection
+from opensection.geometry.contour import Contour
+from opensection.geometry.section import CircularSection, RectangularSection, Section, TSection
 from opensection.materials.concrete import ConcreteEC2
-from opensection.materials.steel import SteelEC2
+from opensection.materials.steel import PrestressingSteelEC2, SteelEC2, StructuralSteelEC3
 from opensection.reinforcement.rebar import RebarGroup
-from opensection.solver.section_solver import SectionSolver, SolverResult
+from opensection.solver.api import validate_and_solve
+from opensection.solver.cache import SolverStateCache, default_solver_cache
+from opensection.solver.member import MemberAnalysis, MemberResult, MomentCurvatureTable
+from opensection.solver.moment_curvature import MomentCurvatureAnalysis, MomentCurvatureResult
+from opensection.solver.section_solver import BatchSolverResult, SectionSolver, SolverResult
 
 
 class TestSectionSolver:
@@ -309,6 +314,284 @@ class TestSolverComparison:
             assert np.isclose(result.epsilon_0, epsilon_elastic, rtol=1.0) or result.epsilon_0 > 0
 
 
+class TestMeshMethods:
+    """Compare fiber mesh methods in the solver"""
+
+    def test_clipped_mesh_accuracy(self):
+        """A coarse clipped mesh matches a fine mesh with 10x fewer fibers"""
+        section = RectangularSection(width=0.3, height=0.5)
+        concrete = ConcreteEC2(fck=30)
+        steel = SteelEC2(fyk=500)
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.20, z=0.0, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.20, z=0.0, diameter=0.020, n=3)
+
+        reference = SectionSolver(
+            section, concrete, steel, rebars, fiber_area=1e-5, mesh_method="clipped"
+        ).solve(N=500, My=0, Mz=150)
+        fine_grid = SectionSolver(section, concrete, steel, rebars, fiber_area=1e-4)
+        coarse = SectionSolver(
+            section, concrete, steel, rebars, fiber_area=1e-3, mesh_method="clipped"
+        )
+        result_grid = fine_grid.solve(N=500, My=0, Mz=150)
+        result = coarse.solve(N=500, My=0, Mz=150)
+
+        assert reference.converged and result.converged and result_grid.converged
+        assert len(coarse.fibers) * 5 < len(fine_grid.fibers)
+        error = abs(result.chi_y / reference.chi_y - 1)
+        error_grid = abs(result_grid.chi_y / reference.chi_y - 1)
+        assert error < error_grid
+
+    def test_triangle_mesh_accuracy(self):
+        """A triangulated T-section matches a fine grid with far fewer fibers"""
+        section = TSection(flange_width=0.8, flange_thickness=0.15, web_width=0.3, web_height=0.5)
+        concrete = ConcreteEC2(fck=30)
+        steel = SteelEC2(fyk=500)
+        rebars = RebarGroup()
+        rebars.add_rebar(y=-0.45, z=0.0, diameter=0.020, n=4)
+        rebars.add_rebar(y=0.10, z=0.0, diameter=0.012, n=4)
+
+        reference = SectionSolver(
+            section, concrete, steel, rebars, fiber_area=5e-6, mesh_method="triangle"
+        ).solve(N=200, My=0, Mz=250)
+        grid = SectionSolver(section, concrete, steel, rebars, fiber_area=1e-4)
+        triangles = SectionSolver(
+            section, concrete, steel, rebars, fiber_area=2e-3, mesh_method="triangle"
+        )
+        result_grid = grid.solve(N=200, My=0, Mz=250)
+        result = triangles.solve(N=200, My=0, Mz=250)
+
+        assert reference.converged and result.converged and result_grid.converged
+        assert len(triangles.fibers) * 10 < len(grid.fibers)
+        assert abs(result.chi_y / reference.chi_y - 1) < abs(
+            result_grid.chi_y / reference.chi_y - 1
+        )
+        assert abs(result.epsilon_0 / reference.epsilon_0 - 1) < 0.01
+
+
+class TestPolygonIntegration:
+    """Mesh-free concrete integration on the contours"""
+
+    def test_rectangle_closed_form(self):
+        """Exact resultants of the parabola-rectangle block on a rectangle"""
+        b, h = 0.3, 0.5
+        concrete = ConcreteEC2(fck=30)
+        solver = SectionSolver(
+            RectangularSection(width=b, height=h),
+            concrete,
+            SteelEC2(fyk=500),
+            RebarGroup(),
+            integration="polygon",
+        )
+
+        # e = 0.0035 at z = h/2, neutral axis at z = 0.075 (x = 0.175)
+        chi = 0.0035 / 0.175
+        d = np.array([-0.075 * chi, 0.0, chi])
+        F, K = solver.compute_internal_forces(d)
+
+        # Rectangular block: N = 17/21 fcd b x, lever arm 99/238 x from the top
+        x = 0.175
+        N_expected = 17 / 21 * concrete.fcd * b * x * 1000
+        M_expected = N_expected * (h / 2 - 99 / 238 * x)
+        assert np.isclose(F[0], N_expected, rtol=1e-12)
+        assert np.isclose(F[1], M_expected, rtol=1e-12)
+        assert np.isclose(F[2], 0.0, atol=1e-9)
+
+    def test_matches_fine_mesh(self):
+        """Biaxial solve matches a very fine triangle mesh"""
+        section = CircularSection(diameter=1.0, n_points=48)
+        concrete = ConcreteEC2(fck=30)
+        steel = SteelEC2(fyk=500)
+        rebars = RebarGroup()
+        rebars.add_circular_array(0.0, 0.0, 0.42, 12, 0.025)
+
+        reference = SectionSolver(
+            section, concrete, steel, rebars, fiber_area=2e-5, mesh_method="triangle"
+        ).solve(N=1500, My=300, Mz=400)
+        solver = SectionSolver(section, concrete, steel, rebars, integration="polygon")
+        result = solver.solve(N=1500, My=300, Mz=400)
+
+        assert len(solver.fibers) == 0
+        assert result.converged
+        assert np.isclose(result.epsilon_0, reference.epsilon_0, rtol=1e-3, atol=1e-7)
+        assert np.isclose(result.chi_y, reference.chi_y, rtol=1e-3)
+        assert np.isclose(result.chi_z, reference.chi_z, rtol=1e-3)
+        assert np.isclose(result.sigma_c_max, reference.sigma_c_max, rtol=0.01)
+
+    def test_unknown_integration(self):
+        with pytest.raises(ValueError):
+            SectionSolver(
+                RectangularSection(width=0.3, height=0.5),
+                ConcreteEC2(fck=30),
+                SteelEC2(fyk=500),
+                RebarGroup(),
+                integration="unknown",
+            )
+
+
+class TestPreparedGeometry:
+    """Precomputed fiber geometry and reusable work buffers"""
+
+    @pytest.fixture
+    def solver(self):
+        section = RectangularSection(width=0.3, height=0.5)
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.12, z=0.20, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.12, z=-0.20, diameter=0.020, n=3)
+        return SectionSolver(section, ConcreteEC2(fck=30), SteelEC2(fyk=500), rebars)
+
+    @staticmethod
+    def _reference_forces(solver, d):
+        """Explicit fiber sums, as in the original implementation"""
+        F = np.zeros(3)
+        K = np.zeros((3, 3))
+        for points, material in (
+            (solver.fibers, solver.concrete),
+            (solver.rebar_array, solver.steel),
+        ):
+            y = points[:, 0] - solver.yc
+            z = points[:, 1] - solver.zc
+            A = points[:, 2]
+            eps = d[0] + d[1] * y + d[2] * z
+            sigma = material.stress_vectorized(eps)
+            Et = material.tangent_modulus_vectorized(eps)
+            F += [np.sum(sigma * A), np.sum(sigma * A * z), np.sum(sigma * A * y)]
+            K += [
+                [np.sum(Et * A), np.sum(Et * A * y), np.sum(Et * A * z)],
+                [np.sum(Et * A * z), np.sum(Et * A * z * y), np.sum(Et * A * z**2)],
+                [np.sum(Et * A * y), np.sum(Et * A * y**2), np.sum(Et * A * y * z)],
+            ]
+        return 1000.0 * F, 1000.0 * K
+
+    @pytest.mark.parametrize(
+        "d", [[0.001, 0.0, 0.0], [0.0005, -0.004, 0.003], [-0.001, 0.01, 0.002], [0.0, 0.0, 0.0]]
+    )
+    def test_matches_explicit_sums(self, solver, d):
+        d = np.array(d)
+        F, K = solver.compute_internal_forces(d)
+        F_ref, K_ref = self._reference_forces(solver, d)
+        assert np.allclose(F, F_ref, rtol=1e-10, atol=1e-8)
+        assert np.allclose(K, K_ref, rtol=1e-10, atol=1e-6)
+
+    def test_results_are_not_work_buffers(self, solver):
+        """Successive calls do not overwrite previously returned forces"""
+        F1, K1 = solver.compute_internal_forces(np.array([0.001, 0.002, 0.0]))
+        F1_copy, K1_copy = F1.copy(), K1.copy()
+        solver.compute_internal_forces(np.array([-0.002, 0.0, 0.01]))
+        assert np.array_equal(F1, F1_copy)
+        assert np.array_equal(K1, K1_copy)
+
+    def test_residual_only_evaluation(self, solver):
+        d = np.array([0.001, 0.002, -0.001])
+        F_only, K_none = solver.compute_internal_forces(d, with_tangent=False)
+        F, K = solver.compute_internal_forces(d)
+        assert K_none is None
+        assert np.array_equal(F_only, F)
+        assert np.allclose(K, self._reference_forces(solver, d)[1], rtol=1e-10, atol=1e-6)
+
+    def test_accepted_trial_is_not_reevaluated(self, solver):
+        """One material evaluation per Newton iteration when full steps are accepted"""
+        calls = []
+        stress_and_tangent = solver.concrete.stress_and_tangent
+
+        def counting(*args, **kwargs):
+            calls.append(1)
+            return stress_and_tangent(*args, **kwargs)
+
+        solver.concrete.stress_and_tangent = counting
+        result = solver.solve(N=500.0, My=20.0, Mz=10.0)
+
+        assert result.converged
+        assert len(calls) == result.n_iter
+
+    def test_rank_deficient_tangent_is_singular(self, solver):
+        """Pure tension on two bar layers: singular in serial and batched solves"""
+        result = solver.solve(N=-130.0, My=11.0, Mz=2.0)
+        batch = solver.solve_many([[-130.0, 11.0, 2.0]])
+        assert result.reason == "singular"
+        assert batch.reason[0] == "singular"
+
+
+class TestSolveMany:
+    """Batched multi-load-case Newton-Raphson"""
+
+    @pytest.fixture
+    def solver(self):
+        section = RectangularSection(width=0.3, height=0.5)
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.12, z=0.20, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.12, z=-0.20, diameter=0.020, n=3)
+        return SectionSolver(section, ConcreteEC2(fck=30), SteelEC2(fyk=500), rebars)
+
+    @pytest.fixture
+    def loads(self):
+        rng = np.random.default_rng(0)
+        return np.column_stack(
+            [rng.uniform(-200, 1500, 40), rng.uniform(-60, 60, 40), rng.uniform(-40, 40, 40)]
+        )
+
+    def test_matches_serial_solve(self, solver, loads):
+        """Each case converges to the same state as an individual solve"""
+        batch = solver.solve_many(loads)
+
+        assert isinstance(batch, BatchSolverResult)
+        assert len(batch) == len(loads)
+        assert batch.converged.sum() > 30
+        for i, (N, My, Mz) in enumerate(loads):
+            result = solver.solve(N=N, My=My, Mz=Mz)
+            assert batch.converged[i] == result.converged
+            assert batch.reason[i] == result.reason
+            if result.converged:
+                assert batch.n_iter[i] == result.n_iter
+                assert np.allclose(
+                    batch.deformations[i],
+                    [result.epsilon_0, result.chi_y, result.chi_z],
+                    rtol=1e-9,
+                    atol=1e-15,
+                )
+                assert np.isclose(batch.sigma_c_max[i], result.sigma_c_max)
+                assert np.isclose(batch.sigma_s_max[i], result.sigma_s_max)
+
+    def test_shares_defaults_with_solve(self, solver, loads, monkeypatch):
+        """solve and solve_many read the same default settings and initial guess"""
+        from opensection.utils import NumericalConstants
+
+        guesses = solver._initial_guess(loads[:, 0])
+        assert guesses.shape == (len(loads), 3)
+        for N, guess in zip(loads[:, 0], guesses):
+            np.testing.assert_array_equal(guess, solver._initial_guess(N))
+
+        monkeypatch.setattr(NumericalConstants, "MAX_ITER_DEFAULT", 2)
+        batch = solver.solve_many(loads[:5])
+        for i, (N, My, Mz) in enumerate(loads[:5]):
+            result = solver.solve(N=N, My=My, Mz=Mz)
+            assert batch.n_iter[i] == result.n_iter <= 2
+            assert batch.reason[i] == result.reason
+
+    def test_columnar_result(self, solver, loads):
+        batch = solver.solve_many(loads, use_relative_tol=True)
+
+        converged = batch.converged
+        assert np.allclose(batch.N[converged], loads[converged, 0], rtol=1e-5, atol=1e-3)
+        assert np.allclose(batch.Mz[converged], loads[converged, 2], rtol=1e-5, atol=1e-3)
+
+        single = batch.to_result(int(np.flatnonzero(converged)[0]))
+        assert isinstance(single, SolverResult)
+        assert single.converged
+
+    def test_batch_forces_match_single(self, solver):
+        D = np.array([[0.001, 0.002, 0.001], [0.0005, -0.004, 0.003], [0.0, 0.0, 0.0]])
+        F, K = solver.compute_internal_forces_batch(D)
+        for i, d in enumerate(D):
+            F_i, K_i = solver.compute_internal_forces(d)
+            assert np.allclose(F[i], F_i, rtol=1e-12, atol=1e-9)
+            assert np.allclose(K[i], K_i, rtol=1e-12, atol=1e-6)
+
+    def test_invalid_shape(self, solver):
+        with pytest.raises(ValueError):
+            solver.solve_many(np.zeros((4, 2)))
+
+
 def test_solver_basic_functionality():
     """Basic smoke test for solver"""
     section = RectangularSection(width=0.3, height=0.5)
@@ -331,5 +614,623 @@ def test_solver_basic_functionality():
     assert K.shape == (3, 3)
 
 
+class TestSolvePath:
+    """Warm-started solves along load paths"""
+
+    @pytest.fixture
+    def solver(self):
+        section = RectangularSection(width=0.3, height=0.6)
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.0, z=0.25, diameter=0.020, n=4)
+        rebars.add_rebar(y=0.0, z=-0.25, diameter=0.016, n=2)
+        return SectionSolver(section, ConcreteEC2(fck=30), SteelEC2(fyk=500), rebars)
+
+    @pytest.fixture
+    def loads(self):
+        return np.column_stack([np.full(25, 300.0), np.linspace(5.0, 155.0, 25), np.zeros(25)])
+
+    def test_solve_from_converged_state(self, solver):
+        reference = solver.solve(N=300.0, My=80.0)
+        d0 = [reference.epsilon_0, reference.chi_y, reference.chi_z]
+        warm = solver.solve(N=300.0, My=80.0, d0=d0)
+        assert warm.converged
+        assert warm.n_iter == 1
+
+        with pytest.raises(ValueError):
+            solver.solve(N=300.0, My=80.0, d0=[0.0, 0.0])
+
+    def test_path_matches_independent_solves(self, solver, loads):
+        path = solver.solve_path(loads)
+        cold = [solver.solve(N=N, My=My, Mz=Mz) for N, My, Mz in loads]
+
+        assert len(path) == len(loads)
+        for warm, reference in zip(path, cold):
+            assert warm.converged and reference.converged
+            assert np.isclose(warm.epsilon_0, reference.epsilon_0, rtol=1e-6, atol=1e-12)
+            assert np.isclose(warm.chi_y, reference.chi_y, rtol=1e-6, atol=1e-12)
+
+        # Warm starts with a tangent predictor need far fewer iterations
+        assert np.mean([r.n_iter for r in path]) <= 3.5
+        assert sum(r.n_iter for r in path) < 0.7 * sum(r.n_iter for r in cold)
+
+    @pytest.mark.parametrize("predictor", ["secant", None])
+    def test_other_predictors(self, solver, loads, predictor):
+        path = solver.solve_path(loads, predictor=predictor)
+        assert all(result.converged for result in path)
+
+    def test_failed_step_counts_both_attempts(self, solver):
+        """A step failing warm and cold reports the iterations of both attempts"""
+        first = solver.solve(N=500.0, My=0.0, Mz=20.0)
+        d_prev = np.array([first.epsilon_0, first.chi_y, first.chi_z])
+        beyond = [1e5, 0.0, 0.0]
+
+        path = solver.solve_path([[500.0, 0.0, 20.0], beyond], max_iter=8, predictor=None)
+        warm = solver.solve(*beyond, max_iter=8, d0=d_prev)
+        cold = solver.solve(*beyond, max_iter=8)
+        assert not path[1].converged
+        assert path[1].n_iter == warm.n_iter + cold.n_iter
+        assert path[1].reason == warm.reason
+
+    def test_invalid_arguments(self, solver, loads):
+        with pytest.raises(ValueError):
+            solver.solve_path(loads, predictor="quadratic")
+        with pytest.raises(ValueError):
+            solver.solve_path(loads[:, :2])
+
+
+class TestSolverStateCache:
+    """Fingerprint-keyed cache of prepared solver state"""
+
+    @staticmethod
+    def _rebars(diameter=0.020):
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.12, z=0.20, diameter=diameter, n=3)
+        rebars.add_rebar(y=-0.12, z=-0.20, diameter=diameter, n=3)
+        return rebars
+
+    def test_fingerprints_follow_content(self):
+        assert (
+            RectangularSection(0.3, 0.5).fingerprint() == RectangularSection(0.3, 0.5).fingerprint()
+        )
+        assert (
+            RectangularSection(0.3, 0.5).fingerprint() != RectangularSection(0.3, 0.6).fingerprint()
+        )
+        assert self._rebars().fingerprint() == self._rebars().fingerprint()
+        assert self._rebars().fingerprint() != self._rebars(diameter=0.025).fingerprint()
+        assert ConcreteEC2(fck=30).fingerprint() == ConcreteEC2(fck=30).fingerprint()
+        assert ConcreteEC2(fck=30).fingerprint() != ConcreteEC2(fck=35).fingerprint()
+        assert SteelEC2(fyk=500).fingerprint() == SteelEC2(fyk=500).fingerprint()
+        assert (
+            SteelEC2(fyk=500).fingerprint()
+            != SteelEC2(fyk=500, include_hardening=True).fingerprint()
+        )
+
+    def test_hits_share_read_only_state(self):
+        cache = SolverStateCache(maxsize=4)
+        concrete, steel = ConcreteEC2(fck=30), SteelEC2(fyk=500)
+        first = SectionSolver(
+            RectangularSection(0.3, 0.5), concrete, steel, self._rebars(), cache=cache
+        )
+        second = SectionSolver(
+            RectangularSection(0.3, 0.5), concrete, steel, self._rebars(), cache=cache
+        )
+
+        assert cache.info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 4}
+        assert second.fibers is first.fibers
+        assert not second.fibers.flags.writeable
+        with pytest.raises(ValueError):
+            second.rebar_array[0, 0] = 1.0
+
+        # Work buffers stay per solver
+        assert first._groups[0].sigma is not second._groups[0].sigma
+        a = first.solve(N=500.0, My=20.0, Mz=10.0)
+        b = second.solve(N=500.0, My=20.0, Mz=10.0)
+        uncached = SectionSolver(RectangularSection(0.3, 0.5), concrete, steel, self._rebars())
+        c = uncached.solve(N=500.0, My=20.0, Mz=10.0)
+        assert a.epsilon_0 == b.epsilon_0 == c.epsilon_0
+        assert a.chi_y == b.chi_y == c.chi_y
+
+    def test_key_includes_mesh_parameters(self):
+        cache = SolverStateCache()
+        concrete, steel = ConcreteEC2(fck=30), SteelEC2(fyk=500)
+        section, rebars = RectangularSection(0.3, 0.5), self._rebars()
+        SectionSolver(section, concrete, steel, rebars, cache=cache)
+        SectionSolver(section, concrete, steel, rebars, fiber_area=4e-4, cache=cache)
+        SectionSolver(section, concrete, steel, rebars, mesh_method="clipped", cache=cache)
+        SectionSolver(section, concrete, steel, rebars, integration="polygon", cache=cache)
+        SectionSolver(section, ConcreteEC2(fck=40), steel, rebars, cache=cache)
+        assert cache.misses == 4
+        assert cache.hits == 1
+
+    def test_lru_eviction(self):
+        cache = SolverStateCache(maxsize=2)
+        concrete, steel = ConcreteEC2(fck=30), SteelEC2(fyk=500)
+        for height in (0.4, 0.5, 0.4, 0.6, 0.5):
+            SectionSolver(
+                RectangularSection(0.3, height), concrete, steel, self._rebars(), cache=cache
+            )
+        # 0.4 miss, 0.5 miss, 0.4 hit, 0.6 miss (evicts 0.5), 0.5 miss
+        assert cache.hits == 1
+        assert cache.misses == 4
+        assert len(cache) == 2
+
+        cache.clear()
+        assert cache.info()["size"] == 0
+        with pytest.raises(ValueError):
+            SolverStateCache(maxsize=0)
+
+    def test_validate_and_solve_reuses_setup(self):
+        default_solver_cache.clear()
+        concrete, steel = ConcreteEC2(fck=30), SteelEC2(fyk=500)
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.10, z=0.10, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.10, z=-0.10, diameter=0.020, n=3)
+        results = [
+            validate_and_solve(RectangularSection(0.3, 0.5), concrete, steel, rebars, N=N)
+            for N in (200.0, 400.0, 600.0)
+        ]
+        assert all(result.converged for result in results)
+        assert default_solver_cache.misses == 1
+        assert default_solver_cache.hits == 2
+
+    def test_frozen_section_shares_cache_entry(self):
+        cache = SolverStateCache()
+        concrete, steel = ConcreteEC2(fck=30), SteelEC2(fyk=500)
+        section = RectangularSection(0.3, 0.5)
+        mutable = SectionSolver(section, concrete, steel, self._rebars(), cache=cache)
+        frozen = SectionSolver(section.freeze(), concrete, steel, self._rebars(), cache=cache)
+
+        assert cache.info()["hits"] == 1
+        assert frozen.fibers is mutable.fibers
+        a = mutable.solve(N=500.0, My=20.0, Mz=10.0)
+        b = frozen.solve(N=500.0, My=20.0, Mz=10.0)
+        assert (a.N, a.My, a.Mz) == (b.N, b.My, b.Mz)
+
+
+class TestSolverPickling:
+    """Light serialized state for process pools"""
+
+    @staticmethod
+    def _solver(**kwargs):
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.12, z=0.20, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.12, z=-0.20, diameter=0.020, n=3)
+        return SectionSolver(
+            RectangularSection(0.3, 0.5), ConcreteEC2(fck=30), SteelEC2(fyk=500), rebars, **kwargs
+        )
+
+    @pytest.mark.parametrize("integration", ["fiber", "polygon"])
+    def test_round_trip_gives_identical_results(self, integration):
+        import pickle
+
+        solver = self._solver(integration=integration)
+        solver.solve(N=500, My=20, Mz=40)
+        clone = pickle.loads(pickle.dumps(solver))
+
+        expected = solver.solve(N=800, My=30, Mz=60)
+        result = clone.solve(N=800, My=30, Mz=60)
+        assert result.converged
+        assert result.n_iter == expected.n_iter
+        assert (result.N, result.My, result.Mz) == (expected.N, expected.My, expected.Mz)
+        assert result.sigma_c_max == expected.sigma_c_max
+
+    def test_state_omits_derived_arrays(self):
+        import pickle
+
+        solver = self._solver(fiber_area=2e-5)
+        state = solver.__getstate__()
+        assert "_groups" not in state and "prepared" not in state
+
+        # Only [y, z, A] per fiber is sent; G, H, W and the work buffers are rebuilt
+        assert len(pickle.dumps(solver)) < 2 * solver.fibers.nbytes
+        clone = pickle.loads(pickle.dumps(solver))
+        assert not clone.fibers.flags.writeable
+        G, _, W = clone.prepared.groups["concrete"]
+        assert np.array_equal(G, solver.prepared.groups["concrete"][0])
+        assert np.array_equal(W, solver.prepared.groups["concrete"][2])
+
+
+class TestWithRebars:
+    """Solver for the same section with another rebar group"""
+
+    def test_shares_concrete_and_matches_fresh_solver(self):
+        section = RectangularSection(0.3, 0.5)
+        base = SectionSolver(section, ConcreteEC2(fck=30), SteelEC2(fyk=500), RebarGroup())
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.10, z=0.20, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.10, z=-0.20, diameter=0.020, n=3)
+
+        solver = base.with_rebars(rebars)
+        fresh = SectionSolver(section, ConcreteEC2(fck=30), SteelEC2(fyk=500), rebars)
+
+        assert solver.fibers is base.fibers
+        assert solver.prepared.groups["concrete"] is base.prepared.groups["concrete"]
+        assert solver.rebars is rebars and base.rebars is not rebars
+        expected = fresh.solve(N=800, My=40, Mz=60)
+        result = solver.solve(N=800, My=40, Mz=60)
+        assert result.converged
+        assert (result.N, result.My, result.Mz) == pytest.approx(
+            (expected.N, expected.My, expected.Mz), rel=1e-12
+        )
+
+
+class TestMomentCurvature:
+    """Curvature-controlled moment-curvature analysis at constant N"""
+
+    @staticmethod
+    def _solver():
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.20, z=0.0, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.20, z=0.0, diameter=0.020, n=3)
+        return SectionSolver(
+            RectangularSection(0.5, 0.3),
+            ConcreteEC2(fck=30),
+            SteelEC2(fyk=500),
+            rebars,
+            mesh_method="clipped",
+        )
+
+    @pytest.mark.parametrize("N", [-300.0, 0.0, 500.0, 2500.0])
+    def test_ends_on_ultimate_plane(self, N):
+        from opensection.interaction import compute_capacity
+
+        solver = self._solver()
+        curve = MomentCurvatureAnalysis(solver).compute_to_failure(N, n_points=60)
+        capacity = compute_capacity(solver, N, tolerance=1e-12)
+
+        assert isinstance(curve, MomentCurvatureResult)
+        assert len(curve) == 60
+        assert curve.converged.all()
+        np.testing.assert_allclose(curve.N, N, atol=1e-6)
+        assert curve.moment[-1] == pytest.approx(capacity.Mz, rel=1e-6)
+        assert curve.epsilon_0[-1] == pytest.approx(capacity.deformation[0], rel=1e-6)
+
+    def test_matches_force_controlled_solve(self):
+        solver = self._solver()
+        curve = MomentCurvatureAnalysis(solver).compute(np.linspace(0.0, 0.01, 11), N=500.0)
+
+        for i in (2, 5, 8):
+            result = solver.solve(N=500.0, My=0.0, Mz=curve.moment[i])
+            assert result.converged
+            assert result.chi_y == pytest.approx(curve.curvature[i], rel=1e-5)
+            assert result.epsilon_0 == pytest.approx(curve.epsilon_0[i], rel=1e-5)
+
+    def test_warm_start_iterations(self):
+        curve = MomentCurvatureAnalysis(self._solver()).compute_to_failure(500.0, n_points=100)
+        assert curve.n_iter.mean() < 4
+        assert curve.n_iter.max() <= 8
+
+    def test_steps_beyond_failure_are_flagged(self):
+        analysis = MomentCurvatureAnalysis(self._solver())
+        kappa_u = analysis.ultimate_curvature(500.0)
+        curve = analysis.compute(kappa_u * np.array([0.5, 0.99, 1.5, 2.0]), N=500.0)
+
+        np.testing.assert_array_equal(curve.converged, [True, True, False, False])
+        assert curve.n_iter[2:].max() <= 3
+
+    def test_bending_direction(self):
+        curve = MomentCurvatureAnalysis(self._solver()).compute([0.005], N=500.0, angle=np.pi / 2)
+        assert curve.converged.all()
+        assert curve.moment[0] == pytest.approx(curve.My[0])
+        assert abs(curve.Mz[0]) < 1e-6 * curve.My[0]
+        np.testing.assert_allclose(curve.deformations[0, 1:], [0.0, 0.005], atol=1e-15)
+
+
+class TestMemberAnalysis:
+    """Member deflections and P-delta from cached moment-curvature tables"""
+
+    _solver = staticmethod(TestMomentCurvature._solver)
+
+    def test_constant_moment_deflections_are_exact(self):
+        solver = self._solver()
+        beam = MemberAnalysis(5.0, solver, n_stations=21)
+        kappa = beam.curvatures(np.full(21, 100.0))[0]
+
+        result = beam.deflections(100.0)
+        assert isinstance(result, MemberResult)
+        assert not result.failed
+        assert result.deflection[10] == pytest.approx(kappa * 5.0**2 / 8, rel=1e-12)
+        assert result.deflection[[0, -1]] == pytest.approx([0.0, 0.0], abs=1e-15)
+
+        cantilever = MemberAnalysis(5.0, solver, n_stations=21, support="cantilever")
+        tip = cantilever.deflections(100.0).deflection[-1]
+        assert tip == pytest.approx(-kappa * 5.0**2 / 2, rel=1e-12)
+
+    def test_uniform_load_converges_with_stations(self):
+        solver = self._solver()
+
+        def moments(x):
+            return 30.0 * x * (6.0 - x) / 2
+
+        coarse = MemberAnalysis(6.0, solver, n_stations=21).deflections(moments)
+        fine = MemberAnalysis(6.0, solver, n_stations=401).deflections(moments)
+        assert coarse.max_deflection > 0
+        assert coarse.max_deflection == pytest.approx(fine.max_deflection, rel=1e-2)
+
+    def test_table_is_symmetric_and_bounded(self):
+        table = MemberAnalysis(4.0, self._solver()).table(0, N=500.0)
+        assert isinstance(table, MomentCurvatureTable)
+        assert np.all(np.diff(table.curvature) > 0)
+        assert table.M_min == pytest.approx(-table.M_max, rel=1e-6)
+
+        kappa = table.curvature_at([0.0, 0.5 * table.M_max, 1.01 * table.M_max])
+        assert kappa[0] == pytest.approx(0.0, abs=1e-12)
+        assert kappa[1] > 0
+        assert np.isnan(kappa[2])
+
+    def test_stations_share_tables_by_content(self):
+        first, second = self._solver(), self._solver()
+        member = MemberAnalysis(6.0, [(0.0, 3.0, first), (3.0, 6.0, second)])
+        member.deflections(50.0)
+        member.deflections(80.0)
+        assert member.n_tables == 1
+        np.testing.assert_array_equal(member.station_groups, 0)
+
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.20, z=0.0, diameter=0.025, n=3)
+        rebars.add_rebar(y=-0.20, z=0.0, diameter=0.025, n=3)
+        stronger = SectionSolver(
+            RectangularSection(0.5, 0.3),
+            ConcreteEC2(fck=30),
+            SteelEC2(fyk=500),
+            rebars,
+            mesh_method="clipped",
+        )
+        member = MemberAnalysis(6.0, [(0.0, 2.0, first), (2.0, 4.0, stronger), (4.0, 6.0, second)])
+        member.deflections(50.0)
+        assert member.n_tables == 2
+        assert set(member.station_groups) == {0, 1}
+
+    def test_second_order_uses_tables_only(self):
+        solver = self._solver()
+        column = MemberAnalysis(6.0, solver, support="cantilever")
+        first = column.deflections(lambda x: 20.0 * (6.0 - x), N=800.0)
+
+        calls = []
+        original = solver.compute_internal_forces
+        solver.compute_internal_forces = lambda *args: calls.append(1) or original(*args)
+        result = column.second_order(lambda x: 20.0 * (6.0 - x), N=800.0, imperfection=0.01)
+
+        assert calls == []
+        assert result.converged and not result.failed
+        assert result.n_iter > 1
+        # Moment de base amplifié : M0 + N·(w(0) - w(L) + imperfection en tête)
+        expected = 120.0 + 800.0 * (-result.deflection[-1] + 0.01)
+        assert result.moment[0] == pytest.approx(expected, rel=1e-4)
+        assert abs(result.max_deflection) > abs(first.max_deflection)
+
+    def test_second_order_failure_beyond_capacity(self):
+        column = MemberAnalysis(12.0, self._solver(), support="cantilever")
+        result = column.second_order(lambda x: 20.0 * (12.0 - x), N=2500.0, imperfection=0.03)
+        assert result.failed
+        assert not result.converged
+
+    def test_invalid_arguments(self):
+        solver = self._solver()
+        with pytest.raises(ValueError):
+            MemberAnalysis(5.0, solver, support="fixed")
+        with pytest.raises(ValueError):
+            MemberAnalysis(5.0, [(0.0, 2.0, solver)])
+
+
+class TestPrestressedSection:
+    """Prestressing and structural steel laws in the solver, per-tendon prestrain"""
+
+    @staticmethod
+    def _tendons(z=0.0, prestrain=0.0045):
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.0, z=z, diameter=0.015, n=4, prestrain=prestrain)
+        return rebars
+
+    def test_concentric_prestress_equilibrium(self):
+        concrete = ConcreteEC2(fck=35)
+        steel = PrestressingSteelEC2(fp01k=1500)
+        rebars = self._tendons()
+        solver = SectionSolver(
+            RectangularSection(0.2, 0.4), concrete, steel, rebars, mesh_method="clipped"
+        )
+
+        result = solver.solve(N=0.0, My=0.0, Mz=0.0)
+        assert result.converged
+        assert result.epsilon_0 > 0
+        assert result.chi_y == pytest.approx(0.0, abs=1e-12)
+
+        # Compression du béton = traction des torons (déformation ε_p0 - e0)
+        compression = 0.08 * concrete.stress(result.epsilon_0)
+        tension = rebars.total_area * steel.stress(0.0045 - result.epsilon_0)
+        assert compression == pytest.approx(tension, rel=1e-6)
+        assert result.sigma_s_max == pytest.approx(steel.stress(0.0045 - result.epsilon_0))
+
+    def test_eccentric_prestress_cambers_section(self):
+        section = RectangularSection(0.2, 0.4)
+        concrete, steel = ConcreteEC2(fck=35), PrestressingSteelEC2(fp01k=1500)
+        prestressed = SectionSolver(section, concrete, steel, self._tendons(z=-0.07))
+        result = prestressed.solve(N=0.0, My=0.0, Mz=0.0)
+        assert result.converged
+        # Torons sous le centre de gravité : fibre inférieure la plus comprimée
+        assert result.chi_z < 0
+
+        plain = SectionSolver(section, concrete, steel, self._tendons(z=-0.07, prestrain=0.0))
+        F, _ = plain.compute_internal_forces(np.zeros(3))
+        np.testing.assert_array_equal(F, 0.0)
+
+    @pytest.mark.parametrize("prestrain", [0.0, 0.005])
+    def test_batch_matches_single_evaluation(self, prestrain):
+        solver = SectionSolver(
+            RectangularSection(0.2, 0.4),
+            ConcreteEC2(fck=35),
+            PrestressingSteelEC2(fp01k=1500),
+            self._tendons(z=-0.07, prestrain=prestrain),
+        )
+        D = np.array([[0.0, 0.0, 0.0], [5e-4, 1e-3, -4e-3], [-1e-3, 0.0, 8e-3]])
+        F_batch, K_batch = solver.compute_internal_forces_batch(D)
+        for d, F_ref, K_ref in zip(D, F_batch, K_batch):
+            F, K = solver.compute_internal_forces(d)
+            np.testing.assert_allclose(F, F_ref, rtol=1e-12, atol=1e-9)
+            np.testing.assert_allclose(K, K_ref, rtol=1e-12, atol=1e-9)
+
+    def test_structural_steel_matches_equivalent_rebar_steel(self):
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.20, z=0.0, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.20, z=0.0, diameter=0.020, n=3)
+        section, concrete = RectangularSection(0.5, 0.3), ConcreteEC2(fck=30)
+
+        structural = SectionSolver(
+            section, concrete, StructuralSteelEC3(fy=500, gamma_M0=1.15, Ea=200000), rebars
+        )
+        reinforcing = SectionSolver(section, concrete, SteelEC2(fyk=500), rebars)
+        result = structural.solve(N=800.0, My=0.0, Mz=150.0)
+        reference = reinforcing.solve(N=800.0, My=0.0, Mz=150.0)
+
+        assert result.converged
+        assert result.epsilon_0 == pytest.approx(reference.epsilon_0, rel=1e-9)
+        assert result.chi_y == pytest.approx(reference.chi_y, rel=1e-9)
+
+
+class TestMultiMaterialSection:
+    """Per-contour concrete zones and per-rebar steel, evaluated on sorted slices"""
+
+    @staticmethod
+    def _composite():
+        web = Contour.rectangle(0.2, 0.5, 0.0, -0.25)
+        topping = Contour.rectangle(0.8, 0.1, 0.0, 0.05)
+        return Section([web, topping]), topping
+
+    def test_per_contour_concrete(self):
+        section, topping = self._composite()
+        precast, cast_in_place = ConcreteEC2(fck=50), ConcreteEC2(fck=25)
+        solver = SectionSolver(
+            section,
+            precast,
+            SteelEC2(fyk=500),
+            RebarGroup(),
+            mesh_method="clipped",
+            concrete_zones=[(topping, cast_in_place)],
+        )
+
+        # Compression uniforme sur le palier : N = Σ fcd·A par contour
+        F, _ = solver.compute_internal_forces(np.array([0.0025, 0.0, 0.0]))
+        expected = 1000.0 * (precast.fcd * 0.1 + cast_in_place.fcd * 0.08)
+        assert F[0] == pytest.approx(expected, rel=1e-9)
+
+        result = solver.solve(N=1500.0, My=0.0, Mz=0.0)
+        assert result.converged
+        assert result.sigma_c_max <= precast.fcd
+
+    def test_confined_core_zone(self):
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.20, z=0.0, diameter=0.020, n=3)
+        rebars.add_rebar(y=-0.20, z=0.0, diameter=0.020, n=3)
+        cover, core = ConcreteEC2(fck=30), ConcreteEC2(fck=40)
+        core_contour = Contour.rectangle(0.4, 0.2)
+        solver = SectionSolver(
+            RectangularSection(0.5, 0.3),
+            cover,
+            SteelEC2(fyk=500),
+            rebars,
+            concrete_zones=[(core_contour, core)],
+        )
+
+        fibers = solver.fibers
+        in_core = core_contour.contains_points(fibers[:, 0], fibers[:, 1])
+        A_core = fibers[in_core, 2].sum()
+        F, _ = solver.compute_internal_forces(np.array([0.002, 0.0, 0.0]))
+        expected = 1000.0 * (
+            cover.fcd * (fibers[:, 2].sum() - A_core)
+            + core.fcd * A_core
+            + rebars.total_area * 400.0
+        )
+        assert F[0] == pytest.approx(expected, rel=1e-9)
+
+    def test_mixed_rebar_materials_superpose(self):
+        section, concrete = RectangularSection(0.3, 0.5), ConcreteEC2(fck=40)
+        passive, strand = SteelEC2(fyk=500), PrestressingSteelEC2(fp01k=1500)
+
+        mixed = RebarGroup()
+        mixed.add_rebar(y=0.0, z=0.20, diameter=0.016, n=2)
+        mixed.add_rebar(y=0.0, z=-0.18, diameter=0.015, n=3, prestrain=0.005, material=strand)
+        mixed.add_rebar(y=0.0, z=-0.22, diameter=0.020, n=3)
+
+        bars = RebarGroup()
+        bars.add_rebar(y=0.0, z=0.20, diameter=0.016, n=2)
+        bars.add_rebar(y=0.0, z=-0.22, diameter=0.020, n=3)
+        tendons = RebarGroup()
+        tendons.add_rebar(y=0.0, z=-0.18, diameter=0.015, n=3, prestrain=0.005)
+
+        solver = SectionSolver(section, concrete, passive, mixed)
+        with_bars = SectionSolver(section, concrete, passive, bars)
+        with_tendons = SectionSolver(section, concrete, strand, tendons)
+        concrete_only = SectionSolver(section, concrete, passive, RebarGroup())
+
+        for d in ([0.0, 0.0, 0.0], [4e-4, 0.0, 6e-3], [-5e-4, 1e-3, -8e-3]):
+            d = np.array(d)
+            F, K = solver.compute_internal_forces(d)
+            F_c, K_c = concrete_only.compute_internal_forces(d)
+            F_b, K_b = with_bars.compute_internal_forces(d)
+            F_t, K_t = with_tendons.compute_internal_forces(d)
+            np.testing.assert_allclose(F, F_b + F_t - F_c, rtol=1e-10, atol=1e-8)
+            np.testing.assert_allclose(K, K_b + K_t - K_c, rtol=1e-10, atol=1e-6)
+
+        D = np.array([[4e-4, 0.0, 6e-3], [-5e-4, 1e-3, -8e-3]])
+        F_batch, K_batch = solver.compute_internal_forces_batch(D)
+        for d, F_ref, K_ref in zip(D, F_batch, K_batch):
+            F, K = solver.compute_internal_forces(d)
+            np.testing.assert_allclose(F, F_ref, rtol=1e-12, atol=1e-9)
+            np.testing.assert_allclose(K, K_ref, rtol=1e-12, atol=1e-6)
+
+    def test_zones_require_fiber_integration(self):
+        section, topping = self._composite()
+        with pytest.raises(ValueError):
+            SectionSolver(
+                section,
+                ConcreteEC2(fck=50),
+                SteelEC2(fyk=500),
+                RebarGroup(),
+                integration="polygon",
+                concrete_zones=[(topping, ConcreteEC2(fck=25))],
+            )
+
+    def test_ultimate_limits_follow_zone_concrete(self):
+        """High-strength web (smaller εcu2): planes and M-κ bounds respect each concrete"""
+        from opensection.interaction import StrainDomainGenerator
+
+        section, topping = self._composite()
+        web = section.contours[0]
+        cast_in_place, precast = ConcreteEC2(fck=30), ConcreteEC2(fck=70)
+        rebars = RebarGroup()
+        rebars.add_rebar(y=0.0, z=0.05, diameter=0.012, n=4)
+        solver = SectionSolver(
+            section,
+            cast_in_place,
+            SteelEC2(fyk=500),
+            rebars,
+            mesh_method="clipped",
+            concrete_zones=[(web, precast)],
+        )
+        limits = solver.strain_limits()
+        points = limits.concrete_points + np.array([solver.yc, solver.zc])
+        in_web = points[:, 1] < -1e-9
+        assert np.all(limits.epsilon_cu2[in_web] == precast.epsilon_cu2)
+        assert np.all(limits.epsilon_cu2[points[:, 1] > 1e-9] == cast_in_place.epsilon_cu2)
+
+        # Bottom of the web compressed: pivot B on the web's own εcu2
+        t = np.linspace(0.0, 3.0, 121)
+        D = StrainDomainGenerator(solver).deformations(t, angle=-np.pi / 2)
+        eps_bottom = D[:, 0] + D[:, 2] * (-0.5 - solver.zc)
+        assert np.all(eps_bottom <= precast.epsilon_cu2)
+        pivot_b = (t >= 1.0) & (t <= 2.0)
+        np.testing.assert_allclose(eps_bottom[pivot_b], precast.epsilon_cu2, rtol=1e-8)
+
+        # Top compressed: the web edge under the topping may govern before the topping
+        D = StrainDomainGenerator(solver).deformations(t, angle=np.pi / 2)
+        eps_top = D[:, 0] + D[:, 2] * (0.1 - solver.zc)
+        eps_web_top = D[:, 0] + D[:, 2] * (0.0 - solver.zc)
+        assert np.all(eps_top <= cast_in_place.epsilon_cu2)
+        assert np.all(eps_web_top <= precast.epsilon_cu2)
+
+        lower, upper = MomentCurvatureAnalysis(solver)._admissible_range(np.array([0.0, -0.01]))
+        assert upper + (-0.01) * (-0.5 - solver.zc) == pytest.approx(precast.epsilon_cu2)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
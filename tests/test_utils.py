@@ -15,6 +15,7 @@ from opensection.utils import (
     Stress,
     UnitConverter,
     clamp,
+    find_root_bracketed,
     is_converged,
     normalize_vector,
     safe_divide,
@@ -143,6 +144,24 @@ class TestMathHelpers:
         clamped = clamp(values, 0, 10)
         assert np.allclose(clamped, [0, 0, 5, 10, 10])
 
+    def test_find_root_bracketed(self):
+        """Test Brent root finding"""
+        root, value, n_eval, converged = find_root_bracketed(lambda x: np.cos(x) - x, 0.0, 1.0)
+        assert converged
+        assert abs(root - 0.7390851332151607) < 1e-12
+        assert n_eval < 15
+
+    def test_find_root_bracketed_discontinuous(self):
+        """Test that the bracket is kept for a step function"""
+        root, _, _, converged = find_root_bracketed(lambda x: 1.0 if x > 0.7 else -1.0, 0.0, 1.0)
+        assert converged
+        assert abs(root - 0.7) < 1e-11
+
+    def test_find_root_not_bracketed(self):
+        """Test error when the signs do not change"""
+        with pytest.raises(ValueError):
+            find_root_bracketed(lambda x: x**2 + 1.0, -1.0, 1.0)
+
 
 class TestConstants:
     """Test constants"""